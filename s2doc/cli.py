@@ -5,17 +5,30 @@ import os
 import sys
 import yaml
 from pathlib import Path
+from typing import Optional
 
 from .detector import detect_schema_type, get_schema_description, get_error_message, SchemaType
 from .converters.domain_stories import DomainStoryConverter
 from .converters.strategic import StrategicDDDConverter
-from .converters.tactical import TacticalDDDConverter
+from .converters.strategic.converter import DEFAULT_DIAGRAM_NODE_BUDGET
+from .converters.tactical import convert_bounded_contexts, split_bounded_contexts
 from .converters.data_eng import DataEngConverter
+from .converters.data_eng.converter import DEFAULT_SCHEMA_FIELD_BUDGET
+from .converters.data_eng.lineage import FieldLineage, FieldRef, LineageGraph
+from .utils.cache import BuildCache
+from .references import check_references
+from .validator import get_validator
+from .workspace import Workspace, load_yaml_document
 from .__version__ import __version__
 
 
 def main():
     """Main entry point for s2doc CLI"""
+    # Subcommands take precedence unless a file with that name exists
+    if len(sys.argv) > 1 and sys.argv[1] in SUBCOMMANDS and not os.path.exists(sys.argv[1]):
+        SUBCOMMANDS[sys.argv[1]](sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
         prog='s2doc',
         description='Convert YAML domain models to Markdown documentation',
@@ -25,6 +38,11 @@ Examples:
   s2doc payment-workflow.yaml
   s2doc payments-strategic.yaml -o docs/
   s2doc payments-tactical.yaml -o output/ -v
+  s2doc payments-strategic.yaml -o docs/ --split -j 4
+  s2doc payments-tactical.yaml -o docs/ --strict
+  s2doc workspace payments-strategic.yaml tactical/ -o docs/
+  s2doc validate payments-strategic.yaml payments-tactical.yaml
+  s2doc lineage data-eng.yaml ds-user-events-raw --downstream
 
 Supported schemas:
   - Domain Stories (narrative scenarios with actors and activities)
@@ -47,6 +65,50 @@ For more information: https://github.com/FreeSideNomad/s2doc
         action='store_true',
         help='Enable verbose output'
     )
+    parser.add_argument(
+        '--split',
+        action='store_true',
+        help='Strategic DDD and Data Engineering: write an overview plus one file per domain'
+    )
+    parser.add_argument(
+        '-j', '--workers',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Worker processes for split and multi-context output (default: one per CPU)'
+    )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Keep a build cache (.s2doc-cache.json) in the output directory and only '
+             're-render what changed since the last run'
+    )
+    parser.add_argument(
+        '--diagram-node-budget',
+        type=int,
+        default=DEFAULT_DIAGRAM_NODE_BUDGET,
+        metavar='N',
+        help='Split strategic architecture and data lineage diagrams above N nodes '
+             f'(default: {DEFAULT_DIAGRAM_NODE_BUDGET})'
+    )
+    parser.add_argument(
+        '--schema-field-budget',
+        type=int,
+        default=DEFAULT_SCHEMA_FIELD_BUDGET,
+        metavar='N',
+        help='Data Engineering: summarize dataset schemas above N fields and collapse the full table '
+             f'(default: {DEFAULT_SCHEMA_FIELD_BUDGET})'
+    )
+    parser.add_argument(
+        '--schema-files',
+        action='store_true',
+        help='Data Engineering: write full tables of wide schemas to schemas/<dataset>.md'
+    )
+    parser.add_argument(
+        '--strict',
+        action='store_true',
+        help='Check that every referenced ID is defined before converting'
+    )
     parser.add_argument(
         '--version',
         action='version',
@@ -75,6 +137,8 @@ For more information: https://github.com/FreeSideNomad/s2doc
             data = docs[-1] if docs else None
             if data is None:
                 raise ValueError("Empty YAML file")
+            # ...unless the stream holds several tactical contexts, one per document
+            data = _merge_tactical_documents(docs) or data
     except yaml.YAMLError as e:
         print(f"Error: Failed to parse YAML file '{args.input}'", file=sys.stderr)
         print(f"  {e}", file=sys.stderr)
@@ -94,16 +158,31 @@ For more information: https://github.com/FreeSideNomad/s2doc
     if args.verbose:
         print(f"Detected schema: {get_schema_description(schema_type)}")
 
+    if args.strict:
+        broken = check_references(data, schema_type)
+        if broken:
+            print(f"Error: {len(broken)} broken reference(s) in '{args.input}'", file=sys.stderr)
+            for reference in broken:
+                print(f"  {reference}", file=sys.stderr)
+            sys.exit(1)
+
     # Convert based on schema type
     try:
         if schema_type == SchemaType.DOMAIN_STORIES:
             convert_domain_stories(data, args.input, args.output, args.verbose)
         elif schema_type == SchemaType.STRATEGIC_DDD:
-            convert_strategic_ddd(data, args.input, args.output, args.verbose)
+            convert_strategic_ddd(data, args.input, args.output, args.verbose,
+                                  split=args.split, workers=args.workers, use_cache=args.cache,
+                                  diagram_node_budget=args.diagram_node_budget)
         elif schema_type == SchemaType.TACTICAL_DDD:
-            convert_tactical_ddd(data, args.input, args.output, args.verbose)
+            convert_tactical_ddd(data, args.input, args.output, args.verbose, workers=args.workers,
+                                 use_cache=args.cache)
         elif schema_type == SchemaType.DATA_ENGINEERING:
-            convert_data_engineering(data, args.input, args.output, args.verbose)
+            convert_data_engineering(data, args.input, args.output, args.verbose,
+                                     split=args.split, workers=args.workers,
+                                     diagram_node_budget=args.diagram_node_budget,
+                                     schema_field_budget=args.schema_field_budget,
+                                     schema_files=args.schema_files, use_cache=args.cache)
     except Exception as e:
         print(f"Error: Conversion failed: {e}", file=sys.stderr)
         if args.verbose:
@@ -127,9 +206,30 @@ def convert_domain_stories(data: dict, input_file: str, output_dir: str, verbose
     print(f"✓ Generated {output_file}")
 
 
-def convert_strategic_ddd(data: dict, input_file: str, output_dir: str, verbose: bool):
+def convert_strategic_ddd(data: dict, input_file: str, output_dir: str, verbose: bool,
+                          split: bool = False, workers: Optional[int] = None, use_cache: bool = False,
+                          diagram_node_budget: int = DEFAULT_DIAGRAM_NODE_BUDGET):
     """Convert strategic DDD YAML to markdown"""
-    converter = StrategicDDDConverter(data)
+    converter = StrategicDDDConverter(data, diagram_node_budget=diagram_node_budget)
+
+    if verbose and converter.is_architecture_paginated():
+        print(f"Architecture diagram has {converter.architecture_node_count()} nodes, "
+              "splitting into domain overview and drill-downs")
+
+    if split:
+        cache = BuildCache.for_output_dir(output_dir) if use_cache else None
+        overview_name = f"{Path(input_file).stem}.md"
+        written = converter.convert_to_files(output_dir, overview_name, workers=workers, cache=cache)
+        if cache is not None:
+            cache.save()
+
+        if verbose:
+            skipped = len(data.get('system', {}).get('domains', [])) + 1 - len(written)
+            print(f"Skipped {skipped} unchanged domain file(s)")
+        for path in written:
+            print(f"✓ Generated {path}")
+        return
+
     markdown = converter.convert_to_markdown()
 
     # Generate output filename from input filename
@@ -142,27 +242,50 @@ def convert_strategic_ddd(data: dict, input_file: str, output_dir: str, verbose:
     print(f"✓ Generated {output_file}")
 
 
-def convert_tactical_ddd(data: dict, input_file: str, output_dir: str, verbose: bool):
+def convert_tactical_ddd(data: dict, input_file: str, output_dir: str, verbose: bool,
+                         workers: Optional[int] = None, use_cache: bool = False):
     """Convert tactical DDD YAML to markdown (one file per bounded context)"""
-    converter = TacticalDDDConverter(data)
-    markdown = converter.convert_to_markdown()
+    if verbose:
+        for document in split_bounded_contexts(data):
+            print(f"Processing bounded context: {document['bounded_context']['id']}")
 
-    # Generate output filename from bounded context ID
-    bc_id = data['bounded_context']['id']
-    output_file = os.path.join(output_dir, f"{bc_id}.md")
+    cache = BuildCache.for_output_dir(output_dir) if use_cache else None
+    results = convert_bounded_contexts(data, workers, cache=cache)
+    if cache is not None:
+        cache.save()
 
-    if verbose:
-        print(f"Processing bounded context: {bc_id}")
+    for bc_id, markdown in results:
+        # Generate output filename from bounded context ID
+        output_file = os.path.join(output_dir, f"{bc_id}.md")
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(markdown)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(markdown)
 
-    print(f"✓ Generated {output_file}")
+        print(f"✓ Generated {output_file}")
+
+
+def _merge_tactical_documents(docs: list) -> Optional[dict]:
+    """Combine a multi-document stream of tactical contexts into one bounded_contexts model"""
+    tactical = [d for d in docs if detect_schema_type(d) == SchemaType.TACTICAL_DDD]
+    if len(tactical) < 2:
+        return None
 
+    contexts = []
+    for document in tactical:
+        contexts.extend(d['bounded_context'] for d in split_bounded_contexts(document))
+    return {'bounded_contexts': contexts}
 
-def convert_data_engineering(data: dict, input_file: str, output_dir: str, verbose: bool):
+
+def convert_data_engineering(data: dict, input_file: str, output_dir: str, verbose: bool,
+                             split: bool = False, workers: Optional[int] = None,
+                             diagram_node_budget: int = DEFAULT_DIAGRAM_NODE_BUDGET,
+                             schema_field_budget: int = DEFAULT_SCHEMA_FIELD_BUDGET,
+                             schema_files: bool = False, use_cache: bool = False):
     """Convert data engineering YAML to markdown"""
-    converter = DataEngConverter(data)
+    cache = BuildCache.for_output_dir(output_dir) if use_cache else None
+    converter = DataEngConverter(data, diagram_node_budget=diagram_node_budget,
+                                 schema_field_budget=schema_field_budget, schema_files=schema_files,
+                                 cache=cache)
 
     # Generate output filename from input filename
     input_path = Path(input_file)
@@ -172,9 +295,245 @@ def convert_data_engineering(data: dict, input_file: str, output_dir: str, verbo
         system_name = data.get('system', {}).get('name', 'Unknown System')
         print(f"Processing system: {system_name}")
 
-    converter.convert_to_markdown(output_file)
+    if split:
+        written = converter.convert_to_files(output_dir, f"{input_path.stem}.md", workers=workers)
+    else:
+        written = converter.convert_to_markdown(output_file)
 
-    print(f"✓ Generated {output_file}")
+    if cache is not None:
+        cache.save()
+
+    for path in written:
+        print(f"✓ Generated {path}")
+
+
+def workspace_main(argv):
+    """Convert a strategic model together with a directory of tactical files"""
+    parser = argparse.ArgumentParser(
+        prog='s2doc workspace',
+        description='Convert a Strategic DDD model and the Tactical DDD files of its '
+                    'bounded contexts with links between the documents'
+    )
+    parser.add_argument('strategic', help='Strategic DDD YAML file')
+    parser.add_argument('tactical_dir', help='Directory containing Tactical DDD YAML files')
+    parser.add_argument(
+        '-o', '--output',
+        help='Output directory (default: current directory)',
+        default='.'
+    )
+    parser.add_argument(
+        '-j', '--workers',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Worker processes (default: one per CPU)'
+    )
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Enable verbose output'
+    )
+    args = parser.parse_args(argv)
+
+    for path in (args.strategic, args.tactical_dir):
+        if not os.path.exists(path):
+            print(f"Error: '{path}' not found", file=sys.stderr)
+            sys.exit(4)
+
+    try:
+        os.makedirs(args.output, exist_ok=True)
+    except Exception as e:
+        print(f"Error: Could not create output directory '{args.output}': {e}", file=sys.stderr)
+        sys.exit(4)
+
+    try:
+        workspace = Workspace.load(args.strategic, args.tactical_dir, workers=args.workers)
+    except yaml.YAMLError as e:
+        print(f"Error: Failed to parse YAML: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    if args.verbose:
+        print(f"Loaded {len(workspace.tactical_docs)} tactical bounded context(s)")
+        for path in workspace.skipped:
+            print(f"Skipped {path} (not a Tactical DDD file)")
+        for context_id in workspace.unplaced_contexts:
+            print(f"Warning: '{context_id}' is not declared in the strategic model")
+        for context_id in workspace.undesigned_contexts:
+            print(f"Note: '{context_id}' has no tactical file")
+
+    try:
+        written = workspace.convert(args.output, workers=args.workers)
+    except Exception as e:
+        print(f"Error: Conversion failed: {e}", file=sys.stderr)
+        if args.verbose:
+            import traceback
+            traceback.print_exc()
+        sys.exit(3)
+
+    for path in written:
+        print(f"✓ Generated {path}")
+
+
+def validate_main(argv):
+    """Validate model files against the s2doc JSON schemas"""
+    parser = argparse.ArgumentParser(
+        prog='s2doc validate',
+        description='Validate YAML models against their JSON schema'
+    )
+    parser.add_argument('inputs', nargs='+', metavar='input', help='YAML model file(s)')
+    parser.add_argument(
+        '--schemas-dir',
+        default=None,
+        help='Directory containing the *.schema.yaml files (default: bundled schemas)'
+    )
+    parser.add_argument(
+        '-q', '--quiet',
+        action='store_true',
+        help='Only report errors'
+    )
+    args = parser.parse_args(argv)
+
+    exit_code = 0
+    for input_file in args.inputs:
+        try:
+            with open(input_file, 'r', encoding='utf-8') as f:
+                docs = [d for d in yaml.safe_load_all(f) if d is not None]
+        except yaml.YAMLError as e:
+            print(f"{input_file}: Error: Failed to parse YAML: {e}", file=sys.stderr)
+            exit_code = max(exit_code, 1)
+            continue
+        except OSError as e:
+            print(f"{input_file}: Error: {e}", file=sys.stderr)
+            exit_code = 4
+            continue
+
+        # Every recognised document is validated (frontmatter is skipped)
+        typed = [(d, detect_schema_type(d)) for d in docs]
+        targets = [(d, t) for d, t in typed if t != SchemaType.UNKNOWN]
+        if not targets:
+            print(f"{input_file}: Error: Unable to detect schema type", file=sys.stderr)
+            exit_code = max(exit_code, 2)
+            continue
+
+        errors = []
+        for document, schema_type in targets:
+            try:
+                validator = get_validator(schema_type, args.schemas_dir)
+            except (ValueError, OSError) as e:
+                print(f"{input_file}: Error: {e}", file=sys.stderr)
+                exit_code = 4
+                break
+            errors.extend(validator.validate(document))
+            errors.extend(check_references(document, schema_type))
+        else:
+            if errors:
+                for error in errors:
+                    print(f"{input_file}: {error}", file=sys.stderr)
+                exit_code = max(exit_code, 1)
+            elif not args.quiet:
+                print(f"✓ {input_file} is valid ({get_schema_description(targets[0][1])})")
+
+    sys.exit(exit_code)
+
+
+def lineage_main(argv):
+    """Query transitive dataset lineage of a Data Engineering model"""
+    parser = argparse.ArgumentParser(
+        prog='s2doc lineage',
+        description='List every dataset upstream or downstream of a dataset'
+    )
+    parser.add_argument('input', help='Data Engineering YAML file')
+    parser.add_argument('dataset', help='Dataset ID')
+    direction = parser.add_mutually_exclusive_group()
+    direction.add_argument(
+        '--downstream',
+        dest='upstream',
+        action='store_false',
+        help='Datasets derived from the dataset (default)'
+    )
+    direction.add_argument(
+        '--upstream',
+        dest='upstream',
+        action='store_true',
+        help='Datasets the dataset is derived from'
+    )
+    parser.add_argument(
+        '--field',
+        metavar='NAME',
+        help='Follow field lineage of this field of the dataset instead of dataset lineage'
+    )
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Show lineage level and name of each dataset'
+    )
+    parser.set_defaults(upstream=False)
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.input):
+        print(f"Error: Input file '{args.input}' not found", file=sys.stderr)
+        sys.exit(4)
+
+    try:
+        data = load_yaml_document(args.input)
+    except yaml.YAMLError as e:
+        print(f"Error: Failed to parse YAML file '{args.input}'", file=sys.stderr)
+        print(f"  {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if data is None or detect_schema_type(data) != SchemaType.DATA_ENGINEERING:
+        print(f"Error: '{args.input}' is not a Data Engineering model", file=sys.stderr)
+        sys.exit(2)
+
+    if args.field:
+        field_lineage_main(args, data)
+        return
+
+    graph = LineageGraph.from_lineage(data.get('lineage') or [])
+    if args.dataset not in graph:
+        print(f"Error: Dataset '{args.dataset}' does not appear in the lineage of '{args.input}'",
+              file=sys.stderr)
+        sys.exit(1)
+
+    related = graph.upstream_of(args.dataset) if args.upstream else graph.downstream_of(args.dataset)
+
+    if args.verbose:
+        names = {ds.get('id'): ds.get('name', '') for ds in data.get('datasets') or []}
+        for ds_id in related:
+            print(f"{graph.level(ds_id)}\t{ds_id}\t{names.get(ds_id, '')}")
+    else:
+        for ds_id in related:
+            print(ds_id)
+
+
+def field_lineage_main(args, data):
+    """Query transitive field lineage (the field_lineage extension)"""
+    field_lineage = FieldLineage(data.get('field_lineage') or [])
+    ref = FieldRef(args.dataset, args.field)
+    if ref not in field_lineage:
+        print(f"Error: Field '{ref}' does not appear in the field lineage of '{args.input}'",
+              file=sys.stderr)
+        sys.exit(1)
+
+    related = field_lineage.provenance(ref) if args.upstream else field_lineage.impact(ref)
+
+    if args.verbose:
+        names = {ds.get('id'): ds.get('name', '') for ds in data.get('datasets') or []}
+        for field_ref in related:
+            print(f"{field_lineage.graph.level(field_ref)}\t{field_ref}\t{names.get(field_ref.dataset, '')}")
+    else:
+        for field_ref in related:
+            print(field_ref)
+
+
+SUBCOMMANDS = {
+    'workspace': workspace_main,
+    'validate': validate_main,
+    'lineage': lineage_main,
+}
 
 
 if __name__ == '__main__':
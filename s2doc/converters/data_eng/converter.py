@@ -1,15 +1,63 @@
 """Convert data engineering YAML to Markdown documentation."""
 
-from typing import Dict, List, Any, Optional
-from .diagram_generator import DiagramGenerator
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Set, Tuple
+from ...utils.cache import BuildCache
+from ...utils.links import rewrite_anchor_links
+from ...utils.parallel import parallel_map
+from ...utils.text import humanize_identifier
+from .diagram_generator import PIPELINE_FLOW_NAMESPACE, DiagramGenerator
+from .lineage import FieldLineage, FieldRef, LineageGraph, LineagePartition, partition_lineage
+from .models import DatasetIndex, DatasetOperations, OperationsIndex, StageRef
+from .stages import StageGraph
+
+DEFAULT_LINEAGE_NODE_BUDGET = 150
+DEFAULT_SCHEMA_FIELD_BUDGET = 50
+
+# Fields per collapsible block of a wide schema
+SCHEMA_PAGE_SIZE = 200
+
+# Directory (inside the output directory) for schema files of wide datasets
+SCHEMA_DIR = "schemas"
+
+_SCHEMA_TABLE_HEADER = [
+    "| Field | Type | Nullable | PII | Description |",
+    "|-------|------|----------|-----|-------------|"
+]
+
+# Schema tables of datasets with derived fields (field_lineage) get a provenance column
+_PROVENANCE_TABLE_HEADER = [
+    "| Field | Type | Nullable | PII | Description | Derived From |",
+    "|-------|------|----------|-----|-------------|--------------|"
+]
+
+# Origin fields listed per derived field before the rest are counted
+_ORIGIN_LIMIT = 10
 
 
 class DataEngConverter:
     """Convert data engineering YAML to Markdown documentation."""
 
-    def __init__(self, data: dict):
-        """Initialize with parsed YAML data."""
+    def __init__(self, data: dict, diagram_node_budget: int = DEFAULT_LINEAGE_NODE_BUDGET,
+                 schema_field_budget: int = DEFAULT_SCHEMA_FIELD_BUDGET, schema_files: bool = False,
+                 cache: Optional[BuildCache] = None):
+        """
+        Initialize with parsed YAML data.
+
+        Args:
+            data: Parsed data engineering model
+            diagram_node_budget: Lineage graphs with more datasets than this are
+                drawn as several partitioned diagrams
+            schema_field_budget: Schemas with more fields than this are summarized,
+                with the full table collapsed
+            schema_files: Put the full table of wide schemas in schemas/<dataset>.md
+                instead of collapsible blocks
+            cache: Build cache for pipeline flow diagrams
+        """
         self.data = data
+        self.diagram_node_budget = diagram_node_budget
+        self.schema_field_budget = schema_field_budget
+        self.schema_files = schema_files
         self.system = data.get('system', {})
         self.domains = {d['id']: d for d in data.get('domains', [])}
         self.pipelines = {p['id']: p for p in data.get('pipelines', [])}
@@ -19,10 +67,17 @@ class DataEngConverter:
         self.lineage = data.get('lineage', [])
         self.governance = data.get('governance', {})
         self.observability = data.get('observability', {})
-        self.diagram_gen = DiagramGenerator()
-
-    def convert_to_markdown(self, output_path: str) -> None:
-        """Generate markdown file."""
+        self.dataset_index = DatasetIndex(self.domains, self.pipelines)
+        self.lineage_graph = LineageGraph.from_lineage(self.lineage)
+        self.field_lineage = FieldLineage(data.get('field_lineage', []))
+        self.stage_graphs = {pip_id: StageGraph(p.get('stages', [])) for pip_id, p in self.pipelines.items()}
+        self.operations_index = OperationsIndex(self.contracts, self.checks,
+                                                self.governance, self.observability)
+        self.diagram_gen = DiagramGenerator(cache)
+        self._datasets_by_owner: Optional[Dict[Optional[str], List[str]]] = None
+
+    def convert_to_markdown(self, output_path: str) -> List[Path]:
+        """Generate markdown file (plus schema files of wide datasets in schema-file mode)."""
         sections = [
             self._generate_header(),
             self._generate_toc(),
@@ -53,6 +108,162 @@ class DataEngConverter:
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(markdown)
 
+        written = [Path(output_path)]
+        if self.schema_files:
+            output_path = Path(output_path)
+            page_of = {ds_id: output_path.name for ds_id in self.datasets}
+            written.extend(self.write_schema_files(output_path.parent, page_of))
+        return written
+
+    def convert_to_files(self, output_dir: str, overview_name: str,
+                         workers: Optional[int] = None) -> List[Path]:
+        """
+        Generate split documentation: an overview page plus one file per domain.
+
+        Each domain file holds the domain's pipelines and stages, the datasets it
+        owns (see DatasetIndex.owning_domain) and their contracts and checks. The
+        overview keeps the system-wide sections, with summary tables only, and
+        details of datasets no domain owns. Links are pointed at the right file
+        using one global anchor map.
+
+        Domain files are rendered in a worker pool; each worker receives this
+        converter, indexes and build cache included, once. Workers report the
+        pipeline flow diagrams they used, which are stored in the cache here.
+
+        Args:
+            output_dir: Directory to write into
+            overview_name: File name of the overview page (e.g. "platform.md")
+            workers: Worker processes (None = one per CPU)
+
+        Returns:
+            Paths of the files that were written
+        """
+        output_dir = Path(output_dir)
+        anchor_map = self.build_anchor_map(overview_name)
+
+        overview_path = output_dir / overview_name
+        with open(overview_path, 'w', encoding='utf-8') as f:
+            f.write(rewrite_anchor_links(self.generate_overview(), overview_name, anchor_map))
+        written = [overview_path]
+
+        domain_ids = [d for d in self.system.get('domains', []) if d in self.domains]
+        pages = parallel_map(
+            _render_domain_file, domain_ids, workers,
+            initializer=_init_split_worker,
+            initargs=(self, overview_name, anchor_map)
+        )
+
+        for domain_id, (markdown, used_diagrams) in zip(domain_ids, pages):
+            if self.diagram_gen.cache is not None:
+                for key, diagram in used_diagrams.items():
+                    self.diagram_gen.cache.put(PIPELINE_FLOW_NAMESPACE, key, diagram)
+            path = output_dir / self.domain_filename(domain_id)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(markdown)
+            written.append(path)
+
+        if self.schema_files:
+            written.extend(self.write_schema_files(output_dir, anchor_map))
+
+        return written
+
+    def generate_overview(self) -> str:
+        """Generate the overview page of split output (links not yet rewritten)"""
+        unowned = set(self.owned_datasets(None))
+        sections = [
+            self._generate_header(),
+            self._generate_toc(),
+            "---",
+            self._generate_hierarchical_index(),
+            "---",
+            self._generate_system_architecture(),
+            "---",
+            self._generate_domains_table(),
+            "---",
+            self._generate_datasets_section(detailed=unowned),
+            "---",
+            self._generate_contracts_section(detailed=unowned),
+            "---",
+            self._generate_checks_section(detailed=unowned),
+            "---",
+            self._generate_lineage_section(),
+            "---",
+            self._generate_governance_section(),
+            "---",
+            self._generate_observability_section(),
+            "---",
+            "*Generated with [s2doc](https://github.com/FreeSideNomad/s2doc)*"
+        ]
+        return "\n\n".join(filter(None, sections))
+
+    def generate_domain_page(self, domain_id: str, overview_name: str,
+                             anchor_map: Optional[Dict[str, str]] = None) -> str:
+        """Generate the split output page for one domain, with links resolved"""
+        owned = self.owned_datasets(domain_id)
+        operations = [self.operations_index.get(ds_id) for ds_id in owned]
+        contracts = [c for ops in operations for c in ops.contracts]
+        checks = [c for ops in operations for c in ops.checks]
+
+        sections = [
+            f"[← {self.system.get('name', 'Data Engineering System')}]({overview_name})",
+            self._generate_domain_section(self.domains[domain_id])
+        ]
+        if owned:
+            sections.append("## Datasets\n\n" + "\n\n".join(
+                self._generate_dataset_detail(self.datasets[ds_id]) for ds_id in owned))
+        if contracts:
+            sections.append("## Data Contracts\n\n" + "\n\n".join(
+                self._generate_contract_detail(c) for c in contracts))
+        if checks:
+            sections.append("## Data Quality Checks\n\n" + "\n\n".join(
+                self._generate_check_detail(c) for c in checks))
+
+        markdown = "\n\n".join(sections)
+        if anchor_map is None:
+            anchor_map = self.build_anchor_map(overview_name)
+        return rewrite_anchor_links(markdown, self.domain_filename(domain_id), anchor_map)
+
+    @staticmethod
+    def domain_filename(domain_id: str) -> str:
+        """File name of a domain page in split output"""
+        return f"{domain_id}.md"
+
+    def owned_datasets(self, domain_id: Optional[str]) -> List[str]:
+        """Datasets owned by a domain (None = owned by no domain), in model order"""
+        if self._datasets_by_owner is None:
+            self._datasets_by_owner = {}
+            for ds_id in self.datasets:
+                self._datasets_by_owner.setdefault(self.dataset_index.owning_domain(ds_id), []).append(ds_id)
+        return self._datasets_by_owner.get(domain_id, [])
+
+    def build_anchor_map(self, overview_name: str) -> Dict[str, str]:
+        """Map every anchor ID to the split output file that defines it"""
+        anchor_map: Dict[str, str] = {}
+
+        for domain_id in self.system.get('domains', []):
+            if domain_id not in self.domains:
+                continue
+            domain_file = self.domain_filename(domain_id)
+            anchor_map.setdefault(domain_id, domain_file)
+            for pip_id in self.domains[domain_id].get('pipelines', []):
+                anchor_map.setdefault(pip_id, domain_file)
+                for stage in self.pipelines.get(pip_id, {}).get('stages', []):
+                    anchor_map.setdefault(stage.get('id', ''), domain_file)
+
+        self.owned_datasets(None)
+        for owner, dataset_ids in self._datasets_by_owner.items():
+            target = self.domain_filename(owner) if owner in self.domains else overview_name
+            for ds_id in dataset_ids:
+                anchor_map.setdefault(ds_id, target)
+                operations = self.operations_index.get(ds_id)
+                for entry in operations.contracts + operations.checks:
+                    anchor_map.setdefault(entry.get('id', ''), target)
+
+        for entry in self.contracts + self.checks:
+            anchor_map.setdefault(entry.get('id', ''), overview_name)
+
+        return anchor_map
+
     def _generate_header(self) -> str:
         """Generate system header section."""
         lines = [f"# {self.system.get('name', 'Data Engineering System')}"]
@@ -126,9 +337,10 @@ class DataEngConverter:
                         lines.append(f"    - **[{pipeline_name}](#{pipeline_id})** - {pipeline_desc}")
 
                         # Stages
-                        if pipeline.get('stages'):
+                        stage_graph = self.stage_graphs[pipeline_id]
+                        if stage_graph.stages:
                             stage_links = []
-                            for stage in pipeline['stages']:
+                            for stage in map(stage_graph.stages.get, stage_graph.order):
                                 stage_name = self.humanize_name(stage.get('name', stage['id']))
                                 stage_links.append(f"[{stage_name}](#{stage['id']})")
                             lines.append(f"      - Stages: {', '.join(stage_links)}")
@@ -141,7 +353,7 @@ class DataEngConverter:
         """Generate system architecture section."""
         lines = ["## System Architecture", ""]
         lines.append(self.diagram_gen.generate_system_architecture(
-            self.system, self.domains, self.pipelines, self.datasets
+            self.system, self.domains, self.pipelines, self.datasets, self.dataset_index
         ))
         return "\n".join(lines)
 
@@ -159,6 +371,28 @@ class DataEngConverter:
 
         return "\n".join(lines)
 
+    def _generate_domains_table(self) -> str:
+        """Generate domains summary table (split output overview)."""
+        lines = [
+            "## Domains",
+            "",
+            "| Domain | Pipelines | Datasets Referenced | Datasets Owned | Description |",
+            "|--------|-----------|---------------------|----------------|-------------|"
+        ]
+
+        for domain_id in self.system.get('domains', []):
+            if domain_id not in self.domains:
+                continue
+            domain = self.domains[domain_id]
+            domain_name = self.humanize_name(domain.get('name', domain_id))
+            lines.append(
+                f"| [{domain_name}](#{domain_id}) | {len(domain.get('pipelines', []))} | "
+                f"{len(self.dataset_index.get_domain_datasets(domain_id))} | "
+                f"{len(self.owned_datasets(domain_id))} | {domain.get('description', '')} |"
+            )
+
+        return "\n".join(lines)
+
     def _generate_domain_section(self, domain: dict) -> str:
         """Generate individual domain section."""
         domain_id = domain['id']
@@ -182,14 +416,7 @@ class DataEngConverter:
         pipeline_ids = domain.get('pipelines', [])
         pipeline_count = len(pipeline_ids)
 
-        # Count unique datasets
-        unique_datasets = set()
-        for pip_id in pipeline_ids:
-            if pip_id in self.pipelines:
-                pipeline = self.pipelines[pip_id]
-                for stage in pipeline.get('stages', []):
-                    unique_datasets.update(stage.get('inputs', []))
-                    unique_datasets.update(stage.get('outputs', []))
+        unique_datasets = self.dataset_index.get_domain_datasets(domain_id)
 
         lines.extend([
             "",
@@ -219,12 +446,8 @@ class DataEngConverter:
                     schedule_type = pipeline.get('schedule', {}).get('type', 'N/A')
                     stage_count = len(pipeline.get('stages', []))
 
-                    # Count inputs and outputs
-                    inputs = set()
-                    outputs = set()
-                    for stage in pipeline.get('stages', []):
-                        inputs.update(stage.get('inputs', []))
-                        outputs.update(stage.get('outputs', []))
+                    inputs = self.dataset_index.pipeline_inputs.get(pip_id, [])
+                    outputs = self.dataset_index.pipeline_outputs.get(pip_id, [])
 
                     lines.append(
                         f"| [{pip_name}](#{pip_id}) | {mode} | {schedule_type} | "
@@ -267,23 +490,62 @@ class DataEngConverter:
             lines.append("")
             lines.append(self._generate_schedule_section(pipeline['schedule']))
 
+        stage_graph = self.stage_graphs[pip_id]
+
         # Pipeline flow diagram
         lines.extend([
             "",
             "##### Pipeline Flow",
             "",
-            self.diagram_gen.generate_pipeline_flow(pipeline, self.datasets)
+            self.diagram_gen.generate_pipeline_flow(pipeline, self.datasets, stage_graph)
         ])
 
-        # Stages
-        if pipeline.get('stages'):
+        # Stages, in execution order
+        if stage_graph.stages:
+            lines.extend(["", self._generate_execution_plan(stage_graph)])
             lines.extend(["", "##### Stages", ""])
-            for stage in pipeline['stages']:
-                lines.append(self._generate_stage_section(stage))
+            for stage_id in stage_graph.order:
+                lines.append(self._generate_stage_section(stage_graph.stages[stage_id], stage_graph))
                 lines.append("")
 
         return "\n".join(lines)
 
+    def _generate_execution_plan(self, stage_graph: StageGraph) -> str:
+        """Generate execution levels, parallelism, critical path and dependency warnings of a pipeline."""
+        def stage_link(stage_id: str) -> str:
+            name = self.humanize_name(stage_graph.stages[stage_id].get('name', stage_id))
+            return f"[{name}](#{stage_id})"
+
+        lines = ["##### Execution Plan", ""]
+
+        for cycle in stage_graph.cycles:
+            members = ', '.join(stage_link(s) for s in cycle)
+            lines.extend([f"> **Warning**: Stage dependency cycle between {members}", ""])
+        blocked = [s for s in stage_graph.unreachable
+                   if not any(s in cycle for cycle in stage_graph.cycles)]
+        if blocked:
+            lines.extend([f"> **Warning**: Stages waiting on a cycle never run: "
+                          f"{', '.join(stage_link(s) for s in blocked)}", ""])
+        for stage_id, unknown in stage_graph.unknown_dependencies.items():
+            missing = ', '.join(f"`{dep_id}`" for dep_id in unknown)
+            lines.extend([f"> **Warning**: {stage_link(stage_id)} depends on unknown stage(s) {missing}", ""])
+
+        lines.extend([
+            f"- **Stages**: {len(stage_graph.stages)}",
+            f"- **Levels**: {len(stage_graph.levels)}",
+            f"- **Max Parallelism**: {stage_graph.max_parallelism}"
+        ])
+        critical_path = stage_graph.critical_path()
+        if critical_path:
+            path = ' → '.join(stage_link(s) for s in critical_path)
+            lines.append(f"- **Critical Path**: {stage_graph.critical_path_minutes():g} minutes ({path})")
+
+        lines.extend(["", "| Level | Width | Stages |", "|-------|-------|--------|"])
+        for level, stage_ids in enumerate(stage_graph.levels):
+            lines.append(f"| {level} | {len(stage_ids)} | {', '.join(stage_link(s) for s in stage_ids)} |")
+
+        return "\n".join(lines)
+
     def _generate_schedule_section(self, schedule: dict) -> str:
         """Generate schedule section."""
         lines = [
@@ -308,7 +570,7 @@ class DataEngConverter:
 
         return "\n".join(lines)
 
-    def _generate_stage_section(self, stage: dict) -> str:
+    def _generate_stage_section(self, stage: dict, stage_graph: Optional[StageGraph] = None) -> str:
         """Generate stage documentation."""
         stage_id = stage['id']
         stage_name = self.humanize_name(stage.get('name', stage_id))
@@ -319,6 +581,12 @@ class DataEngConverter:
             f"**ID**: `{stage_id}`"
         ]
 
+        if stage_graph is not None:
+            lines.append(f"**Level**: {stage_graph.level[stage_id]}")
+
+        if stage.get('duration_minutes'):
+            lines.append(f"**Duration**: {stage['duration_minutes']} minutes")
+
         if stage.get('description'):
             lines.append(f"**Description**: {stage['description']}")
 
@@ -368,8 +636,8 @@ class DataEngConverter:
 
         return "\n".join(lines)
 
-    def _generate_datasets_section(self) -> str:
-        """Generate datasets section."""
+    def _generate_datasets_section(self, detailed: Optional[Set[str]] = None) -> str:
+        """Generate datasets section (detail sections only for `detailed` dataset IDs, if given)."""
         if not self.datasets:
             return "## Datasets\n\n*No datasets defined*"
 
@@ -398,6 +666,8 @@ class DataEngConverter:
 
         # Detailed dataset sections
         for ds_id, dataset in self.datasets.items():
+            if detailed is not None and ds_id not in detailed:
+                continue
             lines.append(self._generate_dataset_detail(dataset))
             lines.append("")
 
@@ -425,25 +695,24 @@ class DataEngConverter:
         if dataset.get('tags'):
             lines.append(f"**Tags**: {', '.join(dataset['tags'])}")
 
-        # Schema
-        schema = dataset.get('schema', {})
-        if schema.get('fields'):
-            lines.extend([
-                "",
-                "#### Schema",
-                "",
-                "| Field | Type | Nullable | PII | Description |",
-                "|-------|------|----------|-----|-------------|"
-            ])
+        domain_links = [f"[{self.humanize_name(self.domains[dom_id].get('name', dom_id))}](#{dom_id})"
+                        for dom_id in self.dataset_index.get_domains(ds_id)]
+        if domain_links:
+            lines.append(f"**Domains**: {', '.join(domain_links)}")
 
-            for field in schema['fields']:
-                field_name = field.get('name', 'N/A')
-                field_type = field.get('type', 'N/A')
-                nullable = "Yes" if field.get('nullable', True) else "No"
-                pii = "Yes" if field.get('pii', False) else "No"
-                description = field.get('description', '-')
+        lines.extend(self._generate_stage_refs(self.dataset_index.get_producers(ds_id), "#### Produced By"))
+        lines.extend(self._generate_stage_refs(self.dataset_index.get_consumers(ds_id), "#### Consumed By"))
+        lines.extend(self._generate_lineage_impact(ds_id))
+        lines.extend(self._generate_operational_profile(self.operations_index.get(ds_id)))
 
-                lines.append(f"| `{field_name}` | {field_type} | {nullable} | {pii} | {description} |")
+        # Schema
+        fields = dataset.get('schema', {}).get('fields')
+        if fields:
+            lines.extend(["", "#### Schema", ""])
+            if len(fields) > self.schema_field_budget:
+                lines.extend(self._generate_wide_schema(dataset))
+            else:
+                lines.extend(self._schema_table(ds_id, fields))
 
         # Partitioning
         if dataset.get('partitioning'):
@@ -467,8 +736,238 @@ class DataEngConverter:
 
         return "\n".join(lines)
 
-    def _generate_contracts_section(self) -> str:
-        """Generate data contracts section."""
+    def _generate_stage_refs(self, refs: List[StageRef], heading: str) -> List[str]:
+        """Generate a list of stages (with their pipelines) reading or writing a dataset"""
+        if not refs:
+            return []
+
+        lines = ["", heading, ""]
+        for ref in refs:
+            stage = self.dataset_index.stages.get(ref, {})
+            stage_name = self.humanize_name(stage.get('name', ref.stage_id))
+            pipeline = self.pipelines.get(ref.pipeline_id, {})
+            pip_name = self.humanize_name(pipeline.get('name', ref.pipeline_id))
+            lines.append(f"- [{stage_name}](#{ref.stage_id}) in [{pip_name}](#{ref.pipeline_id})")
+
+        return lines
+
+    def _generate_lineage_impact(self, ds_id: str, limit: int = 20) -> List[str]:
+        """Generate transitive upstream/downstream datasets from the lineage graph"""
+        if ds_id not in self.lineage_graph:
+            return []
+
+        upstream = self.lineage_graph.upstream_of(ds_id)
+        downstream = self.lineage_graph.downstream_of(ds_id)
+        if not upstream and not downstream:
+            return []
+
+        def links(ids: List[str]) -> str:
+            text = ', '.join(f"[{self._get_dataset_name(i)}](#{i})" for i in ids[:limit])
+            if len(ids) > limit:
+                text += f", ... {len(ids) - limit} more"
+            return text
+
+        lines = ["", "#### Lineage Impact", "", f"- **Lineage Level**: {self.lineage_graph.level(ds_id)}"]
+        if upstream:
+            lines.append(f"- **Upstream** ({len(upstream)}): {links(upstream)}")
+        if downstream:
+            lines.append(f"- **Downstream** ({len(downstream)}): {links(downstream)}")
+
+        return lines
+
+    def _generate_operational_profile(self, operations: DatasetOperations) -> List[str]:
+        """Generate the contracts, checks, policies and observability attached to a dataset"""
+        if not operations:
+            return []
+
+        lines = ["", "#### Operational Profile", ""]
+
+        for contract in operations.contracts:
+            ctr_id = contract['id']
+            ctr_name = self.humanize_name(contract.get('name', ctr_id))
+            sla = contract.get('sla', {})
+            sla_items = []
+            if sla.get('freshness_minutes') is not None:
+                sla_items.append(f"freshness {sla['freshness_minutes']}m")
+            if sla.get('completeness_percent') is not None:
+                sla_items.append(f"completeness {sla['completeness_percent']}%")
+            if sla.get('availability_percent') is not None:
+                sla_items.append(f"availability {sla['availability_percent']}%")
+            line = f"- **Contract**: [{ctr_name}](#{ctr_id}) v{contract.get('version', 'N/A')}"
+            if sla_items:
+                line += f" (SLA: {', '.join(sla_items)})"
+            lines.append(line)
+
+        for check in operations.checks:
+            chk_id = check['id']
+            chk_name = self.humanize_name(check.get('name', chk_id))
+            details = [check.get('type', 'N/A'), f"severity {check.get('severity', 'N/A')}"]
+            if check.get('alert', {}).get('channel'):
+                details.append(f"alerts {check['alert']['channel']}")
+            lines.append(f"- **Quality Check**: [{chk_name}](#{chk_id}) ({', '.join(details)})")
+
+        for slo in operations.slos:
+            lines.append(
+                f"- **SLO**: {slo.get('name', 'N/A')} - {slo.get('target', 'N/A')} {slo.get('unit', '')} "
+                f"over {slo.get('window', 'N/A')}"
+            )
+
+        for metric in operations.metrics:
+            line = f"- **Metric**: `{metric.get('name', 'N/A')}` ({metric.get('type', 'N/A')})"
+            if metric.get('description'):
+                line += f" - {metric['description']}"
+            lines.append(line)
+
+        for policy in operations.retention:
+            lines.append(f"- **Retention**: {policy.get('policy', 'N/A')} ({self._retention_duration(policy)})")
+
+        for policy in operations.access:
+            roles = ', '.join(policy.get('roles', [])) or 'N/A'
+            lines.append(f"- **Access**: {policy.get('tier', 'N/A')} tier, roles {roles}")
+
+        for policy in operations.pii_handling:
+            fields = ', '.join(f"`{f}`" for f in policy.get('masking', [])) or 'N/A'
+            lines.append(f"- **PII Masking**: {fields} via {policy.get('masking_method', 'N/A')}")
+
+        return lines
+
+    def _retention_duration(self, policy: dict) -> str:
+        """Human-readable retention period of a retention policy"""
+        if policy.get('days'):
+            return f"{policy['days']} days"
+        if policy.get('years'):
+            return f"{policy['years']} years"
+        return 'Indefinitely' if policy.get('policy') == 'retain-indefinitely' else 'N/A'
+
+    def _schema_table(self, ds_id: str, fields: List[dict]) -> List[str]:
+        """Schema table of the given fields, with per-field provenance if any field is derived"""
+        if ds_id not in self.field_lineage.derived_datasets:
+            return _SCHEMA_TABLE_HEADER + self._schema_rows(fields)
+        return _PROVENANCE_TABLE_HEADER + self._schema_rows(fields, ds_id)
+
+    def _schema_rows(self, fields: List[dict], provenance_of: Optional[str] = None) -> List[str]:
+        """Schema table rows, one per field (with a Derived From cell for fields of `provenance_of`)"""
+        rows = []
+        for field in fields:
+            field_name = field.get('name', 'N/A')
+            field_type = field.get('type', 'N/A')
+            nullable = "Yes" if field.get('nullable', True) else "No"
+            pii = "Yes" if field.get('pii', False) else "No"
+            description = field.get('description', '-')
+
+            row = f"| `{field_name}` | {field_type} | {nullable} | {pii} | {description} |"
+            if provenance_of is not None:
+                row += f" {self._field_provenance(FieldRef(provenance_of, field_name))} |"
+            rows.append(row)
+        return rows
+
+    def _field_link(self, ref: FieldRef) -> str:
+        return f"[{self._get_dataset_name(ref.dataset)}](#{ref.dataset}).`{ref.field}`"
+
+    def _field_provenance(self, ref: FieldRef) -> str:
+        """Direct sources of a field, then its origin fields when the chain is longer than one hop"""
+        sources = self.field_lineage.sources(ref)
+        if not sources:
+            return "-"
+
+        parts = [self._field_link(up) + (f" via `{trf}`" if trf else "") for up, trf in sources]
+        origins = self.field_lineage.origins(ref)
+        if set(origins) != {up for up, _ in sources}:
+            shown = ', '.join(self._field_link(o) for o in origins[:_ORIGIN_LIMIT])
+            if len(origins) > _ORIGIN_LIMIT:
+                shown += f" and {len(origins) - _ORIGIN_LIMIT} more"
+            parts.append(f"Origins: {shown or 'none (cycle)'}")
+        return "<br>".join(parts)
+
+    def _generate_wide_schema(self, dataset: dict) -> List[str]:
+        """
+        Generate a compact summary of a schema above the field budget.
+
+        The summary gives field counts by type and lists PII fields first. The
+        full table follows in collapsible pages, or lives in its own file in
+        schema-file mode.
+        """
+        ds_id = dataset['id']
+        fields = dataset['schema']['fields']
+        pii_fields = [f for f in fields if f.get('pii', False)]
+
+        type_counts: Dict[str, int] = {}
+        for field in fields:
+            field_type = str(field.get('type', 'N/A'))
+            type_counts[field_type] = type_counts.get(field_type, 0) + 1
+        by_type = ', '.join(f"{t} {n}" for t, n in sorted(type_counts.items(), key=lambda x: (-x[1], x[0])))
+
+        lines = [
+            f"**Fields**: {len(fields)} ({len(pii_fields)} PII)",
+            f"**Types**: {by_type}"
+        ]
+
+        if pii_fields:
+            lines.extend(["", "**PII Fields**:", ""])
+            lines.extend(self._schema_table(ds_id, pii_fields))
+
+        if self.schema_files:
+            lines.extend(["", f"**Full Schema**: [{len(fields)} fields]({self.schema_filename(ds_id)})"])
+            return lines
+
+        for start in range(0, len(fields), SCHEMA_PAGE_SIZE):
+            page = fields[start:start + SCHEMA_PAGE_SIZE]
+            lines.extend([
+                "",
+                "<details>",
+                f"<summary>Fields {start + 1}–{start + len(page)} of {len(fields)}</summary>",
+                ""
+            ])
+            lines.extend(self._schema_table(ds_id, page))
+            lines.extend(["", "</details>"])
+
+        return lines
+
+    @staticmethod
+    def schema_filename(dataset_id: str) -> str:
+        """Path of a dataset's schema file, relative to the output directory"""
+        return f"{SCHEMA_DIR}/{dataset_id}.md"
+
+    def wide_datasets(self) -> List[str]:
+        """Datasets whose schema exceeds the field budget"""
+        return [ds_id for ds_id, dataset in self.datasets.items()
+                if len(dataset.get('schema', {}).get('fields') or []) > self.schema_field_budget]
+
+    def write_schema_files(self, output_dir: Path, page_of: Dict[str, str]) -> List[Path]:
+        """
+        Write the full schema of every wide dataset to its own file (schema-file mode).
+
+        Args:
+            output_dir: Directory holding the generated pages
+            page_of: Dataset ID -> page documenting the dataset, for the back link
+
+        Returns:
+            Paths of the schema files
+        """
+        written = []
+        page_links = {anchor: f"../{page}" for anchor, page in page_of.items()}
+        for ds_id in self.wide_datasets():
+            dataset = self.datasets[ds_id]
+            ds_name = self.humanize_name(dataset.get('name', ds_id))
+            lines = [
+                f"[← {ds_name}](../{page_of.get(ds_id, '')}#{ds_id})",
+                "",
+                f"# {ds_name} Schema",
+                ""
+            ]
+            lines.extend(self._schema_table(ds_id, dataset['schema']['fields']))
+            # Field provenance links point back into the documentation pages
+            markdown = rewrite_anchor_links("\n".join(lines), self.schema_filename(ds_id), page_links)
+
+            path = Path(output_dir) / self.schema_filename(ds_id)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(markdown + "\n")
+            written.append(path)
+        return written
+
+    def _generate_contracts_section(self, detailed: Optional[Set[str]] = None) -> str:
+        """Generate data contracts section (details only for contracts of `detailed` datasets, if given)."""
         if not self.contracts:
             return "## Data Contracts\n\n*No contracts defined*"
 
@@ -504,6 +1003,8 @@ class DataEngConverter:
 
         # Detailed contract sections
         for contract in self.contracts:
+            if detailed is not None and contract.get('dataset') not in detailed:
+                continue
             lines.append(self._generate_contract_detail(contract))
             lines.append("")
 
@@ -559,8 +1060,8 @@ class DataEngConverter:
 
         return "\n".join(lines)
 
-    def _generate_checks_section(self) -> str:
-        """Generate data quality checks section."""
+    def _generate_checks_section(self, detailed: Optional[Set[str]] = None) -> str:
+        """Generate data quality checks section (details only for checks of `detailed` datasets, if given)."""
         if not self.checks:
             return "## Data Quality Checks\n\n*No checks defined*"
 
@@ -593,6 +1094,8 @@ class DataEngConverter:
 
         # Detailed check sections
         for check in self.checks:
+            if detailed is not None and check.get('dataset') not in detailed:
+                continue
             lines.append(self._generate_check_detail(check))
             lines.append("")
 
@@ -647,14 +1150,22 @@ class DataEngConverter:
         if not self.lineage:
             return "## Data Lineage\n\n*No lineage defined*"
 
-        lines = [
-            "## Data Lineage",
-            "",
-            self.diagram_gen.generate_lineage_diagram(self.lineage, self.datasets),
-            "",
+        lines = ["## Data Lineage", ""]
+
+        if len(self.lineage_graph) <= self.diagram_node_budget:
+            lines.extend([self.diagram_gen.generate_lineage_diagram(self.lineage, self.datasets), ""])
+        else:
+            lines.extend(self._generate_partitioned_lineage())
+            lines.extend(["### Lineage Edges", ""])
+
+        for cycle in self.lineage_graph.cycles():
+            members = ', '.join(f"[{self._get_dataset_name(i)}](#{i})" for i in cycle)
+            lines.extend([f"> **Warning**: Lineage cycle between {members}", ""])
+
+        lines.extend([
             "| Upstream Dataset | Downstream Dataset | Transform | Relationship |",
             "|------------------|-------------------|-----------|--------------|"
-        ]
+        ])
 
         for lin in self.lineage:
             up_id = lin.get('upstream', 'N/A')
@@ -671,6 +1182,36 @@ class DataEngConverter:
 
         return "\n".join(lines)
 
+    def _generate_partitioned_lineage(self) -> List[str]:
+        """Generate one bounded-size lineage diagram per partition"""
+        partitions = partition_lineage(self.lineage_graph, self.dataset_index.owning_domain,
+                                       self.diagram_node_budget)
+        diagrams = self.diagram_gen.generate_lineage_partitions(self.lineage, self.datasets, partitions)
+
+        lines = [
+            f"The lineage graph has {len(self.lineage_graph)} datasets, so it is split into "
+            f"{len(partitions)} diagrams of at most {self.diagram_node_budget} datasets: by connected "
+            "group, then by owning domain. Datasets drawn in another diagram appear as dashed ↗ stubs.",
+            ""
+        ]
+        for i, (partition, diagram) in enumerate(zip(partitions, diagrams), 1):
+            lines.extend([f"### Lineage {i}: {self._partition_title(partition)}", "", diagram, ""])
+
+        return lines
+
+    def _partition_title(self, partition: LineagePartition) -> str:
+        """Name a lineage partition after its owning domains"""
+        names = [self.humanize_name(self.domains[d].get('name', d)) for d in partition.domains if d in self.domains]
+        if not names:
+            title = "Unassigned Datasets"
+        elif len(names) > 3:
+            title = f"{', '.join(names[:3])} and {len(names) - 3} more"
+        else:
+            title = ', '.join(names)
+        if partition.parts > 1:
+            title += f" ({partition.part}/{partition.parts})"
+        return title
+
     def _generate_governance_section(self) -> str:
         """Generate governance section."""
         if not self.governance:
@@ -691,13 +1232,7 @@ class DataEngConverter:
                 ds_name = self._get_dataset_name(ds_id)
                 pol_type = policy.get('policy', 'N/A')
 
-                duration = ''
-                if policy.get('days'):
-                    duration = f"{policy['days']} days"
-                elif policy.get('years'):
-                    duration = f"{policy['years']} years"
-                else:
-                    duration = 'Indefinitely' if pol_type == 'retain-indefinitely' else 'N/A'
+                duration = self._retention_duration(policy)
 
                 lines.append(f"| [{ds_name}](#{ds_id}) | {pol_type} | {duration} |")
 
@@ -842,27 +1377,25 @@ class DataEngConverter:
             user-events -> User Events
             User Event Features -> User Event Features
         """
-        if not name:
-            return ""
-
-        # If already has spaces, return as-is
-        if ' ' in name:
-            return name
-
-        # Handle kebab-case
-        if '-' in name:
-            return ' '.join(word.capitalize() for word in name.split('-'))
-
-        # Handle PascalCase/camelCase
-        result = []
-        for i, char in enumerate(name):
-            if i > 0 and char.isupper():
-                # Check if previous char is lowercase or next char is lowercase
-                prev_is_lower = name[i-1].islower()
-                next_is_lower = i < len(name) - 1 and name[i+1].islower()
-
-                if prev_is_lower or next_is_lower:
-                    result.append(' ')
-            result.append(char)
-
-        return ''.join(result)
+        return humanize_identifier(name)
+
+
+# Worker process state for split output: the converter (with its indexes) is
+# handed over once per worker instead of once per domain
+_split_worker_state: dict = {}
+
+
+def _init_split_worker(converter: DataEngConverter, overview_name: str, anchor_map: Dict[str, str]) -> None:
+    """Keep the prebuilt converter for domain page rendering"""
+    _split_worker_state['converter'] = converter
+    _split_worker_state['overview_name'] = overview_name
+    _split_worker_state['anchor_map'] = anchor_map
+
+
+def _render_domain_file(domain_id: str) -> Tuple[str, Dict[str, str]]:
+    """Render one domain page in a worker, with the pipeline flow diagrams it used"""
+    converter = _split_worker_state['converter']
+    converter.diagram_gen.used_diagrams = {}
+    markdown = converter.generate_domain_page(domain_id, _split_worker_state['overview_name'],
+                                              _split_worker_state['anchor_map'])
+    return markdown, converter.diagram_gen.used_diagrams
@@ -1,14 +1,53 @@
 """Generate Mermaid diagrams for data engineering documentation."""
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+from ...utils.cache import BuildCache, content_hash
+from .lineage import LineagePartition
+from .models import DatasetIndex
+from .stages import StageGraph
+
+# Build cache namespace for pipeline flow diagrams, keyed by content hash
+PIPELINE_FLOW_NAMESPACE = "data_eng_pipeline_flow"
+
+# Part of the cache key: bump whenever _render_pipeline_flow output changes,
+# so diagrams cached by an earlier rendering are not reused
+PIPELINE_FLOW_FORMAT = 2
+
+_PIPELINE_CLASS_DEFS = [
+    "    classDef stageStyle fill:#80ccff",
+    "    classDef datasetStyle fill:#ffe6cc",
+]
+
+# Stages in, or waiting on, a dependency cycle
+_BLOCKED_CLASS_DEF = "    classDef blockedStyle fill:#ffcccc,stroke:#cc0000"
+
+_LINEAGE_CLASS_DEFS = [
+    "    classDef datasetStyle fill:#ffe6cc",
+    "    classDef stubStyle fill:#f5f5f5,stroke:#9e9e9e,stroke-dasharray:5 5,color:#616161",
+]
 
 
 class DiagramGenerator:
-    """Generate Mermaid diagrams for data engineering documentation."""
+    """
+    Generate Mermaid diagrams for data engineering documentation.
+
+    With a build cache, pipeline flow diagrams are reused across runs while the
+    pipeline's stages and the names of its datasets are unchanged. Every flow
+    diagram used in this run is recorded in used_diagrams (hash -> text).
+    """
+
+    def __init__(self, cache: Optional[BuildCache] = None):
+        self.cache = cache
+        self.used_diagrams: Dict[str, str] = {}
 
     def generate_system_architecture(self, system: dict, domains: dict,
-                                     pipelines: dict, datasets: dict) -> str:
+                                     pipelines: dict, datasets: dict,
+                                     index: Optional[DatasetIndex] = None) -> str:
         """Generate system architecture diagram showing hierarchy."""
+        if index is None:
+            index = DatasetIndex(domains, pipelines)
+
         lines = ["```mermaid", "graph TB"]
 
         sys_id = system.get('id', 'sys')
@@ -46,19 +85,13 @@ class DiagramGenerator:
             lines.append("    end")
             lines.append("")
 
-        # Key datasets (limit to those with most references)
-        dataset_refs = {}
-        for pip_id, pipeline in pipelines.items():
-            for stage in pipeline.get('stages', []):
-                for ds_id in stage.get('inputs', []) + stage.get('outputs', []):
-                    dataset_refs[ds_id] = dataset_refs.get(ds_id, 0) + 1
-
-        # Top 10 most referenced datasets
-        top_datasets = sorted(dataset_refs.items(), key=lambda x: x[1], reverse=True)[:10]
+        # Key datasets: top 10 most referenced
+        top_datasets = index.most_referenced(10)
+        top_dataset_ids = set(top_datasets)
 
         if top_datasets:
             lines.append("    subgraph Datasets")
-            for ds_id, _ in top_datasets:
+            for ds_id in top_datasets:
                 if ds_id in datasets:
                     dataset = datasets[ds_id]
                     ds_name = dataset.get('name', ds_id)
@@ -86,13 +119,13 @@ class DiagramGenerator:
                 pipeline = pipelines[pip_id]
                 for stage in pipeline.get('stages', [])[:2]:  # First 2 stages
                     for ds_id in stage.get('inputs', [])[:2]:  # First 2 inputs
-                        if ds_id in [d[0] for d in top_datasets]:
+                        if ds_id in top_dataset_ids:
                             lines.append(f"    {self._clean_id(pip_id)} -->|reads| {self._clean_id(ds_id)}")
                             example_count += 1
                             if example_count >= 5:
                                 break
                     for ds_id in stage.get('outputs', [])[:2]:  # First 2 outputs
-                        if ds_id in [d[0] for d in top_datasets]:
+                        if ds_id in top_dataset_ids:
                             lines.append(f"    {self._clean_id(pip_id)} -->|writes| {self._clean_id(ds_id)}")
                             example_count += 1
                             if example_count >= 5:
@@ -110,43 +143,69 @@ class DiagramGenerator:
         for pip_id in all_pipeline_ids[:10]:
             if pip_id in pipelines:
                 lines.append(f"    style {self._clean_id(pip_id)} fill:#80ccff")
-        for ds_id, _ in top_datasets:
+        for ds_id in top_datasets:
             if ds_id in datasets:
                 lines.append(f"    style {self._clean_id(ds_id)} fill:#ffe6cc")
 
         lines.append("```")
         return "\n".join(lines)
 
-    def generate_pipeline_flow(self, pipeline: dict, datasets: dict) -> str:
-        """Generate pipeline flow diagram with stages and data flows."""
+    def pipeline_flow_key(self, pipeline: dict, datasets: dict) -> str:
+        """Hash of everything the pipeline's flow diagram is rendered from"""
+        stages = pipeline.get('stages', [])
+        names = {ds_id: datasets.get(ds_id, {}).get('name', ds_id)
+                 for ds_id in self._flow_datasets(stages)}
+        return content_hash([PIPELINE_FLOW_FORMAT, stages, names])
+
+    def generate_pipeline_flow(self, pipeline: dict, datasets: dict,
+                               stage_graph: Optional[StageGraph] = None) -> str:
+        """Generate pipeline flow diagram with stages and data flows (from the build cache when unchanged)."""
+        key = self.pipeline_flow_key(pipeline, datasets)
+        diagram = self.used_diagrams.get(key)
+        if diagram is None and self.cache is not None:
+            diagram = self.cache.get(PIPELINE_FLOW_NAMESPACE, key)
+        if diagram is None:
+            if stage_graph is None:
+                stage_graph = StageGraph(pipeline.get('stages', []))
+            diagram = self._render_pipeline_flow(stage_graph, datasets)
+
+        self.used_diagrams[key] = diagram
+        if self.cache is not None:
+            self.cache.put(PIPELINE_FLOW_NAMESPACE, key, diagram)
+        return diagram
+
+    def _flow_datasets(self, stages: List[dict]) -> List[str]:
+        """Datasets read or written by any stage, in first-seen order"""
+        seen: Dict[str, None] = {}
+        for stage in stages:
+            for ds_id in stage.get('inputs', []) + stage.get('outputs', []):
+                seen[ds_id] = None
+        return list(seen)
+
+    def _render_pipeline_flow(self, stage_graph: StageGraph, datasets: dict) -> str:
+        """Render the pipeline flow diagram, stages in execution order"""
         lines = ["```mermaid", "graph LR"]
 
-        stages = pipeline.get('stages', [])
+        stage_ids = stage_graph.order
+        stages = [stage_graph.stages[stage_id] for stage_id in stage_ids]
 
         # Define all stages
-        for i, stage in enumerate(stages):
-            stage_id = stage.get('id', f'stg{i}')
+        for stage_id, stage in zip(stage_ids, stages):
             stage_name = stage.get('name', stage_id)
             lines.append(f'    {self._clean_id(stage_id)}["{stage_name}"]')
 
         lines.append("")
 
         # Define datasets
-        all_datasets = set()
-        for stage in stages:
-            all_datasets.update(stage.get('inputs', []))
-            all_datasets.update(stage.get('outputs', []))
-
-        for ds_id in all_datasets:
-            ds_name = datasets.get(ds_id, {}).get('name', ds_id) if ds_id in datasets else ds_id
+        flow_datasets = self._flow_datasets(stages)
+        for ds_id in flow_datasets:
+            ds_name = datasets.get(ds_id, {}).get('name', ds_id)
             lines.append(f'    {self._clean_id(ds_id)}["{ds_name}"]')
 
         lines.append("")
 
         # Input/Output flows
-        for stage in stages:
-            stage_id = stage.get('id', 'stg')
-
+        for stage_id, stage in zip(stage_ids, stages):
             # Inputs
             for ds_id in stage.get('inputs', []):
                 lines.append(f"    {self._clean_id(ds_id)} --> {self._clean_id(stage_id)}")
@@ -155,21 +214,22 @@ class DiagramGenerator:
             for ds_id in stage.get('outputs', []):
                 lines.append(f"    {self._clean_id(stage_id)} --> {self._clean_id(ds_id)}")
 
-        # Stage dependencies
-        for stage in stages:
-            stage_id = stage.get('id', 'stg')
-            for dep_id in stage.get('depends_on', []):
+        # Stage dependencies (references to stages outside the pipeline are not drawn)
+        for stage_id in stage_ids:
+            for dep_id in stage_graph.dependencies[stage_id]:
                 lines.append(f"    {self._clean_id(dep_id)} -.->|depends| {self._clean_id(stage_id)}")
 
         lines.append("")
 
-        # Styling
-        for stage in stages:
-            stage_id = stage.get('id', 'stg')
-            lines.append(f"    style {self._clean_id(stage_id)} fill:#80ccff")
-
-        for ds_id in all_datasets:
-            lines.append(f"    style {self._clean_id(ds_id)} fill:#ffe6cc")
+        # Styling: one class statement per node kind
+        lines.extend(_PIPELINE_CLASS_DEFS)
+        if stage_ids:
+            lines.append(f"    class {','.join(self._clean_id(s) for s in stage_ids)} stageStyle")
+        if flow_datasets:
+            lines.append(f"    class {','.join(self._clean_id(d) for d in flow_datasets)} datasetStyle")
+        if stage_graph.unreachable:
+            lines.append(_BLOCKED_CLASS_DEF)
+            lines.append(f"    class {','.join(self._clean_id(s) for s in stage_graph.unreachable)} blockedStyle")
 
         lines.append("```")
         return "\n".join(lines)
@@ -193,19 +253,9 @@ class DiagramGenerator:
         lines.append("")
 
         # Define lineage relationships
-        for i, lin in enumerate(lineage):
-            up_id = lin.get('upstream')
-            down_id = lin.get('downstream')
-            transform = lin.get('transform', '')
-            relationship = lin.get('relationship', '')
-
-            if up_id and down_id:
-                label = f"{transform}<br/>{relationship}" if transform and relationship else (transform or relationship or '')
-                if label:
-                    lines.append(f'    {self._clean_id(up_id)} -->|{label}| {self._clean_id(down_id)}')
-                else:
-                    lines.append(f'    {self._clean_id(up_id)} --> {self._clean_id(down_id)}')
-
+        for lin in lineage:
+            if lin.get('upstream') and lin.get('downstream'):
+                lines.append(self._lineage_edge(lin))
         lines.append("")
 
         # Styling
@@ -216,6 +266,67 @@ class DiagramGenerator:
         lines.append("```")
         return "\n".join(lines)
 
+    def generate_lineage_partitions(self, lineage: List[dict], datasets: dict,
+                                    partitions: List[LineagePartition]) -> List[str]:
+        """
+        Generate one lineage diagram per partition.
+
+        Edges to datasets of another partition are kept, with the other end drawn
+        as a dashed stub node.
+        """
+        partition_of = {ds_id: i for i, partition in enumerate(partitions) for ds_id in partition.nodes}
+        edges: List[List[dict]] = [[] for _ in partitions]
+        for lin in lineage:
+            up_id, down_id = lin.get('upstream'), lin.get('downstream')
+            if not up_id or not down_id:
+                continue
+            up_part, down_part = partition_of.get(up_id), partition_of.get(down_id)
+            for part in {up_part, down_part} - {None}:
+                edges[part].append(lin)
+
+        diagrams = []
+        for i, partition in enumerate(partitions):
+            members = set(partition.nodes)
+            stubs: Dict[str, None] = {}
+            for lin in edges[i]:
+                for ds_id in (lin['upstream'], lin['downstream']):
+                    if ds_id not in members:
+                        stubs[ds_id] = None
+
+            lines = ["```mermaid", "graph LR"]
+            for ds_id in partition.nodes:
+                ds_name = datasets.get(ds_id, {}).get('name', ds_id)
+                lines.append(f'    {self._clean_id(ds_id)}["{ds_name}"]')
+            for ds_id in stubs:
+                ds_name = datasets.get(ds_id, {}).get('name', ds_id)
+                lines.append(f'    {self._clean_id(ds_id)}["↗ {ds_name}"]')
+            lines.append("")
+
+            for lin in edges[i]:
+                lines.append(self._lineage_edge(lin))
+            lines.append("")
+
+            lines.extend(_LINEAGE_CLASS_DEFS)
+            lines.append(f"    class {','.join(self._clean_id(d) for d in partition.nodes)} datasetStyle")
+            if stubs:
+                lines.append(f"    class {','.join(self._clean_id(d) for d in stubs)} stubStyle")
+            lines.append("```")
+            diagrams.append("\n".join(lines))
+
+        return diagrams
+
+    def _lineage_edge(self, lin: dict) -> str:
+        """Mermaid edge for one lineage entry, labelled with transform and relationship"""
+        up_id = self._clean_id(lin.get('upstream'))
+        down_id = self._clean_id(lin.get('downstream'))
+        transform = lin.get('transform', '')
+        relationship = lin.get('relationship', '')
+
+        label = f"{transform}<br/>{relationship}" if transform and relationship else (transform or relationship or '')
+        if label:
+            return f'    {up_id} -->|{label}| {down_id}'
+        return f'    {up_id} --> {down_id}'
+
     def _clean_id(self, id_str: str) -> str:
         """Clean ID for use in Mermaid diagrams."""
         if not id_str:
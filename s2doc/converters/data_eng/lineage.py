@@ -0,0 +1,410 @@
+"""Dataset and field lineage graphs with cached closure, level and cycle queries"""
+
+from typing import Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+UPSTREAM = 'upstream'
+DOWNSTREAM = 'downstream'
+
+
+class LineagePartition(NamedTuple):
+    """Datasets drawn in one lineage diagram"""
+    nodes: List[str]        # Dataset IDs, ordered by lineage level
+    domains: List[str]      # Owning domains of the datasets, in first-seen order
+    part: int = 1           # Position among the chunks of an oversized domain group
+    parts: int = 1
+
+
+class LineageGraph:
+    """
+    Lineage edges interned into integer adjacency arrays.
+
+    Strongly connected components are found once (iterative Tarjan) and the
+    condensed DAG drives everything else: topological levels, cycle
+    detection and transitive closure. Closures are bitmasks over components,
+    computed lazily and memoized per component, so repeated upstream or
+    downstream queries share work and each answer is a mask expansion.
+
+    Nodes are dataset IDs, or FieldRef pairs for field lineage; any hashable
+    ID works.
+    """
+
+    def __init__(self, edges: Iterable[Tuple[str, str]]):
+        self.nodes: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.successors: List[List[int]] = []
+        self.predecessors: List[List[int]] = []
+
+        seen = set()
+        for up_id, down_id in edges:
+            up, down = self._intern(up_id), self._intern(down_id)
+            if (up, down) not in seen:
+                seen.add((up, down))
+                self.successors[up].append(down)
+                self.predecessors[down].append(up)
+
+        self._components: Optional[List[List[int]]] = None
+        self._component_of: List[int] = []
+        self._levels: Optional[List[int]] = None
+        self._component_adjacency: Dict[str, List[List[int]]] = {}
+        self._closure: Dict[str, Dict[int, int]] = {UPSTREAM: {}, DOWNSTREAM: {}}
+        self._results: Dict[Tuple[str, str], List[str]] = {}
+        self._component_origins: Optional[List[FrozenSet[int]]] = None
+
+    @classmethod
+    def from_lineage(cls, lineage: List[dict]) -> 'LineageGraph':
+        """Build from the `lineage` section of a data engineering model"""
+        return cls((lin['upstream'], lin['downstream']) for lin in lineage
+                   if lin.get('upstream') and lin.get('downstream'))
+
+    def _intern(self, node_id: str) -> int:
+        node = self.index.get(node_id)
+        if node is None:
+            node = self.index[node_id] = len(self.nodes)
+            self.nodes.append(node_id)
+            self.successors.append([])
+            self.predecessors.append([])
+        return node
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self.index
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    # -- Components -------------------------------------------------------
+
+    def _condense(self) -> List[List[int]]:
+        """Tarjan's algorithm without recursion; components come out sinks first"""
+        if self._components is not None:
+            return self._components
+
+        count = len(self.nodes)
+        order = [-1] * count
+        low = [0] * count
+        on_stack = [False] * count
+        stack: List[int] = []
+        components: List[List[int]] = []
+        component_of = [-1] * count
+        counter = 0
+
+        for root in range(count):
+            if order[root] != -1:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, edge = work.pop()
+                if edge == 0:
+                    order[node] = low[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                successors = self.successors[node]
+                while edge < len(successors):
+                    succ = successors[edge]
+                    edge += 1
+                    if order[succ] == -1:
+                        work.append((node, edge))
+                        work.append((succ, 0))
+                        break
+                    if on_stack[succ]:
+                        low[node] = min(low[node], order[succ])
+                else:
+                    if low[node] == order[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component_of[member] = len(components)
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+
+        self._components = components
+        self._component_of = component_of
+        return components
+
+    def strongly_connected_components(self) -> List[List[str]]:
+        """All components, sinks first"""
+        return [[self.nodes[n] for n in component] for component in self._condense()]
+
+    def cycles(self) -> List[List[str]]:
+        """Components that form a cycle (several datasets, or one feeding itself)"""
+        return [[self.nodes[n] for n in component] for component in self._condense()
+                if self._is_cyclic(component)]
+
+    def _is_cyclic(self, component: List[int]) -> bool:
+        return len(component) > 1 or component[0] in self.successors[component[0]]
+
+    def weakly_connected_components(self) -> List[List[str]]:
+        """Groups of datasets connected by lineage in either direction, each ordered by level"""
+        levels = self._component_levels()
+        seen = [False] * len(self.nodes)
+        groups: List[List[str]] = []
+        for root in range(len(self.nodes)):
+            if seen[root]:
+                continue
+            seen[root] = True
+            members, stack = [], [root]
+            while stack:
+                node = stack.pop()
+                members.append(node)
+                for n in self.successors[node] + self.predecessors[node]:
+                    if not seen[n]:
+                        seen[n] = True
+                        stack.append(n)
+            members.sort(key=lambda n: (levels[self._component_of[n]], n))
+            groups.append([self.nodes[n] for n in members])
+        return groups
+
+    # -- Levels -----------------------------------------------------------
+
+    def _component_levels(self) -> List[int]:
+        if self._levels is None:
+            components = self._condense()
+            levels = [0] * len(components)
+            # Reverse Tarjan order visits every component after its predecessors
+            for c in range(len(components) - 1, -1, -1):
+                for node in components[c]:
+                    for pred in self.predecessors[node]:
+                        p = self._component_of[pred]
+                        if p != c and levels[p] + 1 > levels[c]:
+                            levels[c] = levels[p] + 1
+            self._levels = levels
+        return self._levels
+
+    def level(self, node_id: str) -> int:
+        """Longest path from a source dataset (members of a cycle share a level)"""
+        levels = self._component_levels()
+        return levels[self._component_of[self.index[node_id]]]
+
+    def topological_levels(self) -> List[List[str]]:
+        """Datasets grouped by level, sources first"""
+        levels = self._component_levels()
+        grouped: List[List[str]] = [[] for _ in range(max(levels) + 1)] if levels else []
+        for node, node_id in enumerate(self.nodes):
+            grouped[levels[self._component_of[node]]].append(node_id)
+        return grouped
+
+    # -- Closure ----------------------------------------------------------
+
+    def _component_edges(self, direction: str) -> List[List[int]]:
+        """Condensed DAG adjacency in one direction, cached"""
+        edges = self._component_adjacency.get(direction)
+        if edges is None:
+            components = self._condense()
+            adjacency = self.successors if direction == DOWNSTREAM else self.predecessors
+            edges = []
+            for c, component in enumerate(components):
+                targets = {self._component_of[n] for node in component for n in adjacency[node]}
+                targets.discard(c)
+                edges.append(sorted(targets))
+            self._component_adjacency[direction] = edges
+        return edges
+
+    def _reach(self, component: int, direction: str) -> int:
+        """Bitmask of components reachable from a component, memoized"""
+        memo = self._closure[direction]
+        if component in memo:
+            return memo[component]
+
+        edges = self._component_edges(direction)
+
+        # Post-order walk so every neighbour's mask exists before it is combined
+        work = [(component, 0)]
+        while work:
+            c, i = work.pop()
+            targets = edges[c]
+            while i < len(targets) and targets[i] in memo:
+                i += 1
+            if i < len(targets):
+                work.append((c, i))
+                work.append((targets[i], 0))
+                continue
+            mask = 0
+            for n in targets:
+                mask |= memo[n]
+                mask |= 1 << n
+            memo[c] = mask
+
+        return memo[component]
+
+    def _closure_of(self, node_id: str, direction: str) -> List[str]:
+        key = (node_id, direction)
+        if key in self._results:
+            return self._results[key]
+
+        node = self.index[node_id]
+        components = self._condense()
+        component = self._component_of[node]
+        mask = self._reach(component, direction)
+
+        members = [n for n in components[component] if n != node or self._is_cyclic(components[component])]
+        # Scanning the binary string is linear; peeling low bits off a big int is not
+        for c, bit in enumerate(reversed(bin(mask)[2:])):
+            if bit == '1':
+                members.extend(components[c])
+
+        levels = self._component_levels()
+        members.sort(key=lambda n: (levels[self._component_of[n]], n))
+        result = [self.nodes[n] for n in members]
+        self._results[key] = result
+        return result
+
+    def downstream_of(self, node_id: str) -> List[str]:
+        """Every dataset derived from node_id, directly or transitively, ordered by level"""
+        return self._closure_of(node_id, DOWNSTREAM)
+
+    def upstream_of(self, node_id: str) -> List[str]:
+        """Every dataset node_id is derived from, directly or transitively, ordered by level"""
+        return self._closure_of(node_id, UPSTREAM)
+
+    # -- Origins ----------------------------------------------------------
+
+    def _origins(self) -> List[FrozenSet[int]]:
+        """Source nodes feeding each component, in one pass over the condensed DAG"""
+        if self._component_origins is None:
+            components = self._condense()
+            origins: List[FrozenSet[int]] = [frozenset()] * len(components)
+            # Reverse Tarjan order visits every component after its predecessors
+            for c in range(len(components) - 1, -1, -1):
+                preds = {self._component_of[p] for node in components[c] for p in self.predecessors[node]}
+                preds.discard(c)
+                if not preds:
+                    # A source, unless it is a cycle nothing feeds
+                    origins[c] = frozenset() if self._is_cyclic(components[c]) else frozenset(components[c])
+                elif len(preds) == 1:
+                    origins[c] = origins[preds.pop()]
+                else:
+                    origins[c] = frozenset().union(*(origins[p] for p in preds))
+            self._component_origins = origins
+        return self._component_origins
+
+    def origins_of(self, node_id: str) -> List[str]:
+        """Source nodes (nothing upstream of them) that node_id is derived from, in first-seen order"""
+        node = self.index[node_id]
+        if not self.predecessors[node]:
+            return []
+        return [self.nodes[n] for n in sorted(self._origins()[self._component_of[node]])]
+
+
+class FieldRef(NamedTuple):
+    """One field of one dataset"""
+    dataset: str
+    field: str
+
+    def __str__(self) -> str:
+        return f"{self.dataset}.{self.field}"
+
+
+class FieldLineage:
+    """
+    The `field_lineage` extension compiled into a LineageGraph over
+    interned (dataset, field) pairs.
+
+    Each field's direct sources (with the transform) are indexed once, so
+    schema tables and provenance queries never rescan the edge list.
+    """
+
+    def __init__(self, field_lineage: List[dict]):
+        edges: List[Tuple[FieldRef, FieldRef]] = []
+        self.transforms: Dict[Tuple[FieldRef, FieldRef], Optional[str]] = {}
+        # Datasets with at least one derived field
+        self.derived_datasets: Set[str] = set()
+
+        # One FieldRef per distinct field, shared by every edge touching it
+        interned: Dict[Tuple[str, str], FieldRef] = {}
+
+        for entry in field_lineage:
+            up = self._field_ref(entry.get('upstream'), interned)
+            down = self._field_ref(entry.get('downstream'), interned)
+            if up is None or down is None:
+                continue
+            edges.append((up, down))
+            self.transforms.setdefault((up, down), entry.get('transform'))
+            self.derived_datasets.add(down.dataset)
+
+        self.graph = LineageGraph(edges)
+
+    @staticmethod
+    def _field_ref(value: Optional[dict], interned: Dict[Tuple[str, str], FieldRef]) -> Optional[FieldRef]:
+        if not value or not value.get('dataset') or not value.get('field'):
+            return None
+        key = (value['dataset'], value['field'])
+        ref = interned.get(key)
+        if ref is None:
+            ref = interned[key] = FieldRef(*key)
+        return ref
+
+    def __bool__(self) -> bool:
+        return len(self.graph) > 0
+
+    def __contains__(self, ref: FieldRef) -> bool:
+        return ref in self.graph
+
+    def sources(self, ref: FieldRef) -> List[Tuple[FieldRef, Optional[str]]]:
+        """Fields the field is computed from directly, with the transform of each edge"""
+        node = self.graph.index.get(ref)
+        if node is None:
+            return []
+        return [(self.graph.nodes[n], self.transforms[(self.graph.nodes[n], ref)])
+                for n in self.graph.predecessors[node]]
+
+    def provenance(self, ref: FieldRef) -> List[FieldRef]:
+        """Every field the field is derived from, directly or transitively, ordered by level"""
+        return self.graph.upstream_of(ref) if ref in self.graph else []
+
+    def impact(self, ref: FieldRef) -> List[FieldRef]:
+        """Every field derived from the field, directly or transitively, ordered by level"""
+        return self.graph.downstream_of(ref) if ref in self.graph else []
+
+    def origins(self, ref: FieldRef) -> List[FieldRef]:
+        """Source fields at the start of the field's provenance (fields with no sources of their own)"""
+        return self.graph.origins_of(ref) if ref in self.graph else []
+
+
+def partition_lineage(
+    graph: LineageGraph,
+    owner_of: Callable[[str], Optional[str]],
+    budget: int
+) -> List[LineagePartition]:
+    """
+    Split a lineage graph into diagrams of at most `budget` datasets.
+
+    Connected groups that fit are packed together; larger groups are split by
+    owning domain, and domain groups still above the budget are cut into
+    level-ordered chunks.
+    """
+    budget = max(1, budget)
+    partitions: List[LineagePartition] = []
+    packed: List[str] = []
+
+    def owners(nodes: List[str]) -> List[str]:
+        return list(dict.fromkeys(o for o in map(owner_of, nodes) if o))
+
+    def flush() -> None:
+        if packed:
+            partitions.append(LineagePartition(list(packed), owners(packed)))
+            packed.clear()
+
+    for group in graph.weakly_connected_components():
+        if len(group) <= budget:
+            if len(packed) + len(group) > budget:
+                flush()
+            packed.extend(group)
+            continue
+
+        flush()
+        by_owner: Dict[Optional[str], List[str]] = {}
+        for node_id in group:
+            by_owner.setdefault(owner_of(node_id), []).append(node_id)
+        for owner, nodes in by_owner.items():
+            chunks = [nodes[i:i + budget] for i in range(0, len(nodes), budget)]
+            for i, chunk in enumerate(chunks, 1):
+                partitions.append(LineagePartition(chunk, [owner] if owner else [], i, len(chunks)))
+
+    flush()
+    return partitions
@@ -0,0 +1,154 @@
+"""Data models and indexes for the Data Engineering converter"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, NamedTuple, Optional
+
+
+class StageRef(NamedTuple):
+    """A pipeline stage reading or writing a dataset"""
+    pipeline_id: str
+    stage_id: str
+
+
+class DatasetIndex:
+    """
+    Who produces, consumes and owns each dataset.
+
+    Built in one pass over all pipeline stages, so sections and diagrams can
+    look datasets up instead of rescanning every stage of every pipeline.
+    """
+
+    def __init__(self, domains: Dict[str, dict], pipelines: Dict[str, dict]):
+        self.stages: Dict[StageRef, dict] = {}
+        self.producers: Dict[str, List[StageRef]] = {}
+        self.consumers: Dict[str, List[StageRef]] = {}
+        # Unique datasets per pipeline, in first-seen order
+        self.pipeline_inputs: Dict[str, List[str]] = {}
+        self.pipeline_outputs: Dict[str, List[str]] = {}
+        self.domains_by_dataset: Dict[str, List[str]] = {}
+        self.domain_datasets: Dict[str, List[str]] = {}
+        # Stage input/output references per dataset, in first-seen order
+        self.reference_counts: Dict[str, int] = {}
+
+        for pip_id, pipeline in pipelines.items():
+            inputs: Dict[str, None] = {}
+            outputs: Dict[str, None] = {}
+            for stage in pipeline.get('stages', []):
+                ref = StageRef(pip_id, stage.get('id', ''))
+                self.stages[ref] = stage
+                for ds_id in stage.get('inputs', []):
+                    self.consumers.setdefault(ds_id, []).append(ref)
+                    self.reference_counts[ds_id] = self.reference_counts.get(ds_id, 0) + 1
+                    inputs[ds_id] = None
+                for ds_id in stage.get('outputs', []):
+                    self.producers.setdefault(ds_id, []).append(ref)
+                    self.reference_counts[ds_id] = self.reference_counts.get(ds_id, 0) + 1
+                    outputs[ds_id] = None
+            self.pipeline_inputs[pip_id] = list(inputs)
+            self.pipeline_outputs[pip_id] = list(outputs)
+
+        self.pipeline_domains: Dict[str, List[str]] = {}
+        for dom_id, domain in domains.items():
+            for pip_id in domain.get('pipelines', []):
+                self.pipeline_domains.setdefault(pip_id, []).append(dom_id)
+
+        for dom_id, domain in domains.items():
+            touched: Dict[str, None] = {}
+            for pip_id in domain.get('pipelines', []):
+                for ds_id in self.pipeline_inputs.get(pip_id, []) + self.pipeline_outputs.get(pip_id, []):
+                    touched[ds_id] = None
+            self.domain_datasets[dom_id] = list(touched)
+            for ds_id in touched:
+                self.domains_by_dataset.setdefault(ds_id, []).append(dom_id)
+
+    def get_producers(self, dataset_id: str) -> List[StageRef]:
+        """Stages writing the dataset"""
+        return self.producers.get(dataset_id, [])
+
+    def get_consumers(self, dataset_id: str) -> List[StageRef]:
+        """Stages reading the dataset"""
+        return self.consumers.get(dataset_id, [])
+
+    def get_domains(self, dataset_id: str) -> List[str]:
+        """Domains with a pipeline reading or writing the dataset"""
+        return self.domains_by_dataset.get(dataset_id, [])
+
+    def owning_domain(self, dataset_id: str) -> Optional[str]:
+        """Domain of the first pipeline producing the dataset, else the first domain reading it"""
+        for ref in self.get_producers(dataset_id):
+            owners = self.pipeline_domains.get(ref.pipeline_id)
+            if owners:
+                return owners[0]
+        domains = self.get_domains(dataset_id)
+        return domains[0] if domains else None
+
+    def get_domain_datasets(self, domain_id: str) -> List[str]:
+        """Datasets read or written by the domain's pipelines"""
+        return self.domain_datasets.get(domain_id, [])
+
+    def most_referenced(self, limit: int) -> List[str]:
+        """Dataset IDs with the most stage references (ties keep first-seen order)"""
+        ranked = sorted(self.reference_counts.items(), key=lambda x: x[1], reverse=True)
+        return [ds_id for ds_id, _ in ranked[:limit]]
+
+
+@dataclass
+class DatasetOperations:
+    """Contracts, checks, governance policies and observability attached to one dataset"""
+    contracts: List[dict] = field(default_factory=list)
+    checks: List[dict] = field(default_factory=list)
+    retention: List[dict] = field(default_factory=list)
+    access: List[dict] = field(default_factory=list)
+    pii_handling: List[dict] = field(default_factory=list)
+    metrics: List[dict] = field(default_factory=list)
+    slos: List[dict] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return any((self.contracts, self.checks, self.retention, self.access,
+                    self.pii_handling, self.metrics, self.slos))
+
+
+class OperationsIndex:
+    """
+    Operational metadata keyed by dataset, built in one pass over each list.
+
+    SLOs carry no dataset of their own; they are attached through their
+    linked check.
+    """
+
+    def __init__(self, contracts: List[dict], checks: List[dict],
+                 governance: dict, observability: dict):
+        self.by_dataset: Dict[str, DatasetOperations] = {}
+        check_datasets: Dict[str, str] = {}
+
+        for contract in contracts:
+            self._add(contract.get('dataset')).contracts.append(contract)
+        for check in checks:
+            self._add(check.get('dataset')).checks.append(check)
+            if check.get('id') and check.get('dataset'):
+                check_datasets[check['id']] = check['dataset']
+        for policy in governance.get('retention', []):
+            self._add(policy.get('dataset')).retention.append(policy)
+        for policy in governance.get('access', []):
+            self._add(policy.get('dataset')).access.append(policy)
+        for policy in governance.get('pii_handling', []):
+            self._add(policy.get('dataset')).pii_handling.append(policy)
+        for metric in observability.get('metrics', []):
+            self._add(metric.get('dataset')).metrics.append(metric)
+        for slo in observability.get('slos', []):
+            self._add(check_datasets.get(slo.get('linked_check', ''))).slos.append(slo)
+
+        self._empty = DatasetOperations()
+
+    def _add(self, dataset_id: Optional[str]) -> DatasetOperations:
+        if not dataset_id:
+            # Entries without a dataset are collected nowhere
+            return DatasetOperations()
+        operations = self.by_dataset.get(dataset_id)
+        if operations is None:
+            operations = self.by_dataset[dataset_id] = DatasetOperations()
+        return operations
+
+    def get(self, dataset_id: str) -> DatasetOperations:
+        """Everything attached to the dataset (empty when nothing is)"""
+        return self.by_dataset.get(dataset_id, self._empty)
@@ -0,0 +1,106 @@
+"""Compiled stage dependency graph of a data engineering pipeline"""
+
+from typing import Dict, List, Optional
+
+from .lineage import LineageGraph
+
+
+class StageGraph:
+    """
+    A pipeline's `depends_on` graph, analysed once.
+
+    Components and levels come from a LineageGraph over the stage IDs, so
+    cycles are condensed rather than breaking the ordering. Stages are
+    ordered by level (longest dependency chain), then by position in the
+    YAML; each level is a set of stages that can run in parallel.
+    """
+
+    def __init__(self, stages: List[dict]):
+        self.stages: Dict[str, dict] = {}
+        for i, stage in enumerate(stages):
+            self.stages[stage.get('id', f'stg{i}')] = stage
+        position = {stage_id: i for i, stage_id in enumerate(self.stages)}
+
+        # Known dependencies per stage (deduplicated), and references to stages not in the pipeline
+        self.dependencies: Dict[str, List[str]] = {}
+        self.unknown_dependencies: Dict[str, List[str]] = {}
+        for stage_id, stage in self.stages.items():
+            deps = list(dict.fromkeys(stage.get('depends_on', [])))
+            self.dependencies[stage_id] = [d for d in deps if d in self.stages]
+            unknown = [d for d in deps if d not in self.stages]
+            if unknown:
+                self.unknown_dependencies[stage_id] = unknown
+
+        self.graph = LineageGraph((dep, stage_id) for stage_id, deps in self.dependencies.items()
+                                  for dep in deps)
+
+        self.level: Dict[str, int] = {
+            stage_id: self.graph.level(stage_id) if stage_id in self.graph else 0
+            for stage_id in self.stages
+        }
+        self.order: List[str] = sorted(self.stages, key=lambda s: (self.level[s], position[s]))
+
+        self.levels: List[List[str]] = []
+        for stage_id in self.order:
+            if self.level[stage_id] == len(self.levels):
+                self.levels.append([])
+            self.levels[-1].append(stage_id)
+
+        self.cycles: List[List[str]] = sorted(
+            (sorted(cycle, key=position.__getitem__) for cycle in self.graph.cycles()),
+            key=lambda cycle: position[cycle[0]]
+        )
+
+        # Stages in a cycle, or waiting on one, can never start
+        blocked = {stage_id for cycle in self.cycles for stage_id in cycle}
+        for cycle in self.cycles:
+            blocked.update(self.graph.downstream_of(cycle[0]))
+        self.unreachable: List[str] = [s for s in self.order if s in blocked]
+
+        self._critical_path: Optional[List[str]] = None
+
+    @property
+    def widths(self) -> List[int]:
+        """Number of stages per level"""
+        return [len(level) for level in self.levels]
+
+    @property
+    def max_parallelism(self) -> int:
+        """Most stages that can run at once"""
+        return max(self.widths, default=0)
+
+    def duration(self, stage_id: str) -> float:
+        """Declared duration of a stage in minutes (0 when not declared)"""
+        return self.stages[stage_id].get('duration_minutes') or 0
+
+    @property
+    def has_durations(self) -> bool:
+        return any(self.duration(stage_id) for stage_id in self.stages)
+
+    def critical_path(self) -> List[str]:
+        """
+        Longest chain of stages by total declared duration.
+
+        Empty when no durations are declared or the graph has a cycle.
+        """
+        if self._critical_path is None:
+            self._critical_path = []
+            if self.has_durations and not self.cycles:
+                finish: Dict[str, float] = {}
+                via: Dict[str, Optional[str]] = {}
+                # Dependencies always sit on a lower level, so they finish first
+                for stage_id in self.order:
+                    deps = self.dependencies[stage_id]
+                    prev = max(deps, key=finish.__getitem__) if deps else None
+                    via[stage_id] = prev
+                    finish[stage_id] = (finish[prev] if prev else 0) + self.duration(stage_id)
+                stage_id: Optional[str] = max(self.order, key=finish.__getitem__)
+                while stage_id is not None:
+                    self._critical_path.append(stage_id)
+                    stage_id = via[stage_id]
+                self._critical_path.reverse()
+        return self._critical_path
+
+    def critical_path_minutes(self) -> float:
+        """Total declared duration along the critical path"""
+        return sum(self.duration(stage_id) for stage_id in self.critical_path())
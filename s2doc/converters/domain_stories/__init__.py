@@ -10,10 +10,16 @@ __author__ = "Igor Music"
 
 from .converter import DomainStoryConverter
 from .docx_converter import convert_md_to_docx
-from .comment_extractor import extract_comments_to_yaml
+from .comment_extractor import (
+    extract_comments,
+    extract_comments_to_yaml,
+    extract_comments_from_many_to_yaml,
+)
 
 __all__ = [
     "DomainStoryConverter",
     "convert_md_to_docx",
+    "extract_comments",
     "extract_comments_to_yaml",
+    "extract_comments_from_many_to_yaml",
 ]
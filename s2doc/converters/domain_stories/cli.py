@@ -13,7 +13,7 @@ from typing import Dict, Any
 from . import __version__
 from .converter import DomainStoryConverter
 from .docx_converter import convert_md_to_docx
-from .comment_extractor import extract_comments_to_yaml
+from .comment_extractor import extract_comments_to_yaml, extract_comments_from_many_to_yaml
 
 
 def cmd_review(args) -> int:
@@ -76,22 +76,56 @@ def cmd_review(args) -> int:
         return 1
 
 
+def _collect_docx_inputs(inputs) -> list:
+    """Expand DOCX file and directory arguments into a list of DOCX paths."""
+    paths = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            # Skip Word lock files (~$name.docx) left next to open documents
+            paths.extend(p for p in sorted(path.glob("*.docx")) if not p.name.startswith("~$"))
+        else:
+            paths.append(path)
+    return paths
+
+
 def cmd_extract_comments(args) -> int:
-    """Extract comments from a reviewed DOCX file to YAML."""
-    docx_path = Path(args.docx)
+    """Extract comments from one or more reviewed DOCX files to YAML."""
     yaml_path = Path(args.output)
+    docx_paths = _collect_docx_inputs(args.docx)
+
+    if not docx_paths:
+        print(f"Error: No DOCX files found in: {', '.join(args.docx)}", file=sys.stderr)
+        return 1
 
-    if not docx_path.exists():
-        print(f"Error: DOCX file not found: {docx_path}", file=sys.stderr)
+    for docx_path in docx_paths:
+        if not docx_path.exists():
+            print(f"Error: DOCX file not found: {docx_path}", file=sys.stderr)
+            return 1
+
+    single = len(docx_paths) == 1 and not Path(args.docx[0]).is_dir()
+    if args.since and not single:
+        print("Error: --since supports a single DOCX file", file=sys.stderr)
         return 1
 
     try:
-        extract_comments_to_yaml(
-            docx_path=docx_path,
-            yaml_path=yaml_path,
-            context_chars=args.context_chars,
-            include_replies=args.include_replies
-        )
+        if single:
+            extract_comments_to_yaml(
+                docx_path=docx_paths[0],
+                yaml_path=yaml_path,
+                context_chars=args.context_chars,
+                include_replies=args.include_replies,
+                since_path=Path(args.since) if args.since else None,
+                full=args.full
+            )
+        else:
+            extract_comments_from_many_to_yaml(
+                docx_paths=docx_paths,
+                yaml_path=yaml_path,
+                context_chars=args.context_chars,
+                include_replies=args.include_replies,
+                workers=args.workers
+            )
 
         print(f"\n{'='*60}")
         print(f"✓ Comments extracted successfully!")
@@ -252,6 +286,15 @@ Examples:
   # Extract comments from reviewed DOCX
   dst extract-comments docs/stories.docx docs/comments.yaml
 
+  # Merge comments from all reviewer copies in a directory
+  dst extract-comments reviews/ docs/comments.yaml --workers 8
+
+  # Only comments added or changed since the last extraction
+  dst extract-comments docs/stories.docx docs/comments-new.yaml --since docs/comments.yaml
+
+  # Same, but keep the full state so the output can be the next --since
+  dst extract-comments docs/stories.docx docs/comments-next.yaml --since docs/comments.yaml --full
+
   # Validate YAML structure
   dst validate domain-model/stories.yaml
 
@@ -291,11 +334,14 @@ For more information, visit: https://github.com/FreeSideNomad/domain-stories-too
     parser_extract = subparsers.add_parser(
         'extract-comments',
         help='Extract comments from reviewed DOCX to YAML',
-        description='Extracts comments from a Word document with domain story context mapping.'
+        description='Extracts comments from Word documents with domain story context mapping. '
+                    'Several files (or a directory of reviewer copies) are processed in '
+                    'parallel and merged into one YAML with duplicate comments removed.'
     )
     parser_extract.add_argument(
         'docx',
-        help='Path to DOCX file with comments'
+        nargs='+',
+        help='Path(s) to DOCX files with comments, or directories containing them'
     )
     parser_extract.add_argument(
         'output',
@@ -313,6 +359,23 @@ For more information, visit: https://github.com/FreeSideNomad/domain-stories-too
         default=True,
         help='Include comment replies (default: True)'
     )
+    parser_extract.add_argument(
+        '-j', '--workers',
+        type=int,
+        default=None,
+        help='Worker processes for multiple documents (default: one per CPU)'
+    )
+    parser_extract.add_argument(
+        '--since',
+        metavar='PREVIOUS_YAML',
+        help='Previous full extraction output; only new or changed comments are written'
+    )
+    parser_extract.add_argument(
+        '--full',
+        action='store_true',
+        help='With --since, write all comments marked new/changed/unchanged '
+             '(usable as the next --since)'
+    )
     parser_extract.set_defaults(func=cmd_extract_comments)
 
     # dst validate command
@@ -353,6 +416,9 @@ For more information, visit: https://github.com/FreeSideNomad/domain-stories-too
         parser.print_help()
         return 1
 
+    if args.command == 'extract-comments' and args.full and not args.since:
+        parser_extract.error("--full requires --since")
+
     # Execute command
     return args.func(args)
 
@@ -3,15 +3,21 @@ DOCX Comment Extractor
 Extracts comments from Word documents with domain story context.
 """
 
+import hashlib
+import json
 import re
 import zipfile
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from lxml import etree
 import yaml
 
+from ...utils.parallel import parallel_map
+
 W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
 
 # WordprocessingML tags
@@ -26,6 +32,16 @@ COMMENT_RANGE_END = W_NS + "commentRangeEnd"
 COMMENT_REFERENCE = W_NS + "commentReference"
 INS = W_NS + "ins"
 DEL = W_NS + "del"
+DEL_TEXT = W_NS + "delText"
+TBL = W_NS + "tbl"
+
+# Tags the streaming reader needs events for; everything else (run properties,
+# drawings, ...) is skipped by the parser and released with its paragraph
+STREAM_TAGS = (P, PSTYLE, T, DEL_TEXT, BOOKMARK_START, COMMENT_RANGE_START,
+               COMMENT_RANGE_END, INS, DEL, TBL)
+
+# Inline story marker emitted by the markdown converter, e.g. "Story ID: `dst_xxx`"
+STORY_ID_RE = re.compile(r"Story ID\s*[:：]\s*`?(dst_[A-Za-z0-9_\-]+)`?")
 
 
 @dataclass
@@ -39,7 +55,12 @@ class StoryContext:
 
 @dataclass
 class CommentSelection:
-    """Represents a comment and its selected text."""
+    """Represents a comment and its selected text.
+
+    start_index/end_index are character offsets into the selection buffer, which
+    only counts text while some comment range is open. They are not positions in
+    the document; they only order and measure selections relative to each other.
+    """
     comment_id: int
     selection_text: str = ""
     story_context: StoryContext = field(default_factory=StoryContext)
@@ -68,134 +89,228 @@ def _text_of(node) -> str:
     return "".join(texts)
 
 
-def _iter_document_sequence(doc_root):
+@dataclass
+class _ParagraphFrame:
+    """State of a paragraph that is still being streamed."""
+    text_before: Optional[str]
+    texts: List[str] = field(default_factory=list)
+    is_heading: bool = False
+    bookmark_seen: bool = False
+    # (selection, bookmark seen before its start) for ranges starting in this paragraph
+    pending_starts: List[Tuple[CommentSelection, bool]] = field(default_factory=list)
+    # selections whose range ends in this paragraph
+    pending_ends: List[CommentSelection] = field(default_factory=list)
+
+
+class _TextBuffer:
     """
-    Iterate in a stable document order over child elements that affect reading flow.
-    Yields (index, element).
+    Append-only buffer of selected text addressed by buffer offsets (text outside
+    comment ranges is never appended). Chunks are kept as written and only joined
+    when a range is sliced.
     """
-    i = 0
-    for elem in doc_root.iter():
-        if elem.tag in {P, R, T, BOOKMARK_START, BOOKMARK_END, COMMENT_RANGE_START,
-                        COMMENT_RANGE_END, COMMENT_REFERENCE, INS, DEL}:
-            yield i, elem
-            i += 1
-
-
-def _get_style_val(p_elem) -> Optional[str]:
-    """Get paragraph style value."""
-    pst = p_elem.find("./" + W_NS + "pPr/" + PSTYLE)
-    if pst is not None:
-        return pst.get(W_NS + "val") or pst.get("{" + PSTYLE.split('}')[0].strip('{') + "}" + "val")
-    return None
 
-
-def _nearest_story_info(doc_root, up_to_index: int) -> StoryContext:
-    """
-    Look backward from up_to_index for the most recent story_id + title.
-    - Prefer a w:bookmarkStart whose name starts with "dst_...".
-    - Fallback: inline 'Story ID: dst_xxx' detection.
-    - Also capture nearest Heading 2 text.
+    def __init__(self):
+        self._chunks: List[str] = []
+        self._starts: List[int] = []
+        self.offset = 0
+
+    def append(self, text: str) -> None:
+        self._chunks.append(text)
+        self._starts.append(self.offset)
+        self.offset += len(text)
+
+    def slice(self, start: int, end: int) -> str:
+        """Return the text between two absolute offsets."""
+        if not self._chunks or end <= start:
+            return ""
+        first = max(bisect_right(self._starts, start) - 1, 0)
+        last = bisect_left(self._starts, end)
+        text = "".join(self._chunks[first:last])
+        base = self._starts[first]
+        return text[start - base:end - base]
+
+    def clear(self) -> None:
+        """Drop buffered text; offsets keep counting from the current position."""
+        self._chunks.clear()
+        self._starts.clear()
+
+
+def _release(elem) -> None:
+    """Free a fully processed element and the already processed siblings before it."""
+    elem.clear()
+    parent = elem.getparent()
+    if parent is not None:
+        while elem.getprevious() is not None:
+            del parent[0]
+
+
+def _collect_comment_selections(
+    source,
+    comment_ids: Optional[Set[int]] = None
+) -> Dict[int, CommentSelection]:
     """
-    story_id = None
-    story_title = None
-    story_id_source = None
-    nearest_heading_text = None
-
-    # Traverse backward
-    for i, elem in reversed(list(_iter_document_sequence(doc_root))):
-        if i > up_to_index:
-            continue
-
-        # Heading text (kept as nearest regardless of story)
-        if elem.tag == P:
-            style = _get_style_val(elem)
-            if style and style.lower().startswith("heading"):
-                if nearest_heading_text is None:
-                    nearest_heading_text = _text_of(elem)
-
-            # Inline "Story ID" fallback
-            if story_id is None:
-                txt = _text_of(elem)
-                m = re.search(r"Story ID\s*[:：]\s*`?(dst_[A-Za-z0-9_\-]+)`?", txt)
-                if m:
-                    story_id = m.group(1)
-                    story_id_source = "inline"
-
-        # Bookmark preferred
-        if elem.tag == BOOKMARK_START and story_id is None:
-            name = elem.get(W_NS + "name") or elem.get("w:name")
-            if name and name.startswith("dst_"):
-                story_id = name
-                story_id_source = "bookmark"
-
-        if story_id is not None and nearest_heading_text is not None:
-            break
-
-    # If we found an H2 near this story, use that as story_title
-    story_title = nearest_heading_text
-
-    return StoryContext(
-        story_id=story_id,
-        story_title=story_title,
-        nearest_heading_text=nearest_heading_text,
-        story_id_source=story_id_source or "unknown",
-    )
-
-
-def _collect_comment_selections(doc_root) -> Dict[int, CommentSelection]:
-    """
-    Locate comment ranges and collect the selected text between start/end markers.
+    Stream word/document.xml, locate comment ranges and collect the selected text
+    between start/end markers.
     Returns a mapping comment_id -> CommentSelection
+
+    If comment_ids is given, only those ranges are collected and streaming stops
+    as soon as all of them are resolved.
+
+    The document is read with iterparse and every paragraph is released as soon as
+    it ends, so peak memory depends on the largest paragraph rather than the
+    document size. Story context is tracked as running state:
+    - the most recent w:bookmarkStart named "dst_..." or inline 'Story ID: dst_xxx'
+      paragraph provides the story_id (whichever came last wins)
+    - the most recent heading paragraph provides the story title
+    Paragraph text is only known when the paragraph ends, so comment ranges that
+    start or end inside a paragraph are completed at that point.
+
+    Selected text is written once to a flattened text buffer (only while some range
+    is open) and each range records its start/end offsets into it. Selections are
+    sliced out once every open range has closed, so overlapping comments cost the
+    same as disjoint ones and the buffer never outlives the ranges that need it.
     """
     active_ranges: Dict[int, CommentSelection] = {}
     selections: Dict[int, CommentSelection] = {}
+    closed_ranges: List[CommentSelection] = []
+    buffer = _TextBuffer()
+    frames: List[_ParagraphFrame] = []
     prev_para_text = None
     last_para_text = None
 
-    for idx, elem in _iter_document_sequence(doc_root):
-        if elem.tag == P:
-            prev_para_text = last_para_text
-            last_para_text = _text_of(elem)
-
-        if elem.tag == COMMENT_RANGE_START:
-            cid = int(elem.get(W_NS + "id") or elem.get("w:id"))
-            ctx = _nearest_story_info(doc_root, up_to_index=idx)
-            active_ranges[cid] = CommentSelection(
-                comment_id=cid,
-                selection_text="",
-                story_context=ctx,
-                start_index=idx,
-                para_text_before=prev_para_text
-            )
-
-        if elem.tag == COMMENT_RANGE_END:
-            cid = int(elem.get(W_NS + "id") or elem.get("w:id"))
-            sel = active_ranges.get(cid)
-            if sel:
-                sel.end_index = idx
-                sel.para_text_after = last_para_text
-                selections[cid] = sel
-                active_ranges.pop(cid, None)
-
-        # While inside an active range, collect visible text
-        if any(k in active_ranges for k in list(active_ranges.keys())):
-            if elem.tag in {R, T}:
-                t = _text_of(elem)
-                for sel in active_ranges.values():
-                    sel.selection_text += t
+    story_id = None
+    story_id_source = None
+    nearest_heading_text = None
 
-            # Include text inside tracked changes
-            if elem.tag in {INS, DEL}:
-                t = _text_of(elem)
-                for sel in active_ranges.values():
-                    if elem.tag == INS:
-                        sel.selection_text += f"[+{t}+]"
+    context = etree.iterparse(source, events=("start", "end"), tag=STREAM_TAGS)
+    for event, elem in context:
+        tag = elem.tag
+
+        if event == "start":
+            if tag == P:
+                frames.append(_ParagraphFrame(text_before=last_para_text))
+
+            elif tag == PSTYLE:
+                style = elem.get(W_NS + "val") or elem.get("w:val")
+                if frames and style and style.lower().startswith("heading"):
+                    frames[-1].is_heading = True
+
+            # Bookmark preferred
+            elif tag == BOOKMARK_START:
+                name = elem.get(W_NS + "name") or elem.get("w:name")
+                if name and name.startswith("dst_"):
+                    story_id = name
+                    story_id_source = "bookmark"
+                    if frames:
+                        frames[-1].bookmark_seen = True
+
+            elif tag == COMMENT_RANGE_START:
+                cid = int(elem.get(W_NS + "id") or elem.get("w:id"))
+                if comment_ids is not None and cid not in comment_ids:
+                    continue
+                sel = CommentSelection(
+                    comment_id=cid,
+                    selection_text="",
+                    story_context=StoryContext(
+                        story_id=story_id,
+                        story_title=nearest_heading_text,
+                        nearest_heading_text=nearest_heading_text,
+                        story_id_source=story_id_source or "unknown",
+                    ),
+                    start_index=buffer.offset,
+                    para_text_before=frames[-1].text_before if frames else prev_para_text
+                )
+                if frames:
+                    frames[-1].pending_starts.append((sel, frames[-1].bookmark_seen))
+                active_ranges[cid] = sel
+
+            elif tag == COMMENT_RANGE_END:
+                cid = int(elem.get(W_NS + "id") or elem.get("w:id"))
+                sel = active_ranges.pop(cid, None)
+                if sel:
+                    sel.end_index = buffer.offset
+                    if frames:
+                        frames[-1].pending_ends.append(sel)
                     else:
-                        sel.selection_text += f"[-{t}-]"
+                        sel.para_text_after = last_para_text
+                    selections[cid] = sel
+                    closed_ranges.append(sel)
+                    if not active_ranges:
+                        _slice_selections(buffer, closed_ranges)
 
+            # Include text inside tracked changes
+            elif tag == INS and active_ranges:
+                buffer.append("[+")
+            elif tag == DEL and active_ranges:
+                buffer.append("[-")
+
+            continue
+
+        # end events
+        if tag in (T, DEL_TEXT):
+            text = elem.text
+            if text:
+                if tag == T:
+                    for frame in frames:
+                        frame.texts.append(text)
+                # While inside an active range, collect visible text
+                if active_ranges:
+                    buffer.append(text)
+
+        elif tag == INS and active_ranges:
+            buffer.append("+]")
+        elif tag == DEL and active_ranges:
+            buffer.append("-]")
+
+        elif tag == P:
+            frame = frames.pop()
+            text = "".join(frame.texts)
+            m = STORY_ID_RE.search(text)
+
+            for sel, bookmark_before in frame.pending_starts:
+                ctx = sel.story_context
+                if frame.is_heading:
+                    ctx.story_title = ctx.nearest_heading_text = text
+                # Inline "Story ID" fallback, unless a bookmark came after the paragraph start
+                if m and not bookmark_before:
+                    ctx.story_id = m.group(1)
+                    ctx.story_id_source = "inline"
+            for sel in frame.pending_ends:
+                sel.para_text_after = text
+
+            # Heading text (kept as nearest regardless of story)
+            if frame.is_heading:
+                nearest_heading_text = text
+            if m and not frame.bookmark_seen:
+                story_id = m.group(1)
+                story_id_source = "inline"
+
+            prev_para_text, last_para_text = last_para_text, text
+            # Separate paragraphs inside multi-paragraph selections
+            if active_ranges:
+                buffer.append("\n")
+            if not frames:
+                _release(elem)
+                if comment_ids is not None and len(selections) == len(comment_ids):
+                    break
+
+        elif tag == TBL and not frames:
+            _release(elem)
+
+    del context
+    # Ranges left open at the end of the document are not reported
+    _slice_selections(buffer, closed_ranges)
     return selections
 
 
+def _slice_selections(buffer: _TextBuffer, closed_ranges: List[CommentSelection]) -> None:
+    """Fill in selection text for closed ranges and release the buffered text."""
+    for sel in closed_ranges:
+        sel.selection_text = buffer.slice(sel.start_index, sel.end_index)
+    closed_ranges.clear()
+    buffer.clear()
+
+
 def _load_comments_xml(zf: zipfile.ZipFile) -> List[CommentEntry]:
     """Load comments from the Word document's comments.xml."""
     try:
@@ -243,11 +358,165 @@ def _group_comments_with_replies(comments: List[CommentEntry]) -> List[Dict]:
     return roots
 
 
+def _change_fingerprint(entry: Dict) -> Tuple:
+    """Fields that identify a new revision of a comment thread."""
+    replies = tuple((r.get("author"), r.get("date"), r.get("text"))
+                    for r in entry.get("replies") or [])
+    return entry.get("author"), entry.get("date"), entry.get("comment_text"), replies
+
+
+def extract_comments(
+    docx_path: Path,
+    context_chars: int = 220,
+    include_replies: bool = True,
+    since: Optional[Dict] = None,
+    full: bool = False
+) -> Dict:
+    """
+    Extract comments + selection text from one DOCX and map them to the nearest
+    domain story context. The document is opened and parsed exactly once.
+
+    With a previous extraction (since), comments are compared by comment_id on
+    author, date, text and replies. Selection work is only done for new or changed
+    comments, and the document body is not read at all when nothing changed.
+
+    Only the new and changed comments are returned unless full is set, and such
+    output is marked 'delta: true'. A delta is not a complete state, so it cannot
+    be the since input of the next run; chain runs with full output (or a plain
+    extraction) instead.
+
+    Args:
+        docx_path: Path to input DOCX file with comments
+        context_chars: Number of context characters to include
+        include_replies: Whether to include comment replies
+        since: Previously extracted output to diff against
+        full: With since, return every comment marked new/changed/unchanged
+              instead of only the new and changed ones
+
+    Raises:
+        ValueError: If since is a delta output
+
+    Returns:
+        Dictionary with 'document' (file name) and 'comments' (list of entries).
+        With since, entries carry a 'change' marker and comments that disappeared
+        are listed under 'removed_comment_ids'.
+    """
+    docx_path = Path(docx_path)
+
+    if not docx_path.exists():
+        raise FileNotFoundError(f"DOCX not found: {docx_path}")
+
+    def _trim(s: Optional[str]) -> Optional[str]:
+        if not s:
+            return None
+        s = re.sub(r"\s+", " ", s).strip()
+        if len(s) > context_chars:
+            return s[:context_chars] + "…"
+        return s
+
+    if since is not None and since.get("delta"):
+        raise ValueError("previous extraction only holds new and changed comments; "
+                         "use a full extraction (written without --since, or with --full)")
+
+    previous = {e["comment_id"]: e for e in since.get("comments", [])} if since else {}
+
+    with zipfile.ZipFile(docx_path, "r") as zf:
+        # Load all comments
+        comments = _load_comments_xml(zf)
+
+        # Build output records (selection fields are filled in below)
+        if include_replies:
+            grouped = _group_comments_with_replies(comments)
+        else:
+            grouped = [{"comment": c, "replies": []} for c in comments if c.parent_id is None]
+
+        items: List[Dict] = []
+        for g in grouped:
+            c = g["comment"]
+            entry = {
+                "story_id": None,
+                "story_title": None,
+                "comment_id": c.id,
+                "author": c.author,
+                "date": c.date,
+                "selection_text": None,
+                "context_before": None,
+                "context_after": None,
+                "comment_text": _trim(c.text),
+            }
+
+            if include_replies and g.get("replies"):
+                entry["replies"] = [
+                    {
+                        "author": r.author,
+                        "date": r.date,
+                        "text": _trim(r.text),
+                    }
+                    for r in g["replies"]
+                ]
+
+            if since is not None:
+                prev = previous.get(c.id)
+                if prev is None:
+                    entry["change"] = "new"
+                elif _change_fingerprint(prev) != _change_fingerprint(entry):
+                    entry["change"] = "changed"
+                else:
+                    if full:
+                        items.append(dict(prev, change="unchanged"))
+                    continue
+
+            items.append(entry)
+
+        # Stream the main document and collect comment selections
+        wanted = {e["comment_id"] for e in items if e.get("change") != "unchanged"}
+        selections: Dict[int, CommentSelection] = {}
+        if wanted:
+            with zf.open("word/document.xml") as f:
+                selections = _collect_comment_selections(
+                    f, wanted if since is not None else None
+                )
+
+    for entry in items:
+        sel = selections.get(entry["comment_id"])
+        if sel and entry.get("change") != "unchanged":
+            entry["story_id"] = sel.story_context.story_id
+            entry["story_title"] = sel.story_context.story_title
+            entry["selection_text"] = _trim(sel.selection_text)
+            entry["context_before"] = _trim(sel.para_text_before)
+            entry["context_after"] = _trim(sel.para_text_after)
+
+    # Sort by story_id then comment_id for stable ordering
+    items.sort(key=lambda x: (x.get("story_id") or "", x.get("comment_id") or -1))
+
+    out = {"document": docx_path.name}
+    if since is not None and not full:
+        out["delta"] = True
+    out["comments"] = items
+
+    if since is not None:
+        current_ids = {g["comment"].id for g in grouped}
+        removed = sorted(cid for cid in previous if cid not in current_ids)
+        if removed:
+            out["removed_comment_ids"] = removed
+
+    return out
+
+
+def _write_yaml(out: Dict, yaml_path: Path) -> None:
+    """Write extraction output as YAML."""
+    yaml_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(yaml_path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(out, f, sort_keys=False, allow_unicode=True)
+
+
 def extract_comments_to_yaml(
     docx_path: Path,
     yaml_path: Path,
     context_chars: int = 220,
-    include_replies: bool = True
+    include_replies: bool = True,
+    since_path: Optional[Path] = None,
+    full: bool = False
 ) -> None:
     """
     Extract comments + selection text and map to nearest domain story context.
@@ -258,6 +527,10 @@ def extract_comments_to_yaml(
         yaml_path: Path to output YAML file
         context_chars: Number of context characters to include
         include_replies: Whether to include comment replies
+        since_path: Previous full output of this function; only new or changed
+                    comments are extracted and written (see extract_comments)
+        full: With since_path, write all comments with a 'change' marker, so the
+              output can be the since_path of the next run
 
     Output YAML shape:
     - document: <docx filename>
@@ -276,77 +549,106 @@ def extract_comments_to_yaml(
               date: "..."
               text: "..."
     """
-    docx_path = Path(docx_path)
     yaml_path = Path(yaml_path)
 
-    if not docx_path.exists():
-        raise FileNotFoundError(f"DOCX not found: {docx_path}")
+    since = None
+    if since_path is not None:
+        since_path = Path(since_path)
+        if not since_path.exists():
+            raise FileNotFoundError(f"Previous extraction not found: {since_path}")
+        with open(since_path, "r", encoding="utf-8") as f:
+            since = yaml.safe_load(f) or {}
 
-    with zipfile.ZipFile(docx_path, "r") as zf:
-        # Parse the main document
-        with zf.open("word/document.xml") as f:
-            doc_tree = etree.parse(f)
-        doc_root = doc_tree.getroot()
+    out = extract_comments(docx_path, context_chars, include_replies, since=since, full=full)
+    _write_yaml(out, yaml_path)
 
-        # Collect comment selections
-        selections = _collect_comment_selections(doc_root)
+    if since is None:
+        print(f"✓ Extracted {len(out['comments'])} comments to: {yaml_path}")
+    else:
+        changed = sum(1 for e in out["comments"] if e["change"] != "unchanged")
+        print(f"✓ Extracted {changed} new or changed comments to: {yaml_path}")
 
-        # Load all comments
-        comments = _load_comments_xml(zf)
 
-    # Build output records
-    if include_replies:
-        grouped = _group_comments_with_replies(comments)
-    else:
-        grouped = [{"comment": c, "replies": []} for c in comments if c.parent_id is None]
+def comment_hash(entry: Dict) -> str:
+    """Stable hash identifying the same comment across reviewer copies."""
+    key = (entry.get("story_id"), entry.get("selection_text"),
+           entry.get("comment_text"), entry.get("author"))
+    return hashlib.sha1(json.dumps(key, ensure_ascii=False).encode("utf-8")).hexdigest()[:16]
 
-    def _trim(s: Optional[str]) -> Optional[str]:
-        if not s:
-            return None
-        s = re.sub(r"\s+", " ", s).strip()
-        if len(s) > context_chars:
-            return s[:context_chars] + "…"
-        return s
 
-    items: List[Dict] = []
-    for g in grouped:
-        c = g["comment"]
-        sel = selections.get(c.id)
-
-        entry = {
-            "story_id": sel.story_context.story_id if sel else None,
-            "story_title": sel.story_context.story_title if sel else None,
-            "comment_id": c.id,
-            "author": c.author,
-            "date": c.date,
-            "selection_text": _trim(sel.selection_text if sel else None),
-            "context_before": _trim(sel.para_text_before if sel else None),
-            "context_after": _trim(sel.para_text_after if sel else None),
-            "comment_text": _trim(c.text),
-        }
-
-        if include_replies and g.get("replies"):
-            entry["replies"] = [
-                {
-                    "author": r.author,
-                    "date": r.date,
-                    "text": _trim(r.text),
-                }
-                for r in g["replies"]
-            ]
-
-        items.append(entry)
+def merge_extractions(extractions: List[Dict]) -> Dict:
+    """
+    Merge per-document extractions into one result.
 
-    # Sort by story_id then comment_id for stable ordering
+    Identical comments (same story, selection, text and author) are kept once and
+    list every document they were found in under 'sources'. Replies from all
+    copies are combined without duplicates.
+
+    Args:
+        extractions: Outputs of extract_comments, in input order
+
+    Returns:
+        Dictionary with 'documents' and deduplicated 'comments'
+    """
+    merged: Dict[str, Dict] = {}
+
+    for extraction in extractions:
+        document = extraction["document"]
+        for entry in extraction["comments"]:
+            key = comment_hash(entry)
+            existing = merged.get(key)
+            if existing is None:
+                merged[key] = dict(entry, comment_hash=key, sources=[document])
+                continue
+
+            if document not in existing["sources"]:
+                existing["sources"].append(document)
+            replies = entry.get("replies")
+            if replies:
+                known = {(r["author"], r["text"]) for r in existing.get("replies", [])}
+                for reply in replies:
+                    if (reply["author"], reply["text"]) not in known:
+                        existing.setdefault("replies", []).append(reply)
+                        known.add((reply["author"], reply["text"]))
+
+    items = list(merged.values())
     items.sort(key=lambda x: (x.get("story_id") or "", x.get("comment_id") or -1))
 
-    out = {
-        "document": docx_path.name,
+    return {
+        "documents": [e["document"] for e in extractions],
         "comments": items,
     }
 
-    yaml_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(yaml_path, "w", encoding="utf-8") as f:
-        yaml.safe_dump(out, f, sort_keys=False, allow_unicode=True)
 
-    print(f"✓ Extracted {len(items)} comments to: {yaml_path}")
+def extract_comments_from_many_to_yaml(
+    docx_paths: List[Path],
+    yaml_path: Path,
+    context_chars: int = 220,
+    include_replies: bool = True,
+    workers: Optional[int] = None
+) -> None:
+    """
+    Extract comments from several reviewer copies in a worker pool and write one
+    merged YAML file (see merge_extractions).
+
+    Args:
+        docx_paths: Paths to DOCX files with comments
+        yaml_path: Path to output YAML file
+        context_chars: Number of context characters to include
+        include_replies: Whether to include comment replies
+        workers: Worker processes (None = one per CPU)
+    """
+    yaml_path = Path(yaml_path)
+    docx_paths = [Path(p) for p in docx_paths]
+
+    for docx_path in docx_paths:
+        if not docx_path.exists():
+            raise FileNotFoundError(f"DOCX not found: {docx_path}")
+
+    extract = partial(extract_comments, context_chars=context_chars,
+                      include_replies=include_replies)
+    out = merge_extractions(parallel_map(extract, docx_paths, workers))
+    _write_yaml(out, yaml_path)
+
+    print(f"✓ Extracted {len(out['comments'])} unique comments "
+          f"from {len(docx_paths)} documents to: {yaml_path}")
@@ -7,6 +7,7 @@ Uses custom PIL renderer for sequence diagrams and Graphviz for flow diagrams.
 import graphviz
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
+from ...utils.text import wrap_lines
 from .sequence_diagram import SequenceDiagramRenderer
 
 
@@ -37,30 +38,7 @@ class DiagramRenderer:
         Returns:
             Text with newlines inserted at word boundaries
         """
-        if len(text) <= max_width:
-            return text
-
-        words = text.split()
-        lines = []
-        current_line = []
-        current_length = 0
-
-        for word in words:
-            word_length = len(word)
-            # +1 for space
-            if current_length + word_length + (1 if current_line else 0) <= max_width:
-                current_line.append(word)
-                current_length += word_length + (1 if len(current_line) > 1 else 0)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
-                current_length = word_length
-
-        if current_line:
-            lines.append(' '.join(current_line))
-
-        return '\\n'.join(lines)
+        return '\\n'.join(wrap_lines(text, max_width))
 
     def generate_sequence_diagram(
         self,
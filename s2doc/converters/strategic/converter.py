@@ -1,24 +1,49 @@
 """Main converter class for Strategic DDD YAML to Markdown"""
 
-from typing import List, Optional
+from pathlib import Path
+from typing import Dict, List, Optional
+from ...utils.cache import BuildCache, content_hash
+from ...utils.links import rewrite_anchor_links
+from ...utils.parallel import parallel_map
+from ...utils.text import escape_markdown, humanize_snake_case
 from .models import (
     EntityResolver,
     generate_anchor,
     generate_link,
     format_boolean,
     generate_table,
-    escape_markdown,
-    safe_get,
-    humanize_relationship_type
+    safe_get
 )
 
+# Architecture diagrams with more nodes than this are paginated into a domain
+# overview plus one drill-down per domain (Mermaid struggles past a few hundred)
+DEFAULT_DIAGRAM_NODE_BUDGET = 150
+
+_ARCHITECTURE_CLASS_DEFS = [
+    "    classDef systemStyle fill:#e1f5ff,stroke:#01579b,stroke-width:3px,color:#000",
+    "    classDef coreStyle fill:#c8e6c9,stroke:#2e7d32,stroke-width:2px,color:#000",
+    "    classDef supportingStyle fill:#fff9c4,stroke:#f57f17,stroke-width:2px,color:#000",
+    "    classDef genericStyle fill:#f5f5f5,stroke:#616161,stroke-width:2px,color:#000",
+    "    classDef bcStyle fill:#bbdefb,stroke:#1976d2,stroke-width:1px,color:#000",
+    "    classDef bffStyle fill:#ffe0b2,stroke:#e65100,stroke-width:2px,color:#000",
+    "    classDef bffIfStyle fill:#fff3e0,stroke:#ef6c00,stroke-width:1px,color:#000",
+]
+
 
 class StrategicDDDConverter:
     """Convert Strategic DDD YAML to Markdown"""
 
-    def __init__(self, yaml_data: dict):
+    def __init__(
+        self,
+        yaml_data: dict,
+        diagram_node_budget: int = DEFAULT_DIAGRAM_NODE_BUDGET,
+        tactical_docs: Optional[Dict[str, str]] = None
+    ):
         self.system = yaml_data['system']
         self.resolver = EntityResolver(self.system)
+        self.diagram_node_budget = diagram_node_budget
+        # Bounded context ID -> file with its tactical design (workspace mode)
+        self.tactical_docs = tactical_docs or {}
 
     def convert_to_markdown(self) -> str:
         """Generate complete markdown document"""
@@ -34,6 +59,186 @@ class StrategicDDDConverter:
         ]
         return "\n\n".join(filter(None, sections))
 
+    def convert_to_files(
+        self,
+        output_dir: str,
+        overview_name: str,
+        workers: Optional[int] = None,
+        cache: Optional[BuildCache] = None
+    ) -> List[Path]:
+        """
+        Generate split documentation: an overview page plus one file per domain.
+
+        The overview holds the header, index, architecture diagram, domains table,
+        BFF scopes and the relationships table. Each domain file holds the domain,
+        its nested bounded contexts and the context mappings grouped under it.
+        Links are pointed at the right file using one global anchor map.
+
+        Domain files are rendered in a worker pool; each worker receives this
+        converter and the anchor map once. With a cache, a domain whose subtree
+        hash is unchanged (and whose file still exists) is skipped. The hash
+        covers the files of the anchors the subtree refers to, not the whole
+        anchor map, so moving an unrelated ID does not re-render the page.
+
+        Args:
+            output_dir: Directory to write into
+            overview_name: File name of the overview page (e.g. "system.md")
+            workers: Worker processes (None = one per CPU)
+            cache: Build cache used to skip unchanged domains
+
+        Returns:
+            Paths of the files that were (re)written
+        """
+        output_dir = Path(output_dir)
+        anchor_map = self.build_anchor_map(overview_name)
+        written = []
+
+        overview = rewrite_anchor_links(self.generate_overview(), overview_name, anchor_map)
+        overview_path = output_dir / overview_name
+        with open(overview_path, 'w', encoding='utf-8') as f:
+            f.write(overview)
+        written.append(overview_path)
+
+        # Only re-render domains whose subtree (or the files of the anchors it links to) changed
+        dirty = []
+        hashes = {}
+        for domain in self.system.get('domains', []):
+            domain_id = domain['id']
+            subtree = self._domain_subtree(domain_id)
+            hashes[domain_id] = content_hash([subtree, overview_name, self._linked_anchors(subtree, anchor_map)])
+            path = output_dir / self.domain_filename(domain_id)
+            if cache is not None and path.exists() and \
+                    cache.get('strategic_domains', str(path)) == hashes[domain_id]:
+                continue
+            dirty.append(domain_id)
+
+        pages = parallel_map(
+            _render_domain_file, dirty, workers,
+            initializer=_init_split_worker,
+            initargs=(self, overview_name, anchor_map)
+        )
+
+        for domain_id, markdown in zip(dirty, pages):
+            path = output_dir / self.domain_filename(domain_id)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(markdown)
+            written.append(path)
+
+        if cache is not None:
+            for domain in self.system.get('domains', []):
+                path = output_dir / self.domain_filename(domain['id'])
+                cache.put('strategic_domains', str(path), hashes[domain['id']])
+
+        return written
+
+    def generate_overview(self) -> str:
+        """Generate the overview page of split output"""
+        domain_mapping_ids = {
+            m.get('id') for mappings in self.resolver.mappings_by_domain.values() for m in mappings
+        }
+        unassigned_mappings = [
+            m for m in self.system.get('context_mappings', []) if m.get('id') not in domain_mapping_ids
+        ]
+
+        sections = [
+            self._generate_header(),
+            self._generate_index(),
+            self._generate_architecture_diagram(include_drilldowns=False),
+            self._generate_domains_table(),
+            self._generate_bff_scopes(),
+            self._generate_context_mappings_table(),
+            self._generate_context_mappings_details(unassigned_mappings)
+        ]
+        return "\n\n".join(filter(None, sections))
+
+    def generate_domain_page(self, domain_id: str, overview_name: str,
+                             anchor_map: Optional[Dict[str, str]] = None) -> str:
+        """Generate the split output page for one domain, with links resolved (anchor_map is built if not given)"""
+        domain = self.resolver.get_domain(domain_id)
+        mappings = self.resolver.get_mappings_for_domain(domain_id)
+        system_name = self.system.get('name', 'System')
+
+        sections = [
+            f"[← {system_name}]({overview_name})",
+            self._generate_single_domain(domain),
+        ]
+        if self.is_architecture_paginated():
+            sections.append(f"### Architecture\n\n{self._generate_domain_drilldown_diagram(domain)}")
+        if mappings:
+            sections.append(self._generate_context_mappings_table(mappings, heading="## Context Mappings"))
+            sections.append(self._generate_context_mappings_details(mappings))
+
+        markdown = "\n\n".join(filter(None, sections))
+        if anchor_map is None:
+            anchor_map = self.build_anchor_map(overview_name)
+        return rewrite_anchor_links(markdown, self.domain_filename(domain_id), anchor_map)
+
+    @staticmethod
+    def domain_filename(domain_id: str) -> str:
+        """File name of a domain page in split output"""
+        return f"{domain_id}.md"
+
+    def build_anchor_map(self, overview_name: str) -> Dict[str, str]:
+        """Map every anchor ID to the split output file that defines it"""
+        anchor_map: Dict[str, str] = {}
+
+        for domain in self.system.get('domains', []):
+            domain_file = self.domain_filename(domain['id'])
+            anchor_map.setdefault(domain['id'], domain_file)
+            for context in self.resolver.get_contexts_for_domain(domain['id']):
+                anchor_map.setdefault(context['id'], domain_file)
+            for mapping in self.resolver.get_mappings_for_domain(domain['id']):
+                anchor_map.setdefault(mapping.get('id', ''), domain_file)
+
+        for entity in (self.system.get('bff_scopes', []) + self.system.get('bff_interfaces', []) +
+                       self.system.get('context_mappings', [])):
+            anchor_map.setdefault(entity.get('id', ''), overview_name)
+
+        return anchor_map
+
+    @staticmethod
+    def _linked_anchors(subtree: list, anchor_map: Dict[str, str]) -> Dict[str, str]:
+        """
+        File of every anchor ID referenced anywhere in a domain subtree.
+
+        A page can only link to IDs it is rendered from, so this is all of the
+        anchor layout the page depends on.
+        """
+        linked: Dict[str, str] = {}
+        stack = [subtree]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                stack.extend(node.values())
+            elif isinstance(node, (list, tuple)):
+                stack.extend(node)
+            elif isinstance(node, str) and node in anchor_map:
+                linked[node] = anchor_map[node]
+        return dict(sorted(linked.items()))
+
+    def _domain_subtree(self, domain_id: str) -> list:
+        """Everything a domain page is rendered from"""
+        contexts = self.resolver.get_contexts_for_domain(domain_id)
+        mappings = list(self.resolver.get_mappings_for_domain(domain_id))
+        for context in contexts:
+            # Relationship lists show mappings owned by other domains, too
+            mappings += self.resolver.get_downstream_mappings(context['id'])
+
+        # Links show the names of counterpart contexts
+        counterpart_ids = sorted({
+            m.get(side) for m in mappings
+            for side in ('upstream_context', 'downstream_context') if m.get(side)
+        })
+        counterparts = [self.resolver.get_context(cid) for cid in counterpart_ids]
+        counterpart_domains = sorted({c.get('domain_ref') for c in counterparts if c and c.get('domain_ref')})
+
+        return [self.system.get('name'), self.resolver.get_domain(domain_id),
+                contexts, mappings, counterparts,
+                [self.tactical_docs.get(context['id']) for context in contexts],
+                # Drill-downs label collapsed edges with the other domains' names
+                [(self.resolver.get_domain(did) or {}).get('name') for did in counterpart_domains],
+                self.is_architecture_paginated()]
+
     def _generate_header(self) -> str:
         """Generate system header section"""
         system_name = self.system.get('name', 'System')
@@ -80,12 +285,10 @@ class StrategicDDDConverter:
                 lines.append(f"- {generate_link(bff_id, bff_name)}")
 
                 # List interfaces under this BFF
-                bff_interfaces = self.system.get('bff_interfaces', [])
-                for bff_if in bff_interfaces:
-                    if bff_if.get('bff_scope_ref') == bff_id:
-                        bff_if_id = bff_if['id']
-                        bff_if_name = bff_if.get('name', '')
-                        lines.append(f"  - {generate_link(bff_if_id, bff_if_name)}")
+                for bff_if in self.resolver.get_interfaces_for_bff_scope(bff_id):
+                    bff_if_id = bff_if['id']
+                    bff_if_name = bff_if.get('name', '')
+                    lines.append(f"  - {generate_link(bff_if_id, bff_if_name)}")
 
             lines.append("")
 
@@ -94,24 +297,8 @@ class StrategicDDDConverter:
         if mappings:
             lines.append("### Context Mappings\n")
 
-            # Group mappings by domain
-            domain_mappings = {}
-            for mapping in mappings:
-                upstream = mapping.get('upstream_context', '')
-                downstream = mapping.get('downstream_context', '')
-
-                # Get domains for upstream and downstream
-                upstream_bc = self.resolver.get_context(upstream)
-                downstream_bc = self.resolver.get_context(downstream)
-
-                if upstream_bc:
-                    domain_ref = upstream_bc.get('domain_ref')
-                    if domain_ref:
-                        if domain_ref not in domain_mappings:
-                            domain_mappings[domain_ref] = []
-                        domain_mappings[domain_ref].append(mapping)
-
-            for domain_id, domain_mapping_list in domain_mappings.items():
+            # Mappings grouped by the domain of their upstream context
+            for domain_id, domain_mapping_list in self.resolver.mappings_by_domain.items():
                 domain = self.resolver.get_domain(domain_id)
                 if domain:
                     domain_name = domain.get('name', domain_id)
@@ -123,7 +310,171 @@ class StrategicDDDConverter:
 
         return "\n".join(lines)
 
-    def _generate_architecture_diagram(self) -> str:
+    def architecture_node_count(self) -> int:
+        """Number of nodes the single architecture diagram would contain"""
+        context_ids = {bc['id'] for bc in self.system.get('bounded_contexts', [])}
+        external = {
+            m.get('downstream_context') for m in self.system.get('context_mappings', [])
+            if m.get('downstream_context') and m.get('downstream_context') not in context_ids
+        }
+        return (1 + len(self.system.get('domains', [])) + len(context_ids) + len(external) +
+                len(self.system.get('bff_scopes', [])) + len(self.system.get('bff_interfaces', [])))
+
+    def is_architecture_paginated(self) -> bool:
+        """Whether the architecture diagram exceeds the node budget"""
+        return self.architecture_node_count() > self.diagram_node_budget
+
+    def _generate_architecture_diagram(self, include_drilldowns: bool = True) -> str:
+        """
+        Generate the architecture section.
+
+        Within the node budget this is one diagram of the whole system. Above it,
+        the section holds a domains-only overview followed by one drill-down per
+        domain (left out with include_drilldowns=False, e.g. when domains get
+        their own pages).
+        """
+        if not self.is_architecture_paginated():
+            return self._generate_full_architecture_diagram()
+
+        lines = [
+            "## System Architecture\n",
+            f"The system has {self.architecture_node_count()} architecture elements, so it is shown "
+            "as a domain overview with one drill-down diagram per domain.\n",
+            self._generate_domain_overview_diagram()
+        ]
+
+        if include_drilldowns:
+            for domain in self.system.get('domains', []):
+                lines.append(f"\n### {domain['name']}\n")
+                lines.append(self._generate_domain_drilldown_diagram(domain))
+
+        return "\n".join(lines)
+
+    def _cross_domain_edges(self) -> Dict[tuple, int]:
+        """Count context mappings between each (upstream domain, downstream domain) pair"""
+        edges: Dict[tuple, int] = {}
+        for mapping in self.system.get('context_mappings', []):
+            upstream = self.resolver.get_context(mapping.get('upstream_context'))
+            downstream = self.resolver.get_context(mapping.get('downstream_context'))
+            if not upstream or not downstream:
+                continue
+            key = (upstream.get('domain_ref'), downstream.get('domain_ref'))
+            if key[0] and key[1] and key[0] != key[1]:
+                edges[key] = edges.get(key, 0) + 1
+        return edges
+
+    def _generate_domain_overview_diagram(self) -> str:
+        """Generate Mermaid diagram of domains only, with mappings collapsed between domains"""
+        system_name = self.system.get('name', 'System')
+        domains = self.system.get('domains', [])
+
+        lines = ["```mermaid", "graph TB"]
+        lines.append(f'    System["«System»<br/>{system_name}"]')
+        lines.append("")
+
+        domain_nodes = {}
+        for i, domain in enumerate(domains):
+            node_id = f"Domain{i+1}"
+            domain_nodes[domain['id']] = node_id
+            bc_count = len(self.resolver.get_contexts_for_domain(domain['id']))
+            contexts_label = "1 context" if bc_count == 1 else f"{bc_count} contexts"
+            lines.append(f'    {node_id}["«Domain»<br/>{domain["name"]}<br/>'
+                         f'({domain.get("type", "core")}, {contexts_label})"]')
+            lines.append(f'    System --> {node_id}')
+
+        lines.append("")
+
+        for (upstream, downstream), count in self._cross_domain_edges().items():
+            if upstream in domain_nodes and downstream in domain_nodes:
+                label = "1 mapping" if count == 1 else f"{count} mappings"
+                lines.append(f'    {domain_nodes[upstream]} -.->|"{label}"| {domain_nodes[downstream]}')
+
+        lines.append("")
+        lines.append("    %% Styling")
+        lines.extend(_ARCHITECTURE_CLASS_DEFS)
+        lines.append("")
+        lines.append("    class System systemStyle")
+        lines.extend(self._domain_class_lines(domain_nodes))
+        lines.append("```")
+
+        return "\n".join(lines)
+
+    def _generate_domain_drilldown_diagram(self, domain: dict) -> str:
+        """
+        Generate Mermaid diagram of one domain and its bounded contexts.
+
+        Mappings between the domain's own contexts are drawn in full; mappings to
+        contexts of other domains are collapsed into one edge per other domain.
+        """
+        domain_id = domain['id']
+        lines = ["```mermaid", "graph TB"]
+        lines.append(f'    Domain["«Domain»<br/>{domain["name"]}<br/>(type: {domain.get("type", "core")})"]')
+        lines.append("")
+
+        bc_nodes = {}
+        for i, bc in enumerate(self.resolver.get_contexts_for_domain(domain_id)):
+            bc_nodes[bc['id']] = f"BC{i+1}"
+            lines.append(f'    Domain --> BC{i+1}["«Bounded Context»<br/>{bc["name"]}"]')
+
+        lines.append("")
+
+        # Mappings touching this domain, in document order
+        other_nodes: Dict[str, str] = {}
+        summary: Dict[tuple, int] = {}
+        for mapping in self.resolver.get_mappings_touching(bc_nodes):
+            upstream = mapping.get('upstream_context')
+            downstream = mapping.get('downstream_context')
+            if upstream in bc_nodes and downstream in bc_nodes:
+                rel_type = mapping.get('relationship_type', 'dependency')
+                lines.append(f'    {bc_nodes[upstream]} -.->|"{rel_type}"| {bc_nodes[downstream]}')
+                continue
+
+            # One end is outside the domain: another domain or an external system
+            local, remote, outgoing = (upstream, downstream, True) if upstream in bc_nodes \
+                else (downstream, upstream, False)
+            remote_context = self.resolver.get_context(remote)
+            remote_key = remote_context.get('domain_ref', remote) if remote_context else remote
+            if remote_key not in other_nodes:
+                node_id = f"Other{len(other_nodes) + 1}"
+                other_nodes[remote_key] = node_id
+                remote_domain = self.resolver.get_domain(remote_key)
+                label = f"«Domain»<br/>{remote_domain['name']}" if remote_domain else remote_key
+                lines.append(f'    {node_id}["{label}"]')
+            key = (bc_nodes[local], other_nodes[remote_key], outgoing)
+            summary[key] = summary.get(key, 0) + 1
+
+        for (local_node, other_node, outgoing), count in summary.items():
+            label = "1 mapping" if count == 1 else f"{count} mappings"
+            source, target = (local_node, other_node) if outgoing else (other_node, local_node)
+            lines.append(f'    {source} -.->|"{label}"| {target}')
+
+        lines.append("")
+        lines.append("    %% Styling")
+        lines.extend(_ARCHITECTURE_CLASS_DEFS)
+        lines.append("")
+        lines.extend(self._domain_class_lines({domain_id: "Domain"}))
+        if bc_nodes:
+            lines.append(f"    class {','.join(bc_nodes.values())} bcStyle")
+        if other_nodes:
+            lines.append(f"    class {','.join(other_nodes.values())} genericStyle")
+        lines.append("```")
+
+        return "\n".join(lines)
+
+    def _domain_class_lines(self, domain_nodes: Dict[str, str]) -> List[str]:
+        """Mermaid class assignments styling domain nodes by domain type"""
+        by_style: Dict[str, List[str]] = {'core': [], 'supporting': [], 'generic': []}
+        for domain_id, node_id in domain_nodes.items():
+            domain = self.resolver.get_domain(domain_id)
+            if domain:
+                domain_type = domain.get('type', 'core')
+                if domain_type in by_style:
+                    by_style[domain_type].append(node_id)
+
+        return [f"    class {','.join(nodes)} {domain_type}Style"
+                for domain_type, nodes in by_style.items() if nodes]
+
+    def _generate_full_architecture_diagram(self) -> str:
         """Generate Mermaid diagram showing system hierarchy and context relationships"""
         system_name = self.system.get('name', 'System')
         domains = self.system.get('domains', [])
@@ -233,40 +584,14 @@ class StrategicDDDConverter:
 
         # Styling
         lines.append("    %% Styling")
-        lines.append("    classDef systemStyle fill:#e1f5ff,stroke:#01579b,stroke-width:3px,color:#000")
-        lines.append("    classDef coreStyle fill:#c8e6c9,stroke:#2e7d32,stroke-width:2px,color:#000")
-        lines.append("    classDef supportingStyle fill:#fff9c4,stroke:#f57f17,stroke-width:2px,color:#000")
-        lines.append("    classDef genericStyle fill:#f5f5f5,stroke:#616161,stroke-width:2px,color:#000")
-        lines.append("    classDef bcStyle fill:#bbdefb,stroke:#1976d2,stroke-width:1px,color:#000")
-        lines.append("    classDef bffStyle fill:#ffe0b2,stroke:#e65100,stroke-width:2px,color:#000")
-        lines.append("    classDef bffIfStyle fill:#fff3e0,stroke:#ef6c00,stroke-width:1px,color:#000")
+        lines.extend(_ARCHITECTURE_CLASS_DEFS)
         lines.append("")
 
         # Apply system style
         lines.append("    class System systemStyle")
 
         # Apply domain styles based on type
-        core_domains = []
-        supporting_domains = []
-        generic_domains = []
-
-        for domain_id, node_id in domain_nodes.items():
-            domain = self.resolver.get_domain(domain_id)
-            if domain:
-                domain_type = domain.get('type', 'core')
-                if domain_type == 'core':
-                    core_domains.append(node_id)
-                elif domain_type == 'supporting':
-                    supporting_domains.append(node_id)
-                elif domain_type == 'generic':
-                    generic_domains.append(node_id)
-
-        if core_domains:
-            lines.append(f"    class {','.join(core_domains)} coreStyle")
-        if supporting_domains:
-            lines.append(f"    class {','.join(supporting_domains)} supportingStyle")
-        if generic_domains:
-            lines.append(f"    class {','.join(generic_domains)} genericStyle")
+        lines.extend(self._domain_class_lines(domain_nodes))
 
         # Apply BC styles
         if bc_nodes:
@@ -439,10 +764,7 @@ class StrategicDDDConverter:
             lines.append("")
 
         # Now add nested BFF interfaces
-        bff_interfaces = self.system.get('bff_interfaces', [])
-        nested_interfaces = [bff_if for bff_if in bff_interfaces if bff_if.get('bff_scope_ref') == bff_id]
-
-        for bff_if in nested_interfaces:
+        for bff_if in self.resolver.get_interfaces_for_bff_scope(bff_id):
             lines.append(self._generate_single_bff_interface(bff_if))
             lines.append("")
 
@@ -559,9 +881,14 @@ class StrategicDDDConverter:
 
         return "\n".join(lines)
 
-    def _generate_context_mappings_table(self) -> str:
-        """Generate context mappings table"""
-        mappings = self.system.get('context_mappings', [])
+    def _generate_context_mappings_table(
+        self,
+        mappings: Optional[List[dict]] = None,
+        heading: str = "## Bounded Context Relationships"
+    ) -> str:
+        """Generate context mappings table (all mappings by default)"""
+        if mappings is None:
+            mappings = self.system.get('context_mappings', [])
         if not mappings:
             return ""
 
@@ -595,7 +922,7 @@ class StrategicDDDConverter:
                 downstream_link = downstream
 
             # Humanize relationship type
-            humanized_rel_type = humanize_relationship_type(rel_type)
+            humanized_rel_type = humanize_snake_case(rel_type)
 
             rows.append([
                 mapping_link,
@@ -606,11 +933,12 @@ class StrategicDDDConverter:
             ])
 
         table = generate_table(headers, rows)
-        return f"## Bounded Context Relationships\n\n{table}"
+        return f"{heading}\n\n{table}"
 
-    def _generate_context_mappings_details(self) -> str:
-        """Generate detailed context mapping sections"""
-        mappings = self.system.get('context_mappings', [])
+    def _generate_context_mappings_details(self, mappings: Optional[List[dict]] = None) -> str:
+        """Generate detailed context mapping sections (all mappings by default)"""
+        if mappings is None:
+            mappings = self.system.get('context_mappings', [])
         if not mappings:
             return ""
 
@@ -769,6 +1097,10 @@ class StrategicDDDConverter:
             domain_name = domain.get('name', domain_ref) if domain else domain_ref
             lines.append(f"**Domain**: {generate_link(domain_ref, domain_name)} (`{domain_ref}`)")
 
+        tactical_doc = self.tactical_docs.get(bc_id)
+        if tactical_doc:
+            lines.append(f"**Tactical Design**: [{bc_name}]({tactical_doc})")
+
         team = context.get('team_ownership', '')
         if team:
             lines.append(f"**Team Ownership**: {team}\n")
@@ -832,6 +1164,19 @@ class StrategicDDDConverter:
                 lines.append(f"- {svc}")
             lines.append("")
 
+        # Context relationships
+        upstream_of = self.resolver.get_upstream_mappings(bc_id)
+        downstream_of = self.resolver.get_downstream_mappings(bc_id)
+        if upstream_of or downstream_of:
+            lines.append("#### Context Relationships")
+            for mapping in upstream_of:
+                lines.append(f"- Upstream of {self._context_link(mapping.get('downstream_context', ''))} "
+                             f"via {generate_link(mapping.get('id', ''), mapping.get('name', ''))}")
+            for mapping in downstream_of:
+                lines.append(f"- Downstream of {self._context_link(mapping.get('upstream_context', ''))} "
+                             f"via {generate_link(mapping.get('id', ''), mapping.get('name', ''))}")
+            lines.append("")
+
         # Domain events
         domain_events = context.get('domain_events', [])
         if domain_events:
@@ -840,3 +1185,29 @@ class StrategicDDDConverter:
                 lines.append(f"- {evt}")
 
         return "\n".join(lines)
+
+    def _context_link(self, context_id: str) -> str:
+        """Link to a bounded context by name, or plain text for external systems"""
+        context = self.resolver.get_context(context_id)
+        if not context:
+            return context_id
+        return generate_link(context_id, context.get('name', context_id))
+
+
+# Converter shared by split-output workers, set once per worker process
+_split_worker_state: dict = {}
+
+
+def _init_split_worker(converter: StrategicDDDConverter, overview_name: str,
+                       anchor_map: Dict[str, str]) -> None:
+    """Keep the prebuilt converter and anchor map for domain page rendering"""
+    _split_worker_state['converter'] = converter
+    _split_worker_state['overview_name'] = overview_name
+    _split_worker_state['anchor_map'] = anchor_map
+
+
+def _render_domain_file(domain_id: str) -> str:
+    """Render one domain page in a worker"""
+    converter = _split_worker_state['converter']
+    return converter.generate_domain_page(domain_id, _split_worker_state['overview_name'],
+                                          _split_worker_state['anchor_map'])
@@ -1,6 +1,9 @@
 """Data models and helper utilities for Strategic DDD converter"""
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
+
+# Text helpers live in utils.text and remain importable from here
+from ...utils.text import escape_markdown, humanize_snake_case
 
 
 class EntityResolver:
@@ -14,6 +17,42 @@ class EntityResolver:
         self.bff_interfaces_by_id = {bff_if['id']: bff_if for bff_if in system.get('bff_interfaces', [])}
         self.context_mappings_by_id = {cm['id']: cm for cm in system.get('context_mappings', [])}
 
+        # Grouped reverse indexes (built once, in document order)
+        self.contexts_by_domain: Dict[str, List[dict]] = {}
+        for domain in system.get('domains', []):
+            self.contexts_by_domain[domain['id']] = [
+                self.contexts_by_id[bc_id]
+                for bc_id in domain.get('bounded_contexts', [])
+                if bc_id in self.contexts_by_id
+            ]
+
+        self.interfaces_by_bff_scope: Dict[str, List[dict]] = {}
+        for bff_if in system.get('bff_interfaces', []):
+            scope_ref = bff_if.get('bff_scope_ref')
+            if scope_ref:
+                self.interfaces_by_bff_scope.setdefault(scope_ref, []).append(bff_if)
+
+        # Mappings are grouped under the domain of their upstream context
+        self.mappings_by_upstream: Dict[str, List[dict]] = {}
+        self.mappings_by_downstream: Dict[str, List[dict]] = {}
+        self.mappings_by_domain: Dict[str, List[dict]] = {}
+        # Document positions of the mappings at either end of each context
+        self.mapping_positions_by_context: Dict[str, List[int]] = {}
+        for i, mapping in enumerate(system.get('context_mappings', [])):
+            upstream = mapping.get('upstream_context')
+            downstream = mapping.get('downstream_context')
+            if upstream:
+                self.mappings_by_upstream.setdefault(upstream, []).append(mapping)
+                self.mapping_positions_by_context.setdefault(upstream, []).append(i)
+            if downstream:
+                self.mappings_by_downstream.setdefault(downstream, []).append(mapping)
+                self.mapping_positions_by_context.setdefault(downstream, []).append(i)
+
+            upstream_bc = self.contexts_by_id.get(upstream)
+            domain_ref = upstream_bc.get('domain_ref') if upstream_bc else None
+            if domain_ref:
+                self.mappings_by_domain.setdefault(domain_ref, []).append(mapping)
+
     def get_domain(self, domain_id: str) -> Optional[dict]:
         """Get domain by ID"""
         return self.domains_by_id.get(domain_id)
@@ -28,11 +67,31 @@ class EntityResolver:
 
     def get_contexts_for_domain(self, domain_id: str) -> List[dict]:
         """Get all bounded contexts for a domain"""
-        domain = self.get_domain(domain_id)
-        if not domain:
-            return []
-        context_ids = domain.get('bounded_contexts', [])
-        return [self.contexts_by_id[bc_id] for bc_id in context_ids if bc_id in self.contexts_by_id]
+        return self.contexts_by_domain.get(domain_id, [])
+
+    def get_interfaces_for_bff_scope(self, bff_id: str) -> List[dict]:
+        """Get all BFF interfaces belonging to a BFF scope"""
+        return self.interfaces_by_bff_scope.get(bff_id, [])
+
+    def get_mappings_for_domain(self, domain_id: str) -> List[dict]:
+        """Get context mappings whose upstream context belongs to a domain"""
+        return self.mappings_by_domain.get(domain_id, [])
+
+    def get_upstream_mappings(self, context_id: str) -> List[dict]:
+        """Get context mappings where the context is upstream"""
+        return self.mappings_by_upstream.get(context_id, [])
+
+    def get_downstream_mappings(self, context_id: str) -> List[dict]:
+        """Get context mappings where the context is downstream"""
+        return self.mappings_by_downstream.get(context_id, [])
+
+    def get_mappings_touching(self, context_ids: Iterable[str]) -> List[dict]:
+        """Get context mappings with either end in the given contexts, in document order"""
+        positions = set()
+        for context_id in context_ids:
+            positions.update(self.mapping_positions_by_context.get(context_id, []))
+        mappings = self.system.get('context_mappings', [])
+        return [mappings[i] for i in sorted(positions)]
 
 
 def generate_anchor(entity_id: str) -> str:
@@ -70,14 +129,6 @@ def generate_table(headers: List[str], rows: List[List[str]]) -> str:
     return "\n".join([header_row, separator] + data_rows)
 
 
-def escape_markdown(text: str) -> str:
-    """Escape special characters in markdown"""
-    if not text:
-        return ""
-    # Escape pipe characters in table cells
-    return text.replace("|", "\\|")
-
-
 def safe_get(obj: dict, key: str, default: str = "") -> str:
     """Safely get value from dict with default"""
     value = obj.get(key, default)
@@ -86,25 +137,4 @@ def safe_get(obj: dict, key: str, default: str = "") -> str:
 
 def humanize_relationship_type(rel_type: str) -> str:
     """Convert relationship type from snake_case to human-readable format"""
-    if not rel_type:
-        return ""
-
-    # Special cases
-    special_cases = {
-        "acl": "ACL",
-        "api": "API"
-    }
-
-    # Split by underscore and capitalize each word
-    words = rel_type.split('_')
-    humanized = []
-
-    for word in words:
-        if word.upper() in special_cases.values():
-            humanized.append(word.upper())
-        elif word in special_cases:
-            humanized.append(special_cases[word])
-        else:
-            humanized.append(word.capitalize())
-
-    return " ".join(humanized)
+    return humanize_snake_case(rel_type)
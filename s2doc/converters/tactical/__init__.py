@@ -1,6 +1,6 @@
 """Tactical DDD YAML to Markdown Converter"""
 
-from .converter import TacticalDDDConverter
+from .converter import TacticalDDDConverter, convert_bounded_contexts, split_bounded_contexts
 from .models import EntityResolver
 
-__all__ = ['TacticalDDDConverter', 'EntityResolver']
+__all__ = ['TacticalDDDConverter', 'EntityResolver', 'convert_bounded_contexts', 'split_bounded_contexts']
@@ -1,26 +1,35 @@
 """Main converter class for Tactical DDD YAML to Markdown"""
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+from ...utils.cache import BuildCache
+from ...utils.parallel import parallel_map
+from ...utils.text import escape_markdown, humanize_name
 from .models import (
     EntityResolver,
     generate_anchor,
     generate_link,
     format_boolean,
     generate_table,
-    escape_markdown,
     safe_get,
-    humanize_name
+    Usage
 )
-from .diagram_generator import AggregateUMLGenerator
+from .diagram_generator import CACHE_NAMESPACE, AggregateUMLGenerator
 
 
 class TacticalDDDConverter:
     """Convert Tactical DDD YAML to Markdown"""
 
-    def __init__(self, yaml_data: dict):
+    def __init__(
+        self,
+        yaml_data: dict,
+        strategic_context: Optional[dict] = None,
+        cache: Optional[BuildCache] = None
+    ):
         self.bounded_context = yaml_data['bounded_context']
         self.resolver = EntityResolver(self.bounded_context)
-        self.diagram_generator = AggregateUMLGenerator(self.resolver)
+        self.diagram_generator = AggregateUMLGenerator(self.resolver, cache)
+        # Strategic view of this context ({'name', 'domain_name'}), known in workspace mode
+        self.strategic_context = strategic_context
 
     def convert_to_markdown(self) -> str:
         """Generate complete markdown document"""
@@ -44,15 +53,26 @@ class TacticalDDDConverter:
     def _generate_header(self) -> str:
         """Generate bounded context header"""
         bc = self.bounded_context
+        domain_ref = bc.get('domain_ref', '')
+        strategic = self.strategic_context
+
         lines = [
             f"# {bc['name']}",
             "",
             f"**Context ID**: `{bc['id']}`",
-            f"**Domain**: {bc.get('domain_ref', '')}",
+        ]
+        if strategic:
+            # Links resolve against the strategic document in workspace mode
+            if domain_ref:
+                lines.append(f"**Domain**: {generate_link(domain_ref, strategic.get('domain_name') or domain_ref)}")
+            lines.append(f"**Strategic Context**: {generate_link(bc['id'], strategic.get('name') or bc['name'])}")
+        else:
+            lines.append(f"**Domain**: {domain_ref}")
+        lines.extend([
             f"**Description**: {bc.get('description', '')}",
             "",
             "---"
-        ]
+        ])
         return "\n".join(lines)
 
     def _generate_application_services_table(self) -> str:
@@ -203,6 +223,8 @@ class TacticalDDDConverter:
                 lines.append(f"- {inv}")
             lines.append("")
 
+        lines.extend(self._generate_used_by(self.resolver.get_aggregate_usages(agg['id']), "### Used By"))
+
         # UML Diagram
         lines.append("### Aggregate UML Diagram")
         lines.append("")
@@ -263,6 +285,8 @@ class TacticalDDDConverter:
                 lines.append(f"- {crit}")
             lines.append("")
 
+        lines.extend(self._generate_used_by(self.resolver.get_value_object_usages(vo['id']), "#### Used By"))
+
         return "\n".join(lines)
 
     def _generate_repository_details(self) -> str:
@@ -515,6 +539,8 @@ class TacticalDDDConverter:
 
         lines.append("")
 
+        lines.extend(self._generate_used_by(self.resolver.get_event_publishers(evt['id']), "#### Published By"))
+
         # Payload
         if evt.get('data_carried'):
             lines.append("#### Payload")
@@ -530,6 +556,45 @@ class TacticalDDDConverter:
 
         return "\n".join(lines)
 
+    def _generate_used_by(self, usages: List[Usage], heading: str) -> List[str]:
+        """Generate a backlink list from reverse-index usages, one line per owner and member"""
+        if not usages:
+            return []
+
+        grouped: Dict[Tuple[str, str], List[str]] = {}
+        for usage in usages:
+            roles = grouped.setdefault((usage.owner_id, usage.member), [])
+            if usage.role not in roles:
+                roles.append(usage.role)
+
+        lines = [heading]
+        for (owner_id, member), roles in grouped.items():
+            line = f"- {self._reference_label(owner_id)}"
+            if member:
+                line += f" · `{member}`"
+            roles = [role for role in roles if role != 'aggregate']
+            if roles:
+                line += f" ({', '.join(roles)})"
+            lines.append(line)
+        lines.append("")
+
+        return lines
+
+    def _reference_label(self, element_id: str) -> str:
+        """Link to any element of the context by name (entities have no section of their own)"""
+        entity = self.resolver.get_entity(element_id)
+        if entity:
+            return f"{humanize_name(entity['name'])} entity"
+
+        for lookup in (self.resolver.get_aggregate, self.resolver.get_value_object,
+                       self.resolver.get_application_service, self.resolver.get_domain_service,
+                       self.resolver.get_command_interface, self.resolver.get_query_interface):
+            element = lookup(element_id)
+            if element:
+                return generate_link(element_id, humanize_name(element['name']))
+
+        return element_id
+
     def _generate_command_interfaces(self) -> str:
         """Generate command interfaces section"""
         cmd_interfaces = self.bounded_context.get('command_interfaces', [])
@@ -699,3 +764,70 @@ class TacticalDDDConverter:
                 lines.append("")
 
         return "\n".join(lines)
+
+
+def split_bounded_contexts(data: dict) -> List[dict]:
+    """
+    Split a tactical model into one {'bounded_context': ...} document per context.
+
+    Accepts a single 'bounded_context' or a 'bounded_contexts' list.
+
+    Raises:
+        ValueError: If two contexts share an ID (their output files would collide)
+    """
+    if 'bounded_contexts' in data:
+        documents = [{'bounded_context': bc} for bc in data['bounded_contexts']]
+    else:
+        documents = [data]
+
+    seen = set()
+    for document in documents:
+        bc_id = document['bounded_context']['id']
+        if bc_id in seen:
+            raise ValueError(f"Bounded context '{bc_id}' is defined more than once")
+        seen.add(bc_id)
+
+    return documents
+
+
+def convert_bounded_contexts(
+    data: dict,
+    workers: Optional[int] = None,
+    cache: Optional[BuildCache] = None
+) -> List[Tuple[str, str]]:
+    """
+    Convert every bounded context of a tactical model, in a worker pool.
+
+    Each context gets its own converter and EntityResolver. Workers read aggregate
+    diagrams from the cache file and report back the diagrams they used, which
+    are stored in cache here (saving it is up to the caller).
+
+    Returns:
+        List of (bounded context ID, markdown), in input order
+    """
+    cache_path = str(cache.path) if cache is not None else None
+    results = parallel_map(_convert_bounded_context, split_bounded_contexts(data), workers,
+                           initializer=_init_tactical_worker, initargs=(cache_path,))
+
+    if cache is not None:
+        for _, _, diagrams in results:
+            for key, diagram in diagrams.items():
+                cache.put(CACHE_NAMESPACE, key, diagram)
+
+    return [(bc_id, markdown) for bc_id, markdown, _ in results]
+
+
+# Read-only build cache of a conversion worker, set once per worker process
+_tactical_worker_state: dict = {}
+
+
+def _init_tactical_worker(cache_path: Optional[str]) -> None:
+    """Load the build cache once per worker"""
+    _tactical_worker_state['cache'] = BuildCache(cache_path) if cache_path else None
+
+
+def _convert_bounded_context(document: dict) -> Tuple[str, str, Dict[str, str]]:
+    """Convert one bounded context document, returning the aggregate diagrams it used"""
+    converter = TacticalDDDConverter(document, cache=_tactical_worker_state.get('cache'))
+    markdown = converter.convert_to_markdown()
+    return document['bounded_context']['id'], markdown, converter.diagram_generator.used_diagrams
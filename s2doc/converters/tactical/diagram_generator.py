@@ -1,17 +1,177 @@
 """Mermaid UML diagram generation for aggregates"""
 
-from typing import List
+from typing import Dict, List, Optional, Tuple
+from ...utils.cache import BuildCache, content_hash
 from .models import EntityResolver
 
+# Build cache namespace for aggregate diagrams, keyed by content hash
+CACHE_NAMESPACE = "tactical_uml"
+
+# Part of the cache key: bump whenever the rendered diagram text changes,
+# so diagrams cached by an earlier rendering are not reused
+DIAGRAM_FORMAT = 1
+
+# Aggregates whose diagram exceeds either budget are split into a names-only
+# overview plus detail diagrams, each of which stays within the budgets
+DEFAULT_NODE_BUDGET = 12
+DEFAULT_MEMBER_BUDGET = 60
+
 
 class AggregateUMLGenerator:
-    """Generate Mermaid UML class diagrams for aggregates"""
+    """
+    Generate Mermaid UML class diagrams for aggregates.
+
+    Class blocks are memoized per entity and value object ID, so value objects
+    shared by several aggregates are rendered once. With a build cache, whole
+    diagrams are reused across runs while the aggregate, its root entity and its
+    value objects are unchanged. Every diagram used in this run is recorded in
+    used_diagrams (hash -> text).
+
+    Aggregates with more classes than node_budget, or more attributes and
+    methods than member_budget, get an overview plus per-cluster detail diagrams.
+    """
 
-    def __init__(self, resolver: EntityResolver):
+    def __init__(
+        self,
+        resolver: EntityResolver,
+        cache: Optional[BuildCache] = None,
+        node_budget: int = DEFAULT_NODE_BUDGET,
+        member_budget: int = DEFAULT_MEMBER_BUDGET
+    ):
         self.resolver = resolver
+        self.cache = cache
+        self.node_budget = node_budget
+        self.member_budget = member_budget
+        self.used_diagrams: Dict[str, str] = {}
+        self._class_blocks: Dict[Tuple[str, str], str] = {}
+
+    def diagram_key(self, aggregate: dict) -> str:
+        """Hash of everything the aggregate's diagram is rendered from"""
+        root_entity = self.resolver.get_entity(aggregate['root_ref'])
+        vo_ids = list(aggregate.get('value_objects', []))
+        if root_entity:
+            vo_ids.extend(attr['value_object_ref'] for attr in root_entity.get('attributes', [])
+                          if attr.get('value_object_ref'))
+        value_objects = {vo_id: self.resolver.get_value_object(vo_id) for vo_id in vo_ids}
+        return content_hash([DIAGRAM_FORMAT, aggregate, root_entity, value_objects,
+                             self.node_budget, self.member_budget])
 
     def generate_diagram(self, aggregate: dict) -> str:
-        """Generate Mermaid classDiagram for aggregate"""
+        """Generate Mermaid classDiagram for aggregate (from the build cache when unchanged)"""
+        key = self.diagram_key(aggregate)
+        diagram = self.used_diagrams.get(key)
+        if diagram is None and self.cache is not None:
+            diagram = self.cache.get(CACHE_NAMESPACE, key)
+        if diagram is None:
+            diagram = self._render_diagram(aggregate)
+
+        self.used_diagrams[key] = diagram
+        if self.cache is not None:
+            self.cache.put(CACHE_NAMESPACE, key, diagram)
+        return diagram
+
+    def _render_diagram(self, aggregate: dict) -> str:
+        """Render the aggregate as one diagram, or split it when over budget"""
+        root_entity = self.resolver.get_entity(aggregate['root_ref'])
+        value_objects = self._diagram_value_objects(aggregate)
+
+        nodes = len(value_objects) + (1 if root_entity else 0)
+        members = sum(self._member_count(vo) for vo in value_objects)
+        if root_entity:
+            members += self._member_count(root_entity)
+
+        # A lone root entity cannot be split any further
+        if not value_objects or (nodes <= self.node_budget and members <= self.member_budget):
+            return self._render_single_diagram(aggregate)
+        return self._render_split_diagrams(root_entity, value_objects)
+
+    def _diagram_value_objects(self, aggregate: dict) -> List[dict]:
+        """Value objects drawn as classes (multi-attribute ones), in aggregate order"""
+        value_objects = []
+        for vo_id in aggregate.get('value_objects', []):
+            vo = self.resolver.get_value_object(vo_id)
+            if vo and self._is_multi_attribute_vo(vo):
+                value_objects.append(vo)
+        return value_objects
+
+    @staticmethod
+    def _member_count(element: dict) -> int:
+        """Number of attribute and method lines in a class"""
+        return len(element.get('attributes', [])) + len(element.get('business_methods', []))
+
+    def _render_split_diagrams(self, root_entity: Optional[dict], value_objects: List[dict]) -> str:
+        """
+        Render an oversized aggregate as an overview plus detail diagrams.
+
+        The overview holds class names and relationships only. Value objects are
+        then packed, in aggregate order, into clusters that fit the budgets; each
+        cluster diagram shows the root entity by name with its links to them.
+        """
+        related = self._related_value_object_names(root_entity) if root_entity else []
+        root_name = root_entity['name'] if root_entity else None
+
+        overview = []
+        if root_entity:
+            overview.append(f"    class {root_name}")
+            overview.append(f"    <<Entity Root>> {root_name}")
+        for vo in value_objects:
+            overview.append(f"    class {vo['name']}")
+            overview.append(f"    <<Value Object>> {vo['name']}")
+        overview.extend(f"    {root_name} --> {name}" for name in related)
+
+        sections = [
+            f"#### Overview\n\n{self._mermaid_class_diagram(overview)}"
+        ]
+        if root_entity:
+            root_class = self._generate_entity_class(root_entity, is_root=True)
+            sections.append(f"#### {root_name}\n\n{self._mermaid_class_diagram([root_class])}")
+
+        clusters = self._cluster_value_objects(value_objects)
+        for i, cluster in enumerate(clusters, 1):
+            lines = []
+            names = {vo['name'] for vo in cluster}
+            links = [name for name in related if name in names]
+            if links:
+                lines.append(f"    class {root_name}")
+            lines.extend(self._generate_value_object_class(vo) for vo in cluster)
+            lines.extend(f"    {root_name} --> {name}" for name in links)
+            sections.append(f"#### Value Objects ({i}/{len(clusters)})\n\n{self._mermaid_class_diagram(lines)}")
+
+        return "\n\n".join(sections)
+
+    def _cluster_value_objects(self, value_objects: List[dict]) -> List[List[dict]]:
+        """Pack value objects into clusters within the budgets (one slot is kept for the root)"""
+        clusters: List[List[dict]] = []
+        current: List[dict] = []
+        members = 0
+        for vo in value_objects:
+            size = self._member_count(vo)
+            if current and (len(current) + 1 >= self.node_budget or members + size > self.member_budget):
+                clusters.append(current)
+                current, members = [], 0
+            current.append(vo)
+            members += size
+        if current:
+            clusters.append(current)
+        return clusters
+
+    def _related_value_object_names(self, entity: dict) -> List[str]:
+        """Names of multi-attribute value objects the entity's attributes refer to"""
+        names = []
+        for attr in entity.get('attributes', []):
+            vo_id = attr.get('value_object_ref')
+            vo = self.resolver.get_value_object(vo_id) if vo_id else None
+            if vo and self._is_multi_attribute_vo(vo):
+                names.append(vo['name'])
+        return names
+
+    @staticmethod
+    def _mermaid_class_diagram(lines: List[str]) -> str:
+        """Wrap class diagram lines in a Mermaid code block"""
+        return "\n".join(["```mermaid", "classDiagram", *lines, "```"])
+
+    def _render_single_diagram(self, aggregate: dict) -> str:
+        """Render Mermaid classDiagram for aggregate"""
         lines = ["```mermaid", "classDiagram"]
 
         # Generate root entity class
@@ -38,7 +198,14 @@ class AggregateUMLGenerator:
         return len(attributes) > 1
 
     def _generate_entity_class(self, entity: dict, is_root: bool = False) -> str:
-        """Generate UML class for entity"""
+        """Generate UML class for entity, memoized per entity ID"""
+        key = ('root' if is_root else 'entity', entity['id'])
+        if key not in self._class_blocks:
+            self._class_blocks[key] = self._render_entity_class(entity, is_root)
+        return self._class_blocks[key]
+
+    def _render_entity_class(self, entity: dict, is_root: bool) -> str:
+        """Render UML class for entity"""
         stereotype = "<<Entity Root>>" if is_root else "<<Entity>>"
         class_name = entity['name']
 
@@ -62,7 +229,14 @@ class AggregateUMLGenerator:
         return "\n".join(lines)
 
     def _generate_value_object_class(self, vo: dict) -> str:
-        """Generate UML class for multi-attribute value object"""
+        """Generate UML class for multi-attribute value object, memoized per value object ID"""
+        key = ('value_object', vo['id'])
+        if key not in self._class_blocks:
+            self._class_blocks[key] = self._render_value_object_class(vo)
+        return self._class_blocks[key]
+
+    def _render_value_object_class(self, vo: dict) -> str:
+        """Render UML class for multi-attribute value object"""
         lines = [f"    class {vo['name']} {{"]
         lines.append("        <<Value Object>>")
 
@@ -1,6 +1,16 @@
 """Data models and helper utilities for Tactical DDD converter"""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional
+
+# Text helpers live in utils.text and remain importable from here
+from ...utils.text import escape_markdown, humanize_name
+
+
+class Usage(NamedTuple):
+    """One reverse reference: which element refers to an entity, and how"""
+    owner_id: str   # Aggregate, entity, service or interface holding the reference
+    member: str     # Attribute, operation or command record within the owner ('' for the owner itself)
+    role: str       # How it is used, e.g. 'attribute', 'loads', 'modifies', 'publishes'
 
 
 class EntityResolver:
@@ -18,6 +28,62 @@ class EntityResolver:
         self.command_interfaces_by_id = {ci['id']: ci for ci in bounded_context.get('command_interfaces', [])}
         self.query_interfaces_by_id = {qi['id']: qi for qi in bounded_context.get('query_interfaces', [])}
 
+        # Reverse indexes, built in one pass over the context
+        self.value_object_usages: Dict[str, List[Usage]] = {}
+        self.aggregate_usages: Dict[str, List[Usage]] = {}
+        self.event_publishers: Dict[str, List[Usage]] = {}
+        self.aggregates_by_entity: Dict[str, List[str]] = {}
+        self._build_reverse_indexes()
+
+    def _build_reverse_indexes(self) -> None:
+        """Index who refers to each value object, aggregate and event"""
+        def add(index: Dict[str, List[Usage]], target: Optional[str], usage: Usage) -> None:
+            if target:
+                index.setdefault(target, []).append(usage)
+
+        bc = self.bounded_context
+
+        for agg in bc.get('aggregates', []):
+            for vo_id in agg.get('value_objects', []):
+                add(self.value_object_usages, vo_id, Usage(agg['id'], '', 'aggregate'))
+            for ent_id in agg.get('entities', []):
+                self.aggregates_by_entity.setdefault(ent_id, []).append(agg['id'])
+
+        # Value objects referenced from attributes and method parameters
+        for owner in bc.get('entities', []) + bc.get('value_objects', []):
+            for attr in owner.get('attributes', []):
+                add(self.value_object_usages, attr.get('value_object_ref'),
+                    Usage(owner['id'], attr.get('name', ''), 'attribute'))
+            for method in owner.get('business_methods', []):
+                for param in method.get('parameters', []):
+                    add(self.value_object_usages, param.get('value_object_ref'),
+                        Usage(owner['id'], method.get('name', ''), 'parameter'))
+
+        for svc in bc.get('domain_services', []):
+            for op in svc.get('operations', []):
+                for param in op.get('parameters', []):
+                    add(self.value_object_usages, param.get('value_object_ref'),
+                        Usage(svc['id'], op.get('name', ''), 'parameter'))
+
+        for svc in bc.get('application_services', []):
+            for op in svc.get('operations', []):
+                name = op.get('name', '')
+                workflow = op.get('workflow') or {}
+                for agg_id in workflow.get('loads_aggregates') or []:
+                    add(self.aggregate_usages, agg_id, Usage(svc['id'], name, 'loads'))
+                for agg_id in (op.get('transaction_boundary') or {}).get('modifies_aggregates') or []:
+                    add(self.aggregate_usages, agg_id, Usage(svc['id'], name, 'modifies'))
+                for evt_id in workflow.get('publishes_events') or []:
+                    add(self.event_publishers, evt_id, Usage(svc['id'], name, 'publishes'))
+
+        for cmd_if in bc.get('command_interfaces', []):
+            for record in cmd_if.get('command_records', []):
+                name = record.get('record_name', '')
+                add(self.aggregate_usages, record.get('modifies_aggregate'), Usage(cmd_if['id'], name, 'modifies'))
+                add(self.value_object_usages, record.get('return_type_ref'), Usage(cmd_if['id'], name, 'returns'))
+                for evt_id in record.get('publishes_events') or []:
+                    add(self.event_publishers, evt_id, Usage(cmd_if['id'], name, 'publishes'))
+
     def get_entity(self, entity_id: str) -> Optional[dict]:
         """Get entity by ID"""
         return self.entities_by_id.get(entity_id)
@@ -54,6 +120,22 @@ class EntityResolver:
         """Get query interface by ID"""
         return self.query_interfaces_by_id.get(qry_id)
 
+    def get_value_object_usages(self, vo_id: str) -> List[Usage]:
+        """Get aggregates, attributes and parameters that use a value object"""
+        return self.value_object_usages.get(vo_id, [])
+
+    def get_aggregate_usages(self, agg_id: str) -> List[Usage]:
+        """Get operations and command records that load or modify an aggregate"""
+        return self.aggregate_usages.get(agg_id, [])
+
+    def get_event_publishers(self, event_id: str) -> List[Usage]:
+        """Get operations and command records that publish an event"""
+        return self.event_publishers.get(event_id, [])
+
+    def get_aggregates_for_entity(self, entity_id: str) -> List[str]:
+        """Get IDs of the aggregates containing an entity"""
+        return self.aggregates_by_entity.get(entity_id, [])
+
     def get_entities_for_aggregate(self, agg_id: str) -> List[dict]:
         """Get all entities in an aggregate"""
         aggregate = self.get_aggregate(agg_id)
@@ -106,49 +188,7 @@ def generate_table(headers: List[str], rows: List[List[str]]) -> str:
     return "\n".join([header_row, separator] + data_rows)
 
 
-def escape_markdown(text: str) -> str:
-    """Escape special characters in markdown"""
-    if not text:
-        return ""
-    # Escape pipe characters in table cells
-    return text.replace("|", "\\|")
-
-
 def safe_get(obj: dict, key: str, default: str = "") -> str:
     """Safely get value from dict with default"""
     value = obj.get(key, default)
     return str(value) if value is not None else default
-
-
-def humanize_name(name: str) -> str:
-    """
-    Convert PascalCase or camelCase names to human-readable format.
-    Examples:
-        PaymentTemplate -> Payment Template
-        ScheduledPayment -> Scheduled Payment
-        WorkingDayCalculationService -> Working Day Calculation Service
-        PaymentTemplateId -> Payment Template Id
-
-    If the name already contains spaces, return it as-is.
-    """
-    if not name:
-        return ""
-
-    # If the name already contains spaces, it's already human-readable
-    if ' ' in name:
-        return name
-
-    # Insert space before uppercase letters (except at the start)
-    result = []
-    for i, char in enumerate(name):
-        if i > 0 and char.isupper():
-            # Check if previous character is lowercase or if next character is lowercase
-            # This handles acronyms better (e.g., "XMLParser" -> "XML Parser")
-            prev_is_lower = name[i-1].islower()
-            next_is_lower = i < len(name) - 1 and name[i+1].islower()
-
-            if prev_is_lower or next_is_lower:
-                result.append(' ')
-        result.append(char)
-
-    return ''.join(result)
@@ -55,16 +55,24 @@ def detect_schema_type(data: Dict[Any, Any]) -> SchemaType:
             if 'domains' in system or 'bounded_contexts' in system:
                 return SchemaType.STRATEGIC_DDD
 
-    # Check for tactical DDD schema
+    # Check for tactical DDD schema (one context, or a list of contexts)
     if 'bounded_context' in data:
-        bc = data['bounded_context']
-        if isinstance(bc, dict):
-            if 'aggregates' in bc or 'entities' in bc or 'value_objects' in bc:
-                return SchemaType.TACTICAL_DDD
+        if _is_tactical_context(data['bounded_context']):
+            return SchemaType.TACTICAL_DDD
+
+    if 'bounded_contexts' in data:
+        contexts = data['bounded_contexts']
+        if isinstance(contexts, list) and contexts and all(_is_tactical_context(bc) for bc in contexts):
+            return SchemaType.TACTICAL_DDD
 
     return SchemaType.UNKNOWN
 
 
+def _is_tactical_context(bc: Any) -> bool:
+    """Check whether a bounded context carries tactical building blocks"""
+    return isinstance(bc, dict) and ('aggregates' in bc or 'entities' in bc or 'value_objects' in bc)
+
+
 def get_schema_description(schema_type: SchemaType) -> str:
     """
     Get human-readable description of schema type.
@@ -96,7 +104,7 @@ def get_error_message() -> str:
 The file does not match any of the supported schemas:
   - Domain Stories (expects 'domain_story' or 'stories' key)
   - Strategic DDD (expects 'system' key with domains/bounded_contexts)
-  - Tactical DDD (expects 'bounded_context' key with aggregates/entities)
+  - Tactical DDD (expects 'bounded_context' or 'bounded_contexts' with aggregates/entities)
   - Data Engineering (expects 'system', 'pipelines', and 'datasets' keys)
 
 Please verify your YAML file structure or check the documentation.
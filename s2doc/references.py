@@ -0,0 +1,319 @@
+"""Referential integrity checks for every model type
+
+Each model type declares where IDs are defined and which fields refer to
+them. The checker builds one ID index per kind in a single pass over the
+definitions, then resolves every reference with a set lookup, so the whole
+check is linear in the size of the model. Members of a definition, such as
+the schema fields of a dataset, are indexed per owning ID the same way.
+
+Paths use a dotted notation where '*' stands for every item of a list, e.g.
+'bounded_context.aggregates.*.root_ref'.
+"""
+
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from .detector import SchemaType
+from .validator import child_path
+
+# Wildcard kind: the reference may point at an ID of any kind
+ANY_KIND = '*'
+
+
+class Reference(NamedTuple):
+    """A field that refers to an ID"""
+    pattern: str
+    kind: str
+    # IDs without this prefix are external systems rather than broken references
+    internal_prefix: Optional[str] = None
+
+
+class BrokenReference(NamedTuple):
+    """A reference to an ID that is not defined in the model"""
+    path: str
+    target: str
+    kind: str
+
+    def __str__(self) -> str:
+        kind = "ID" if self.kind == ANY_KIND else f"{self.kind.replace('_', ' ')}"
+        return f"{self.path}: unknown {kind} '{self.target}'"
+
+
+class MemberReference(NamedTuple):
+    """An object naming a member of a defined ID, e.g. {dataset: ..., field: ...}"""
+    pattern: str
+    owner_key: str
+    member_key: str
+    kind: str
+
+
+class ReferenceSpec(NamedTuple):
+    """Where IDs are defined and referenced in one model type"""
+    definitions: Dict[str, List[str]]
+    references: List[Reference]
+    # Member kind -> (owner pattern, owner ID key, member names pattern within the owner)
+    members: Optional[Dict[str, Tuple[str, str, str]]] = None
+    member_references: Optional[List[MemberReference]] = None
+
+
+_STORY = 'domain_stories.*'
+
+REFERENCE_SPECS: Dict[SchemaType, ReferenceSpec] = {
+    SchemaType.STRATEGIC_DDD: ReferenceSpec(
+        definitions={
+            'domain': ['system.domains.*.id'],
+            'bounded_context': ['system.bounded_contexts.*.id'],
+            'context_mapping': ['system.context_mappings.*.id'],
+            'bff_scope': ['system.bff_scopes.*.id'],
+            'bff_interface': ['system.bff_interfaces.*.id'],
+        },
+        references=[
+            Reference('system.domains.*.bounded_contexts.*', 'bounded_context'),
+            Reference('system.bounded_contexts.*.domain_ref', 'domain'),
+            Reference('system.context_mappings.*.upstream_context', 'bounded_context', 'bc_'),
+            Reference('system.context_mappings.*.downstream_context', 'bounded_context', 'bc_'),
+            Reference('system.bff_scopes.*.aggregates_from_contexts.*', 'bounded_context'),
+            Reference('system.bff_scopes.*.provides.endpoints.*.aggregates_from.*', 'bounded_context'),
+            Reference('system.bff_scopes.*.provides.transformations.*.from_context', 'bounded_context'),
+            Reference('system.bff_interfaces.*.bff_scope_ref', 'bff_scope'),
+            Reference('system.bff_interfaces.*.primary_bounded_context_ref', 'bounded_context'),
+            Reference('system.bff_interfaces.*.additional_context_refs.*', 'bounded_context'),
+        ]
+    ),
+    SchemaType.TACTICAL_DDD: ReferenceSpec(
+        definitions={
+            'entity': ['bounded_context.entities.*.id'],
+            'value_object': ['bounded_context.value_objects.*.id'],
+            'aggregate': ['bounded_context.aggregates.*.id'],
+            'repository': ['bounded_context.repositories.*.id'],
+            'domain_service': ['bounded_context.domain_services.*.id'],
+            'application_service': ['bounded_context.application_services.*.id'],
+            'domain_event': ['bounded_context.domain_events.*.id'],
+            'command_interface': ['bounded_context.command_interfaces.*.id'],
+            'query_interface': ['bounded_context.query_interfaces.*.id'],
+        },
+        references=[
+            Reference('bounded_context.aggregates.*.root_ref', 'entity'),
+            Reference('bounded_context.aggregates.*.entities.*', 'entity'),
+            Reference('bounded_context.aggregates.*.value_objects.*', 'value_object'),
+            Reference('bounded_context.entities.*.aggregate_ref', 'aggregate'),
+            Reference('bounded_context.entities.*.attributes.*.value_object_ref', 'value_object'),
+            Reference('bounded_context.entities.*.business_methods.*.parameters.*.value_object_ref', 'value_object'),
+            Reference('bounded_context.value_objects.*.attributes.*.value_object_ref', 'value_object'),
+            Reference('bounded_context.repositories.*.aggregate_ref', 'aggregate'),
+            Reference('bounded_context.domain_services.*.operations.*.parameters.*.value_object_ref',
+                      'value_object'),
+            Reference('bounded_context.application_services.*.operations.*.transaction_boundary'
+                      '.modifies_aggregates.*', 'aggregate'),
+            Reference('bounded_context.application_services.*.operations.*.workflow.loads_aggregates.*',
+                      'aggregate'),
+            Reference('bounded_context.application_services.*.operations.*.workflow.invokes_domain_services.*',
+                      'domain_service'),
+            Reference('bounded_context.application_services.*.operations.*.workflow.publishes_events.*',
+                      'domain_event'),
+            Reference('bounded_context.domain_events.*.aggregate_ref', 'aggregate'),
+            Reference('bounded_context.command_interfaces.*.aggregate_ref', 'aggregate'),
+            Reference('bounded_context.command_interfaces.*.command_records.*.modifies_aggregate', 'aggregate'),
+            Reference('bounded_context.command_interfaces.*.command_records.*.return_type_ref', 'value_object'),
+            Reference('bounded_context.command_interfaces.*.command_records.*.publishes_events.*', 'domain_event'),
+            Reference('bounded_context.query_interfaces.*.aggregate_ref', 'aggregate'),
+        ]
+    ),
+    SchemaType.DATA_ENGINEERING: ReferenceSpec(
+        definitions={
+            'domain': ['domains.*.id'],
+            'pipeline': ['pipelines.*.id'],
+            'stage': ['pipelines.*.stages.*.id'],
+            'transform': ['pipelines.*.stages.*.transforms.*.id'],
+            'dataset': ['datasets.*.id'],
+            'check': ['checks.*.id'],
+        },
+        references=[
+            Reference('system.domains.*', 'domain'),
+            Reference('domains.*.pipelines.*', 'pipeline'),
+            Reference('pipelines.*.stages.*.inputs.*', 'dataset'),
+            Reference('pipelines.*.stages.*.outputs.*', 'dataset'),
+            Reference('pipelines.*.stages.*.depends_on.*', 'stage'),
+            Reference('contracts.*.dataset', 'dataset'),
+            Reference('checks.*.dataset', 'dataset'),
+            Reference('lineage.*.upstream', 'dataset'),
+            Reference('lineage.*.downstream', 'dataset'),
+            Reference('lineage.*.transform', 'transform'),
+            Reference('field_lineage.*.upstream.dataset', 'dataset'),
+            Reference('field_lineage.*.downstream.dataset', 'dataset'),
+            Reference('field_lineage.*.transform', 'transform'),
+            Reference('governance.retention.*.dataset', 'dataset'),
+            Reference('governance.access.*.dataset', 'dataset'),
+            Reference('governance.pii_handling.*.dataset', 'dataset'),
+            Reference('observability.metrics.*.dataset', 'dataset'),
+            Reference('observability.slos.*.linked_check', 'check'),
+        ],
+        members={
+            'dataset_field': ('datasets.*', 'id', 'schema.fields.*.name'),
+        },
+        member_references=[
+            MemberReference('field_lineage.*.upstream', 'dataset', 'field', 'dataset_field'),
+            MemberReference('field_lineage.*.downstream', 'dataset', 'field', 'dataset_field'),
+        ]
+    ),
+    # Domain story IDs are shared across the stories of a file
+    SchemaType.DOMAIN_STORIES: ReferenceSpec(
+        definitions={
+            'actor': [f'{_STORY}.actors.*.actor_id'],
+            'work_object': [f'{_STORY}.work_objects.*.work_object_id'],
+            'aggregate': [f'{_STORY}.aggregates.*.aggregate_id'],
+            'repository': [f'{_STORY}.repositories.*.repository_id'],
+            'application_service': [f'{_STORY}.application_services.*.app_service_id'],
+            'domain_service': [f'{_STORY}.domain_services.*.domain_service_id'],
+            'command': [f'{_STORY}.commands.*.command_id'],
+            'query': [f'{_STORY}.queries.*.query_id'],
+            'read_model': [f'{_STORY}.read_models.*.read_model_id'],
+            'activity': [f'{_STORY}.activities.*.activity_id'],
+            'event': [f'{_STORY}.events.*.event_id'],
+            'policy': [f'{_STORY}.policies.*.policy_id'],
+            'business_rule': [f'{_STORY}.business_rules.*.rule_id'],
+        },
+        references=[
+            Reference(f'{_STORY}.work_objects.*.aggregate_id', 'aggregate'),
+            Reference(f'{_STORY}.aggregates.*.root_work_object_id', 'work_object'),
+            Reference(f'{_STORY}.aggregates.*.work_object_ids.*', 'work_object'),
+            Reference(f'{_STORY}.repositories.*.aggregate_id', 'aggregate'),
+            Reference(f'{_STORY}.application_services.*.commands_handled.*', 'command'),
+            Reference(f'{_STORY}.application_services.*.queries_handled.*', 'query'),
+            Reference(f'{_STORY}.domain_services.*.operates_on.*', ANY_KIND),
+            Reference(f'{_STORY}.commands.*.actor_ids.*', 'actor'),
+            Reference(f'{_STORY}.commands.*.target_aggregate_id', 'aggregate'),
+            Reference(f'{_STORY}.commands.*.invokes_app_services.*', 'application_service'),
+            Reference(f'{_STORY}.commands.*.invokes_domain_services.*', 'domain_service'),
+            Reference(f'{_STORY}.commands.*.emits_events.*', 'event'),
+            Reference(f'{_STORY}.queries.*.actor_ids.*', 'actor'),
+            Reference(f'{_STORY}.queries.*.returns_read_model_id', 'read_model'),
+            Reference(f'{_STORY}.activities.*.initiated_by_command_id', 'command'),
+            Reference(f'{_STORY}.activities.*.uses_work_object_ids.*', 'work_object'),
+            Reference(f'{_STORY}.activities.*.results_in_event_ids.*', 'event'),
+            Reference(f'{_STORY}.activities.*.calls_app_service_ids.*', 'application_service'),
+            Reference(f'{_STORY}.activities.*.calls_domain_service_ids.*', 'domain_service'),
+            Reference(f'{_STORY}.events.*.affected_aggregate_id', 'aggregate'),
+            Reference(f'{_STORY}.policies.*.when_event_id', 'event'),
+            Reference(f'{_STORY}.policies.*.issues_command_id', 'command'),
+            Reference(f'{_STORY}.business_rules.*.applies_to.*', ANY_KIND),
+        ]
+    ),
+}
+
+# Tactical models may hold a list of contexts; each one is checked on its own
+_CONTEXT_LIST_KEY = 'bounded_contexts'
+
+
+def iter_path(node: Any, pattern: str, path: str = "$") -> Iterator[Tuple[str, Any]]:
+    """Yield (location, value) for every value matching a dotted pattern"""
+    parts = pattern.split('.')
+    stack = [(node, 0, path)]
+    while stack:
+        current, index, location = stack.pop()
+        if index == len(parts):
+            yield location, current
+            continue
+        part = parts[index]
+        if part == '*':
+            if isinstance(current, list):
+                # Reversed so items come out in document order
+                for i in range(len(current) - 1, -1, -1):
+                    stack.append((current[i], index + 1, child_path(location, i)))
+        elif isinstance(current, dict) and part in current:
+            stack.append((current[part], index + 1, child_path(location, part)))
+
+
+def build_id_index(document: Any, spec: ReferenceSpec) -> Dict[str, Set[str]]:
+    """Collect the defined IDs of every kind"""
+    index: Dict[str, Set[str]] = {}
+    for kind, patterns in spec.definitions.items():
+        ids = index.setdefault(kind, set())
+        for pattern in patterns:
+            for _, value in iter_path(document, pattern):
+                if isinstance(value, str):
+                    ids.add(value)
+    index[ANY_KIND] = set().union(*index.values()) if index else set()
+    return index
+
+
+def build_member_index(document: Any, spec: ReferenceSpec) -> Dict[str, Dict[str, Set[str]]]:
+    """
+    Collect the member names of every owning ID, per member kind.
+
+    Owners declaring no members (e.g. a dataset whose schema lives in an
+    external file) are left out, so references to their members are not checked.
+    """
+    index: Dict[str, Dict[str, Set[str]]] = {}
+    for kind, (owner_pattern, id_key, member_pattern) in (spec.members or {}).items():
+        owners = index.setdefault(kind, {})
+        for _, owner in iter_path(document, owner_pattern):
+            if not isinstance(owner, dict) or not isinstance(owner.get(id_key), str):
+                continue
+            names = {value for _, value in iter_path(owner, member_pattern) if isinstance(value, str)}
+            if names:
+                owners.setdefault(owner[id_key], set()).update(names)
+    return index
+
+
+def check_references(document: Any, schema_type: SchemaType) -> List[BrokenReference]:
+    """
+    Find every reference to an undefined ID, or to an undefined member of one.
+
+    Args:
+        document: Parsed model
+        schema_type: Detected model type
+
+    Returns:
+        Broken references in document order per reference field (empty when
+        the model is consistent or its type has no reference rules)
+    """
+    spec = REFERENCE_SPECS.get(schema_type)
+    if spec is None or not isinstance(document, dict):
+        return []
+
+    if schema_type == SchemaType.TACTICAL_DDD and _CONTEXT_LIST_KEY in document:
+        errors: List[BrokenReference] = []
+        for i, bc in enumerate(document[_CONTEXT_LIST_KEY] or []):
+            errors.extend(_check(
+                {'bounded_context': bc}, spec,
+                child_path(child_path("$", _CONTEXT_LIST_KEY), i)
+            ))
+        return errors
+
+    return _check(document, spec, "$")
+
+
+def _check(document: Any, spec: ReferenceSpec, root_path: str) -> List[BrokenReference]:
+    index = build_id_index(document, spec)
+    errors: List[BrokenReference] = []
+
+    for reference in spec.references:
+        known = index.get(reference.kind, set())
+        for path, value in iter_path(document, reference.pattern):
+            if not isinstance(value, str) or not value or value in known:
+                continue
+            if reference.internal_prefix and not value.startswith(reference.internal_prefix):
+                continue
+            if root_path != "$":
+                # Re-root paths of contexts checked from a bounded_contexts list
+                path = root_path + path[len("$.bounded_context"):]
+            errors.append(BrokenReference(path, value, reference.kind))
+
+    members = build_member_index(document, spec)
+    for reference in spec.member_references or []:
+        owners = members.get(reference.kind, {})
+        for path, value in iter_path(document, reference.pattern):
+            if not isinstance(value, dict):
+                continue
+            owner, member = value.get(reference.owner_key), value.get(reference.member_key)
+            if not isinstance(owner, str) or not isinstance(member, str):
+                continue
+            names = owners.get(owner)
+            if names is None or member in names:
+                continue
+            if root_path != "$":
+                path = root_path + path[len("$.bounded_context"):]
+            errors.append(BrokenReference(child_path(path, reference.member_key), f"{owner}.{member}",
+                                          reference.kind))
+
+    return errors
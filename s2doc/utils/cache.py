@@ -0,0 +1,84 @@
+"""On-disk build cache for generated documentation artifacts"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Union
+
+from ..__version__ import __version__
+
+CACHE_FILENAME = ".s2doc-cache.json"
+
+
+def content_hash(obj: Any) -> str:
+    """
+    Stable hash of any YAML-like structure (dicts, lists, scalars).
+
+    The s2doc version is part of the hash, so upgrading the tool invalidates
+    everything that was cached by an older release.
+    """
+    payload = json.dumps([__version__, obj], sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class BuildCache:
+    """
+    Key/value cache persisted as a single JSON file, grouped by namespace.
+
+    Values must be JSON-serializable. Entries of a namespace that were not read or
+    written during a run are dropped on save, so the cache only holds what the
+    latest build produced. Namespaces untouched by the run are kept as they are.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._data: Dict[str, Dict[str, Any]] = {}
+        self._touched: Dict[str, Set[str]] = {}
+        self._dirty = False
+
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    self._data = data
+            except (OSError, ValueError):
+                # A corrupt cache is simply rebuilt
+                self._data = {}
+
+    @classmethod
+    def for_output_dir(cls, output_dir: Union[str, Path]) -> 'BuildCache':
+        """Cache stored alongside generated files"""
+        return cls(Path(output_dir) / CACHE_FILENAME)
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Get cached value or None"""
+        entries = self._data.get(namespace, {})
+        if key in entries:
+            self._touched.setdefault(namespace, set()).add(key)
+            return entries[key]
+        return None
+
+    def put(self, namespace: str, key: str, value: Any) -> None:
+        """Store value"""
+        entries = self._data.setdefault(namespace, {})
+        if key not in entries or entries[key] != value:
+            entries[key] = value
+            self._dirty = True
+        self._touched.setdefault(namespace, set()).add(key)
+
+    def save(self) -> None:
+        """Write the cache, keeping only entries used by this run"""
+        for namespace, keys in self._touched.items():
+            entries = self._data.get(namespace, {})
+            if set(entries) != keys:
+                self._data[namespace] = {k: v for k, v in entries.items() if k in keys}
+                self._dirty = True
+
+        if not self._dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self._data, f, ensure_ascii=False)
+        self._dirty = False
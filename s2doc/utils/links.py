@@ -0,0 +1,47 @@
+"""Cross-file link resolution for split documentation output"""
+
+import re
+from typing import Dict, Optional, Set
+
+# Markdown link to an in-page anchor: [text](#anchor)
+_ANCHOR_LINK_RE = re.compile(r'\]\(#([^)\s]+)\)')
+
+# Anchor definition emitted by the converters: <a id="anchor"></a>
+_ANCHOR_DEF_RE = re.compile(r'<a id="([^"]+)"></a>')
+
+
+def defined_anchors(markdown: str) -> Set[str]:
+    """Anchor IDs defined in a generated markdown document"""
+    return set(_ANCHOR_DEF_RE.findall(markdown))
+
+
+def rewrite_anchor_links(
+    markdown: str,
+    current_file: str,
+    anchor_map: Dict[str, str],
+    local_anchors: Optional[Set[str]] = None
+) -> str:
+    """
+    Point in-page anchor links at the file that actually defines the anchor.
+
+    Args:
+        markdown: Generated markdown for one output file
+        current_file: File name the markdown will be written to
+        anchor_map: Global map of anchor ID -> file name defining it
+        local_anchors: Anchors defined in this file that win over the global map
+            (IDs such as value objects may repeat across documents)
+
+    Returns:
+        Markdown where links to anchors defined in other files become
+        [text](other.md#anchor); local and unknown anchors are left alone
+    """
+    def _resolve(match: 're.Match') -> str:
+        anchor = match.group(1)
+        if local_anchors and anchor in local_anchors:
+            return match.group(0)
+        target = anchor_map.get(anchor)
+        if target and target != current_file:
+            return f"]({target}#{anchor})"
+        return match.group(0)
+
+    return _ANCHOR_LINK_RE.sub(_resolve, markdown)
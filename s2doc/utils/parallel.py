@@ -0,0 +1,66 @@
+"""Worker pool helpers shared by converters"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def resolve_workers(workers: Optional[int], task_count: int) -> int:
+    """
+    Decide how many worker processes to use for a batch of tasks.
+
+    Args:
+        workers: Requested worker count (None or 0 = one per CPU)
+        task_count: Number of tasks in the batch
+
+    Returns:
+        Worker count, never more than the number of tasks
+    """
+    if not workers or workers < 0:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, task_count))
+
+
+def parallel_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    workers: Optional[int] = None,
+    initializer: Optional[Callable[..., Any]] = None,
+    initargs: Tuple = ()
+) -> List[R]:
+    """
+    Apply func to every item in a process pool and return results in input order.
+
+    Falls back to a plain loop when only one worker would be used, so small
+    batches don't pay process startup cost. func and items must be picklable
+    (module-level functions, functools.partial of them, plain data).
+
+    Large shared state (a whole model) should be handed over once per worker via
+    initializer/initargs instead of being bound into func, which would pickle it
+    for every task. The initializer also runs in-process for the serial fallback.
+
+    Args:
+        func: Function to apply
+        items: Inputs
+        workers: Worker count (None or 0 = one per CPU)
+        initializer: Called once in every worker before any task
+        initargs: Arguments for initializer
+
+    Returns:
+        List of results, in the same order as items
+    """
+    items = list(items)
+    workers = resolve_workers(workers, len(items))
+
+    if workers == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        return [func(item) for item in items]
+
+    chunksize = max(1, len(items) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer,
+                             initargs=initargs) as pool:
+        return list(pool.map(func, items, chunksize=chunksize))
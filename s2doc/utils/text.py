@@ -0,0 +1,94 @@
+"""Text normalization shared by the converters"""
+
+from functools import lru_cache
+from typing import Tuple
+
+# Models repeat the same few thousand names across sections, diagrams and
+# indexes; results are memoized in bounded caches
+_CACHE_SIZE = 8192
+
+# Snake-case words always shown in capitals
+_ACRONYMS = frozenset({'acl', 'api'})
+
+
+def escape_markdown(text: str) -> str:
+    """Escape special characters in markdown"""
+    if not text:
+        return ""
+    # Escape pipe characters in table cells
+    return text.replace("|", "\\|")
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def humanize_name(name: str) -> str:
+    """
+    Convert PascalCase or camelCase names to human-readable format.
+    Examples:
+        PaymentTemplate -> Payment Template
+        XMLParser -> XML Parser
+        CaféÉcole -> Café École
+
+    If the name already contains spaces, return it as-is.
+    """
+    if not name or ' ' in name:
+        return name or ""
+
+    # Space before a capital following a lowercase letter, or before a capital
+    # starting a lowercase run; str case tests cover non-ASCII letters too
+    result = []
+    last = len(name) - 1
+    for i, char in enumerate(name):
+        if i > 0 and char.isupper() and (name[i - 1].islower() or (i < last and name[i + 1].islower())):
+            result.append(' ')
+        result.append(char)
+    return ''.join(result)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def humanize_identifier(name: str) -> str:
+    """
+    Convert kebab-case, PascalCase or camelCase names to human-readable format.
+    Examples:
+        user-events -> User Events
+        UserEvents -> User Events
+    """
+    if not name or ' ' in name:
+        return name or ""
+    if '-' in name:
+        return ' '.join(word.capitalize() for word in name.split('-'))
+    return humanize_name(name)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def humanize_snake_case(text: str) -> str:
+    """Convert snake_case to capitalized words (customer_supplier -> Customer Supplier, acl -> ACL)"""
+    if not text:
+        return ""
+    return ' '.join(word.upper() if word.lower() in _ACRONYMS else word.capitalize()
+                    for word in text.split('_'))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def wrap_lines(text: str, max_width: int = 20) -> Tuple[str, ...]:
+    """
+    Wrap text at word boundaries into lines of at most max_width characters.
+
+    Words longer than max_width get a line of their own. Text that already
+    fits is returned unchanged as a single line.
+    """
+    if len(text) <= max_width:
+        return (text,)
+
+    lines = []
+    current = ""
+    for word in text.split():
+        if not current:
+            current = word
+        elif len(current) + 1 + len(word) <= max_width:
+            current = f"{current} {word}"
+        else:
+            lines.append(current)
+            current = word
+    if current:
+        lines.append(current)
+    return tuple(lines)
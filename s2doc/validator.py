@@ -0,0 +1,399 @@
+"""JSON Schema validation of model files against the bundled schemas
+
+Schemas are compiled once into nested validator functions, covering the
+subset of JSON Schema the s2doc schemas use (type, properties, required,
+additionalProperties, items, enum, const, pattern, length/size/range bounds,
+allOf/anyOf/oneOf and local $ref). Schemas using any other validation
+keyword are rejected at compile time rather than silently checked less
+strictly than they say. Parsing the YAML schema is the slow part, so the
+parsed schema is cached on disk keyed by the hash of the schema file.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+
+import yaml
+
+from .detector import SchemaType
+
+# Schema file for each model type, relative to the schemas directory
+SCHEMA_FILES = {
+    SchemaType.DOMAIN_STORIES: "domain-stories-schema.yaml",
+    SchemaType.STRATEGIC_DDD: "strategic-ddd.schema.yaml",
+    SchemaType.TACTICAL_DDD: "tactical-ddd.schema.yaml",
+    SchemaType.DATA_ENGINEERING: "data-eng.schema.yaml",
+}
+
+# Schemas bundled as package data (a plain directory on Python 3.8)
+try:
+    from importlib.resources import files as _package_files
+    DEFAULT_SCHEMAS_DIR = _package_files(__package__) / "schemas"
+except ImportError:
+    DEFAULT_SCHEMAS_DIR = Path(__file__).resolve().parent / "schemas"
+
+# Standard JSON Schema keywords the compiler does not implement
+UNSUPPORTED_KEYWORDS = frozenset({
+    'not', 'if', 'then', 'else', 'dependencies', 'dependentRequired', 'dependentSchemas',
+    'patternProperties', 'propertyNames', 'minProperties', 'maxProperties',
+    'uniqueItems', 'contains', 'minContains', 'maxContains', 'prefixItems', 'additionalItems',
+    'unevaluatedItems', 'unevaluatedProperties', 'multipleOf', '$dynamicRef', '$recursiveRef',
+})
+
+
+class ValidationError(NamedTuple):
+    """A single schema violation"""
+    path: str       # Location in the document, e.g. $.system.domains[0].id
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}"
+
+
+# A compiled validator appends errors for value (found at path) to errors
+Validator = Callable[[Any, str, List[ValidationError]], None]
+
+
+def _is_string(value: Any) -> bool:
+    # YAML turns unquoted dates into date objects; JSON Schema sees strings
+    return isinstance(value, (str, datetime.date))
+
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    'object': lambda v: isinstance(v, dict),
+    'array': lambda v: isinstance(v, list),
+    'string': _is_string,
+    'integer': lambda v: isinstance(v, int) and not isinstance(v, bool),
+    'number': lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    'boolean': lambda v: isinstance(v, bool),
+    'null': lambda v: v is None,
+}
+
+
+def child_path(path: str, key: Any) -> str:
+    """Path of an object property or array item"""
+    if isinstance(key, int):
+        return f"{path}[{key}]"
+    if re.match(r'^[A-Za-z_][A-Za-z0-9_]*$', str(key)):
+        return f"{path}.{key}"
+    return f"{path}[{json.dumps(str(key))}]"
+
+
+class SchemaCompiler:
+    """
+    Compile a JSON Schema document into validator functions.
+
+    Raises ValueError for schemas using keywords it cannot enforce.
+    """
+
+    def __init__(self, root: dict):
+        self.root = root
+        self._refs: Dict[str, Validator] = {}
+
+    def compile(self, schema: Any) -> Validator:
+        """Compile a (sub)schema"""
+        if schema is False:
+            return lambda value, path, errors: errors.append(ValidationError(path, "no value is allowed here"))
+        if schema is True or not isinstance(schema, dict):
+            return lambda value, path, errors: None
+
+        unsupported = UNSUPPORTED_KEYWORDS.intersection(schema)
+        if unsupported:
+            raise ValueError(f"Unsupported schema keyword(s): {', '.join(sorted(unsupported))}")
+        if isinstance(schema.get('items'), list):
+            raise ValueError("Unsupported schema keyword: items as a list of schemas")
+
+        checks: List[Validator] = []
+
+        if '$ref' in schema:
+            checks.append(self._compile_ref(schema['$ref']))
+
+        for keyword in ('allOf', 'anyOf', 'oneOf'):
+            if keyword in schema:
+                checks.append(self._compile_combinator(keyword, schema[keyword]))
+
+        if 'const' in schema:
+            const = schema['const']
+            checks.append(lambda v, p, e: None if v == const else
+                          e.append(ValidationError(p, f"must be {json.dumps(const, default=str)}")))
+
+        if 'enum' in schema:
+            allowed = schema['enum']
+            allowed_text = ", ".join(json.dumps(a, default=str) for a in allowed)
+            checks.append(lambda v, p, e: None if v in allowed else
+                          e.append(ValidationError(p, f"{json.dumps(v, default=str)} is not one of {allowed_text}")))
+
+        checks.extend(self._compile_string(schema))
+        checks.extend(self._compile_number(schema))
+        checks.extend(self._compile_array(schema))
+        checks.extend(self._compile_object(schema))
+
+        type_check = self._compile_type(schema.get('type'))
+
+        def validate(value: Any, path: str, errors: List[ValidationError]) -> None:
+            # A value of the wrong type would only produce noise from other keywords
+            if type_check is not None and not type_check(value, path, errors):
+                return
+            for check in checks:
+                check(value, path, errors)
+
+        return validate
+
+    def _compile_type(self, types: Any) -> Optional[Callable[[Any, str, List[ValidationError]], bool]]:
+        if types is None:
+            return None
+        names = types if isinstance(types, list) else [types]
+        unknown = [name for name in names if name not in _TYPE_CHECKS]
+        if unknown:
+            raise ValueError(f"Unsupported schema type(s): {', '.join(map(str, unknown))}")
+        tests = [_TYPE_CHECKS[name] for name in names]
+        expected = " or ".join(names)
+
+        def check_type(value: Any, path: str, errors: List[ValidationError]) -> bool:
+            if any(test(value) for test in tests):
+                return True
+            errors.append(ValidationError(path, f"expected {expected}, got {_type_name(value)}"))
+            return False
+
+        return check_type
+
+    def _compile_ref(self, ref: str) -> Validator:
+        """Compile a local reference once; recursive references resolve lazily"""
+        if ref not in self._refs:
+            compiled: List[Validator] = []
+            self._refs[ref] = lambda value, path, errors: compiled[0](value, path, errors)
+            compiled.append(self.compile(self._resolve(ref)))
+        return self._refs[ref]
+
+    def _resolve(self, ref: str) -> Any:
+        if not ref.startswith('#'):
+            raise ValueError(f"Only local $ref is supported, got '{ref}'")
+        node: Any = self.root
+        for part in ref.lstrip('#').strip('/').split('/'):
+            if not part:
+                continue
+            part = part.replace('~1', '/').replace('~0', '~')
+            if not isinstance(node, dict) or part not in node:
+                raise ValueError(f"Unresolvable $ref '{ref}'")
+            node = node[part]
+        return node
+
+    def _compile_combinator(self, keyword: str, subschemas: List[Any]) -> Validator:
+        validators = [self.compile(sub) for sub in subschemas]
+
+        def matches(validator: Validator, value: Any, path: str) -> List[ValidationError]:
+            errors: List[ValidationError] = []
+            validator(value, path, errors)
+            return errors
+
+        if keyword == 'allOf':
+            def check_all(value: Any, path: str, errors: List[ValidationError]) -> None:
+                for validator in validators:
+                    validator(value, path, errors)
+            return check_all
+
+        if keyword == 'anyOf':
+            def check_any(value: Any, path: str, errors: List[ValidationError]) -> None:
+                results = [matches(v, value, path) for v in validators]
+                if all(results):
+                    errors.append(ValidationError(path, "does not match any of the allowed alternatives"))
+                    # Report the closest alternative
+                    errors.extend(min(results, key=len))
+            return check_any
+
+        def check_one(value: Any, path: str, errors: List[ValidationError]) -> None:
+            results = [matches(v, value, path) for v in validators]
+            valid = sum(1 for r in results if not r)
+            if valid == 0:
+                errors.append(ValidationError(path, "does not match any of the allowed alternatives"))
+                errors.extend(min(results, key=len))
+            elif valid > 1:
+                errors.append(ValidationError(path, f"matches {valid} alternatives, expected exactly one"))
+        return check_one
+
+    def _compile_string(self, schema: dict) -> List[Validator]:
+        checks: List[Validator] = []
+
+        if 'pattern' in schema:
+            pattern = schema['pattern']
+            regex = re.compile(pattern)
+            checks.append(lambda v, p, e: None if not isinstance(v, str) or regex.search(v) else
+                          e.append(ValidationError(p, f"{json.dumps(v)} does not match pattern {pattern}")))
+        if 'minLength' in schema:
+            low = schema['minLength']
+            checks.append(lambda v, p, e: None if not isinstance(v, str) or len(v) >= low else
+                          e.append(ValidationError(p, f"must be at least {low} characters")))
+        if 'maxLength' in schema:
+            high = schema['maxLength']
+            checks.append(lambda v, p, e: None if not isinstance(v, str) or len(v) <= high else
+                          e.append(ValidationError(p, f"must be at most {high} characters")))
+
+        return checks
+
+    def _compile_number(self, schema: dict) -> List[Validator]:
+        checks: List[Validator] = []
+        is_number = _TYPE_CHECKS['number']
+
+        bounds = [
+            ('minimum', lambda v, b: v >= b, "must be >= {}"),
+            ('maximum', lambda v, b: v <= b, "must be <= {}"),
+            ('exclusiveMinimum', lambda v, b: v > b, "must be > {}"),
+            ('exclusiveMaximum', lambda v, b: v < b, "must be < {}"),
+        ]
+        for keyword, test, message in bounds:
+            if keyword in schema:
+                bound = schema[keyword]
+                text = message.format(bound)
+                checks.append(lambda v, p, e, test=test, bound=bound, text=text:
+                              None if not is_number(v) or test(v, bound) else e.append(ValidationError(p, text)))
+
+        return checks
+
+    def _compile_array(self, schema: dict) -> List[Validator]:
+        checks: List[Validator] = []
+
+        if 'minItems' in schema:
+            low = schema['minItems']
+            checks.append(lambda v, p, e: None if not isinstance(v, list) or len(v) >= low else
+                          e.append(ValidationError(p, f"must have at least {low} item(s)")))
+        if 'maxItems' in schema:
+            high = schema['maxItems']
+            checks.append(lambda v, p, e: None if not isinstance(v, list) or len(v) <= high else
+                          e.append(ValidationError(p, f"must have at most {high} item(s)")))
+        if 'items' in schema:
+            item_validator = self.compile(schema['items'])
+
+            def check_items(value: Any, path: str, errors: List[ValidationError]) -> None:
+                if isinstance(value, list):
+                    for i, item in enumerate(value):
+                        item_validator(item, child_path(path, i), errors)
+            checks.append(check_items)
+
+        return checks
+
+    def _compile_object(self, schema: dict) -> List[Validator]:
+        checks: List[Validator] = []
+        properties = {name: self.compile(sub) for name, sub in (schema.get('properties') or {}).items()}
+        required = schema.get('required') or []
+        additional = schema.get('additionalProperties', True)
+        additional_validator = self.compile(additional) if isinstance(additional, dict) else None
+
+        if required:
+            def check_required(value: Any, path: str, errors: List[ValidationError]) -> None:
+                if isinstance(value, dict):
+                    for name in required:
+                        if name not in value:
+                            errors.append(ValidationError(path, f"missing required property '{name}'"))
+            checks.append(check_required)
+
+        if properties or additional is not True:
+            def check_properties(value: Any, path: str, errors: List[ValidationError]) -> None:
+                if not isinstance(value, dict):
+                    return
+                for key, item in value.items():
+                    validator = properties.get(key)
+                    if validator is not None:
+                        validator(item, child_path(path, key), errors)
+                    elif additional is False:
+                        errors.append(ValidationError(path, f"unexpected property '{key}'"))
+                    elif additional_validator is not None:
+                        additional_validator(item, child_path(path, key), errors)
+            checks.append(check_properties)
+
+        return checks
+
+
+def _type_name(value: Any) -> str:
+    for name in ('null', 'boolean', 'integer', 'number', 'string', 'array', 'object'):
+        if _TYPE_CHECKS[name](value):
+            return name
+    return type(value).__name__
+
+
+def default_cache_dir() -> Path:
+    """Per-user directory for parsed schemas"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(base) / 's2doc' / 'schemas'
+
+
+class SchemaValidator:
+    """
+    Validate documents against one schema file.
+
+    The schema is loaded and compiled once; validate() can then be called for
+    any number of documents.
+    """
+
+    def __init__(self, schema_path: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None):
+        self.schema_path = Path(schema_path) if isinstance(schema_path, str) else schema_path
+        self.schema = load_schema(self.schema_path, cache_dir)
+        self._validate = SchemaCompiler(self.schema).compile(self.schema)
+
+    def validate(self, document: Any) -> List[ValidationError]:
+        """Return all violations in document (empty when valid)"""
+        errors: List[ValidationError] = []
+        self._validate(document, "$", errors)
+        return errors
+
+
+def load_schema(schema_path: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None) -> dict:
+    """
+    Load a YAML schema, via the on-disk cache keyed by the schema file's hash.
+
+    Args:
+        schema_path: Schema file (a path or a package resource)
+        cache_dir: Cache directory (default: ~/.cache/s2doc/schemas)
+    """
+    raw = (Path(schema_path) if isinstance(schema_path, str) else schema_path).read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    cache_file = Path(cache_dir or default_cache_dir()) / f"{digest}.json"
+
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    schema = yaml.safe_load(raw)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(schema, f, default=str)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # Caching is an optimisation only
+        pass
+    return schema
+
+
+_validators: Dict[str, SchemaValidator] = {}
+
+
+def get_validator(
+    schema_type: SchemaType,
+    schemas_dir: Optional[Union[str, Path]] = None,
+    cache_dir: Optional[Union[str, Path]] = None
+) -> SchemaValidator:
+    """
+    Get the compiled validator for a model type, compiling it on first use.
+
+    Raises:
+        ValueError: If there is no schema for the type, or it uses unsupported keywords
+        FileNotFoundError: If the schema file is missing
+    """
+    if schema_type not in SCHEMA_FILES:
+        raise ValueError(f"No schema for {schema_type.value}")
+
+    schema_path = (Path(schemas_dir).resolve() if schemas_dir else DEFAULT_SCHEMAS_DIR) / SCHEMA_FILES[schema_type]
+    if not schema_path.is_file():
+        raise FileNotFoundError(f"Schema file '{schema_path}' not found (use --schemas-dir)")
+
+    key = str(schema_path)
+    if key not in _validators:
+        _validators[key] = SchemaValidator(schema_path, cache_dir)
+    return _validators[key]
@@ -0,0 +1,212 @@
+"""Workspace mode: one strategic model plus the tactical design of its bounded contexts"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import yaml
+
+from .detector import SchemaType, detect_schema_type
+from .converters.strategic import StrategicDDDConverter
+from .converters.tactical import TacticalDDDConverter, split_bounded_contexts
+from .utils.links import defined_anchors, rewrite_anchor_links
+from .utils.parallel import parallel_map
+
+TACTICAL_PATTERNS = ("*.yaml", "*.yml")
+
+
+def load_yaml_documents(path: Union[str, Path]) -> List[dict]:
+    """Load every document of a YAML file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [doc for doc in yaml.safe_load_all(f) if doc is not None]
+
+
+def load_yaml_document(path: Union[str, Path]) -> Optional[dict]:
+    """Load a YAML file, keeping the last document (frontmatter comes first)"""
+    docs = load_yaml_documents(path)
+    return docs[-1] if docs else None
+
+
+@dataclass
+class ContextSymbol:
+    """Everything the workspace knows about one bounded context"""
+    context_id: str
+    name: str
+    domain_ref: str = ""
+    domain_name: str = ""
+    strategic: bool = False
+    tactical_source: Optional[str] = None
+    tactical_data: Optional[dict] = None
+
+    @property
+    def tactical_file(self) -> Optional[str]:
+        """Output file of the tactical design, if the context has one"""
+        return f"{self.context_id}.md" if self.tactical_data is not None else None
+
+
+@dataclass
+class Workspace:
+    """
+    Strategic model and tactical files loaded once into a shared symbol table.
+
+    contexts is keyed by bounded context ID and joins both views of a context.
+    anchor_map maps every linkable ID to the output file that defines it, and is
+    used to turn in-page links into cross-document links after rendering.
+    """
+    strategic_data: dict
+    overview_name: str
+    contexts: Dict[str, ContextSymbol] = field(default_factory=dict)
+    anchor_map: Dict[str, str] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+
+    @classmethod
+    def load(
+        cls,
+        strategic_path: Union[str, Path],
+        tactical_dir: Union[str, Path],
+        workers: Optional[int] = None
+    ) -> 'Workspace':
+        """
+        Parse the strategic file and every tactical YAML file in tactical_dir.
+
+        Files in tactical_dir that are not Tactical DDD are listed in skipped.
+        """
+        strategic_path = Path(strategic_path)
+        strategic_data = load_yaml_document(strategic_path)
+        if detect_schema_type(strategic_data) != SchemaType.STRATEGIC_DDD:
+            raise ValueError(f"'{strategic_path}' is not a Strategic DDD model")
+
+        paths = sorted({p for pattern in TACTICAL_PATTERNS for p in Path(tactical_dir).glob(pattern)})
+        paths = [p for p in paths if p.resolve() != strategic_path.resolve()]
+        file_documents = parallel_map(load_yaml_documents, paths, workers)
+
+        workspace = cls(strategic_data, f"{strategic_path.stem}.md")
+        for path, documents in zip(paths, file_documents):
+            tactical = [d for d in documents if detect_schema_type(d) == SchemaType.TACTICAL_DDD]
+            if not tactical:
+                workspace.skipped.append(str(path))
+            # A file may hold several contexts: a bounded_contexts list or one per document
+            for data in tactical:
+                for document in split_bounded_contexts(data):
+                    workspace.add_tactical(document, str(path))
+
+        workspace.build_symbols()
+        return workspace
+
+    def add_tactical(self, data: dict, source: str) -> None:
+        """Register the tactical design of one bounded context"""
+        bc = data['bounded_context']
+        symbol = self.contexts.setdefault(bc['id'], ContextSymbol(bc['id'], bc.get('name', bc['id'])))
+        if symbol.tactical_data is not None:
+            raise ValueError(
+                f"Bounded context '{bc['id']}' is defined in both {symbol.tactical_source} and {source}"
+            )
+        symbol.tactical_source = source
+        symbol.tactical_data = data
+        symbol.domain_ref = symbol.domain_ref or bc.get('domain_ref', '')
+
+    def build_symbols(self) -> None:
+        """Join strategic contexts into the symbol table and build the anchor map"""
+        system = self.strategic_data['system']
+        domain_names = {d['id']: d.get('name', d['id']) for d in system.get('domains', [])}
+
+        for bc in system.get('bounded_contexts', []):
+            symbol = self.contexts.setdefault(bc['id'], ContextSymbol(bc['id'], bc.get('name', bc['id'])))
+            symbol.name = bc.get('name', symbol.name)
+            symbol.domain_ref = bc.get('domain_ref', symbol.domain_ref)
+            symbol.strategic = True
+
+        for symbol in self.contexts.values():
+            symbol.domain_name = domain_names.get(symbol.domain_ref, "")
+
+        # Strategic IDs first: a context's own anchor is its strategic section
+        anchor_map: Dict[str, str] = {}
+        for key in ('domains', 'bounded_contexts', 'context_mappings', 'bff_scopes', 'bff_interfaces'):
+            for entity in system.get(key, []):
+                anchor_map.setdefault(entity.get('id', ''), self.overview_name)
+
+        for symbol in self.contexts.values():
+            if symbol.tactical_data is None:
+                continue
+            bc = symbol.tactical_data['bounded_context']
+            for value in bc.values():
+                if isinstance(value, list):
+                    for entity in value:
+                        if isinstance(entity, dict) and 'id' in entity:
+                            anchor_map.setdefault(entity['id'], symbol.tactical_file)
+
+        self.anchor_map = anchor_map
+
+    @property
+    def tactical_docs(self) -> Dict[str, str]:
+        """Bounded context ID -> tactical output file"""
+        return {cid: s.tactical_file for cid, s in self.contexts.items() if s.tactical_file}
+
+    @property
+    def unplaced_contexts(self) -> List[str]:
+        """Tactical contexts that the strategic model does not declare"""
+        return [cid for cid, s in self.contexts.items() if s.tactical_file and not s.strategic]
+
+    @property
+    def undesigned_contexts(self) -> List[str]:
+        """Strategic contexts without a tactical file"""
+        return [cid for cid, s in self.contexts.items() if s.strategic and not s.tactical_file]
+
+    def render(self, key: Optional[str]) -> Tuple[str, str]:
+        """
+        Render one document of the workspace with cross-document links resolved.
+
+        Args:
+            key: Bounded context ID of a tactical document, or None for the strategic one
+
+        Returns:
+            Tuple of (output file name, markdown)
+        """
+        if key is None:
+            converter = StrategicDDDConverter(self.strategic_data, tactical_docs=self.tactical_docs)
+            filename = self.overview_name
+        else:
+            symbol = self.contexts[key]
+            strategic_context = None
+            if symbol.strategic:
+                strategic_context = {'name': symbol.name, 'domain_name': symbol.domain_name}
+            converter = TacticalDDDConverter(symbol.tactical_data, strategic_context=strategic_context)
+            filename = symbol.tactical_file
+
+        markdown = converter.convert_to_markdown()
+        markdown = rewrite_anchor_links(markdown, filename, self.anchor_map, defined_anchors(markdown))
+        return filename, markdown
+
+    def convert(self, output_dir: Union[str, Path], workers: Optional[int] = None) -> List[Path]:
+        """
+        Convert every document of the workspace in a worker pool.
+
+        Returns:
+            Paths of the written files, strategic overview first
+        """
+        output_dir = Path(output_dir)
+        keys: List[Optional[str]] = [None] + sorted(self.tactical_docs)
+        results = parallel_map(_render_workspace_document, keys, workers,
+                               initializer=_init_workspace_worker, initargs=(self,))
+
+        written = []
+        for filename, markdown in results:
+            path = output_dir / filename
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(markdown)
+            written.append(path)
+        return written
+
+
+# Workspace shared by conversion workers, set once per worker process
+_workspace_worker_state: dict = {}
+
+
+def _init_workspace_worker(workspace: Workspace) -> None:
+    """Hand the loaded workspace to a worker once"""
+    _workspace_worker_state['workspace'] = workspace
+
+
+def _render_workspace_document(key: Optional[str]) -> Tuple[str, str]:
+    """Render one workspace document in a worker"""
+    return _workspace_worker_state['workspace'].render(key)
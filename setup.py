@@ -25,6 +25,7 @@ setup(
     author_email="igor.music@example.com",
     url="https://github.com/FreeSideNomad/s2doc",
     packages=find_packages(exclude=['tests', 'tests.*']),
+    package_data={'s2doc': ['schemas/*.yaml']},
     python_requires=">=3.8",
     install_requires=[
         "PyYAML>=6.0",
@@ -18,8 +18,8 @@ def examples_dir(project_root):
 
 @pytest.fixture(scope="session")
 def schemas_dir(project_root):
-    """Path to schemas directory"""
-    return project_root / "schemas"
+    """Path to the bundled schemas directory"""
+    return project_root / "s2doc" / "schemas"
 
 
 @pytest.fixture(scope="session")
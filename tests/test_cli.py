@@ -67,6 +67,16 @@ class TestCLI:
         assert os.path.exists(output_file)
         assert os.path.getsize(output_file) > 0
 
+    def test_cli_strategic_split_conversion(self, examples_dir, output_dir):
+        """Test CLI --split writes an overview plus per-domain files"""
+        input_file = str(examples_dir / "payments-strategic.yaml")
+
+        with patch('sys.argv', ['s2doc', input_file, '-o', output_dir, '--split', '-j', '1']):
+            main()
+
+        assert os.path.exists(os.path.join(output_dir, "payments-strategic.md"))
+        assert os.path.exists(os.path.join(output_dir, "dom_payment_scheduling.md"))
+
     def test_cli_domain_stories_conversion(self, examples_dir, output_dir):
         """Test CLI with domain stories example"""
         input_file = str(examples_dir / "cb-domain-stories.yaml")
@@ -113,26 +123,32 @@ class TestCLI:
                 main()
             assert exc_info.value.code == 2  # Schema detection failed
 
-    def test_cli_default_output_directory(self, examples_dir):
+    def test_cli_default_output_directory(self, examples_dir, tmp_path, monkeypatch):
         """Test CLI with default output directory (current directory)"""
         input_file = str(examples_dir / "payments-tactical.yaml")
-        expected_output = "bc_payment_scheduling.md"
+        monkeypatch.chdir(tmp_path)
 
-        try:
-            # Clean up if file exists
-            if os.path.exists(expected_output):
-                os.remove(expected_output)
+        with patch('sys.argv', ['s2doc', input_file]):
+            main()
 
-            with patch('sys.argv', ['s2doc', input_file]):
-                main()
+        expected_output = tmp_path / "bc_payment_scheduling.md"
+        assert expected_output.exists()
+        assert expected_output.stat().st_size > 0
+        assert not (tmp_path / ".s2doc-cache.json").exists()
 
-            assert os.path.exists(expected_output)
-            assert os.path.getsize(expected_output) > 0
+    def test_cli_multi_document_tactical(self, output_dir):
+        """Test a YAML stream with one tactical context per document"""
+        input_file = os.path.join(output_dir, "contexts.yaml")
+        with open(input_file, 'w') as f:
+            f.write("bounded_context: {id: bc_a, name: A, aggregates: []}\n"
+                    "---\n"
+                    "bounded_context: {id: bc_b, name: B, entities: []}\n")
+
+        with patch('sys.argv', ['s2doc', input_file, '-o', output_dir, '-j', '1']):
+            main()
 
-        finally:
-            # Clean up
-            if os.path.exists(expected_output):
-                os.remove(expected_output)
+        assert os.path.exists(os.path.join(output_dir, "bc_a.md"))
+        assert os.path.exists(os.path.join(output_dir, "bc_b.md"))
 
     def test_cli_output_messages(self, examples_dir, output_dir, capsys):
         """Test CLI output messages"""
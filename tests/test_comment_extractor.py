@@ -0,0 +1,330 @@
+"""Tests for DOCX comment extraction"""
+
+import zipfile
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from s2doc.converters.domain_stories.cli import main as dst_main
+from s2doc.converters.domain_stories.comment_extractor import (
+    extract_comments_to_yaml,
+    extract_comments_from_many_to_yaml,
+)
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def heading(text):
+    """Heading 2 paragraph"""
+    return (f'<w:p><w:pPr><w:pStyle w:val="Heading2"/></w:pPr>'
+            f'<w:r><w:t>{text}</w:t></w:r></w:p>')
+
+
+def para(*runs):
+    """Body paragraph built from raw run/marker XML fragments"""
+    return "<w:p>" + "".join(runs) + "</w:p>"
+
+
+def run(text):
+    """Single text run"""
+    return f'<w:r><w:t xml:space="preserve">{text}</w:t></w:r>'
+
+
+def bookmark(name, bid):
+    """Bookmark start/end pair"""
+    return f'<w:bookmarkStart w:id="{bid}" w:name="{name}"/><w:bookmarkEnd w:id="{bid}"/>'
+
+
+def start(cid):
+    return f'<w:commentRangeStart w:id="{cid}"/>'
+
+
+def end(cid):
+    return (f'<w:commentRangeEnd w:id="{cid}"/>'
+            f'<w:r><w:commentReference w:id="{cid}"/></w:r>')
+
+
+def comment(cid, text, author="Alice", date="2025-10-26T12:00:00Z", parent=None):
+    """Comment part entry"""
+    parent_attr = f' w:parentId="{parent}"' if parent is not None else ""
+    return (f'<w:comment w:id="{cid}" w:author="{author}" w:date="{date}"{parent_attr}>'
+            f'<w:p><w:r><w:t>{text}</w:t></w:r></w:p></w:comment>')
+
+
+def write_docx(path, body, comments):
+    """Write a minimal DOCX containing only the parts the extractor reads"""
+    document = f'<w:document xmlns:w="{W}"><w:body>{body}</w:body></w:document>'
+    comments_xml = f'<w:comments xmlns:w="{W}">{comments}</w:comments>'
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("word/document.xml", document)
+        zf.writestr("word/comments.xml", comments_xml)
+    return path
+
+
+def extract(tmp_path, docx_path, **kwargs):
+    """Run the extractor and return the parsed YAML output"""
+    out = tmp_path / "comments.yaml"
+    extract_comments_to_yaml(docx_path, out, **kwargs)
+    with open(out) as f:
+        return yaml.safe_load(f)
+
+
+@pytest.fixture
+def reviewed_docx(tmp_path):
+    """Two stories, one identified by bookmark and one by inline Story ID"""
+    body = "".join([
+        heading("Account Enrollment"),
+        para(bookmark("dst_account_enrollment", 1)),
+        para(run("Intro paragraph.")),
+        para(run("The "), start(1), run("client admin"), end(1), run(" enrolls accounts.")),
+        heading("User Registration"),
+        para(run("Story ID: `dst_user_registration`")),
+        para(start(2), run("Users register themselves."), end(2)),
+    ])
+    comments = "".join([
+        comment(1, "Which admin?"),
+        comment(2, "Only after invitation", author="Bob"),
+        comment(3, "Agreed", author="Carol", parent=1),
+    ])
+    return write_docx(tmp_path / "reviewed.docx", body, comments)
+
+
+class TestCommentExtraction:
+    """Test comment extraction and story context mapping"""
+
+    def test_story_context_from_bookmark(self, tmp_path, reviewed_docx):
+        """Comment after a dst_ bookmark is mapped to that story"""
+        out = extract(tmp_path, reviewed_docx)
+        by_id = {c["comment_id"]: c for c in out["comments"]}
+
+        assert by_id[1]["story_id"] == "dst_account_enrollment"
+        assert by_id[1]["story_title"] == "Account Enrollment"
+        assert by_id[1]["context_before"] == "Intro paragraph."
+
+    def test_story_context_from_inline_story_id(self, tmp_path, reviewed_docx):
+        """Inline 'Story ID' paragraph overrides an earlier bookmark"""
+        out = extract(tmp_path, reviewed_docx)
+        by_id = {c["comment_id"]: c for c in out["comments"]}
+
+        assert by_id[2]["story_id"] == "dst_user_registration"
+        assert by_id[2]["story_title"] == "User Registration"
+        assert by_id[2]["author"] == "Bob"
+
+    def test_replies_grouped_under_parent(self, tmp_path, reviewed_docx):
+        """Replies are nested under their parent comment"""
+        out = extract(tmp_path, reviewed_docx)
+
+        assert [c["comment_id"] for c in out["comments"]] == [1, 2]
+        by_id = {c["comment_id"]: c for c in out["comments"]}
+        assert by_id[1]["replies"] == [
+            {"author": "Carol", "date": "2025-10-26T12:00:00Z", "text": "Agreed"}
+        ]
+
+    def test_comment_without_story(self, tmp_path):
+        """Comments before any story marker have no story ID"""
+        body = para(start(5), run("Preface"), end(5))
+        docx = write_docx(tmp_path / "plain.docx", body, comment(5, "Typo"))
+        out = extract(tmp_path, docx)
+
+        assert out["comments"][0]["story_id"] is None
+        assert out["comments"][0]["comment_text"] == "Typo"
+
+    def test_many_comments_share_single_pass(self, tmp_path):
+        """Story context stays correct across many stories and comments"""
+        parts = []
+        comments = []
+        for i in range(200):
+            parts.append(heading(f"Story {i}"))
+            parts.append(para(bookmark(f"dst_story_{i}", i)))
+            parts.append(para(start(i), run(f"text {i}"), end(i)))
+            comments.append(comment(i, f"note {i}"))
+        docx = write_docx(tmp_path / "big.docx", "".join(parts), "".join(comments))
+        out = extract(tmp_path, docx)
+
+        assert len(out["comments"]) == 200
+        for c in out["comments"]:
+            i = c["comment_id"]
+            assert c["story_id"] == f"dst_story_{i}"
+            assert c["story_title"] == f"Story {i}"
+
+    def test_inline_story_id_in_commented_paragraph(self, tmp_path):
+        """Story ID later in the same paragraph still applies to the comment"""
+        body = "".join([
+            heading("Payments"),
+            para(start(7), run("Review"), end(7), run(" Story ID: dst_payments")),
+        ])
+        docx = write_docx(tmp_path / "inline.docx", body, comment(7, "ok"))
+        out = extract(tmp_path, docx)
+
+        assert out["comments"][0]["story_id"] == "dst_payments"
+        assert out["comments"][0]["context_after"] == "Review Story ID: dst_payments"
+
+    def test_tracked_changes_in_selection(self, tmp_path):
+        """Inserted and deleted text is marked inside the selection"""
+        body = para(
+            start(9),
+            run("Pay "),
+            f'<w:ins w:id="20" w:author="Bob">{run("all ")}</w:ins>',
+            '<w:del w:id="21" w:author="Bob"><w:r><w:delText>some </w:delText></w:r></w:del>',
+            run("invoices"),
+            end(9),
+        )
+        docx = write_docx(tmp_path / "changes.docx", body, comment(9, "check"))
+        out = extract(tmp_path, docx)
+
+        assert out["comments"][0]["selection_text"] == "Pay [+all +][-some -]invoices"
+
+    def test_overlapping_ranges_sliced_from_offsets(self, tmp_path):
+        """Nested and overlapping ranges each get exactly their own text"""
+        body = "".join([
+            para(start(1), run("one "), start(2), run("two")),
+            para(run("three "), end(1), start(3), run("four"), end(2), end(3)),
+        ])
+        comments = comment(1, "a") + comment(2, "b") + comment(3, "c")
+        docx = write_docx(tmp_path / "overlap.docx", body, comments)
+        out = extract(tmp_path, docx)
+        by_id = {c["comment_id"]: c["selection_text"] for c in out["comments"]}
+
+        assert by_id == {1: "one two three", 2: "two three four", 3: "four"}
+
+
+class TestMultiDocumentExtraction:
+    """Test merged extraction from several reviewer copies"""
+
+    @pytest.fixture
+    def reviewer_copies(self, tmp_path):
+        """Two copies of the same document with one shared and one unique comment each"""
+        body = "".join([
+            heading("Account Enrollment"),
+            para(bookmark("dst_account_enrollment", 1)),
+            para(start(1), run("client admin"), end(1), run(" and "), start(2), run("accounts"), end(2)),
+        ])
+        copy_a = write_docx(tmp_path / "review-alice.docx", body,
+                            comment(1, "Which admin?") + comment(2, "Typo", author="Alice")
+                            + comment(3, "Yes", author="Dan", parent=1))
+        copy_b = write_docx(tmp_path / "review-bob.docx", body,
+                            comment(1, "Which admin?") + comment(2, "Rename", author="Bob")
+                            + comment(3, "No", author="Eve", parent=1))
+        return [copy_a, copy_b]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_identical_comments_deduplicated(self, tmp_path, reviewer_copies, workers):
+        """Shared comments appear once with every source file recorded"""
+        out_path = tmp_path / "merged.yaml"
+        extract_comments_from_many_to_yaml(reviewer_copies, out_path, workers=workers)
+        with open(out_path) as f:
+            out = yaml.safe_load(f)
+
+        assert out["documents"] == ["review-alice.docx", "review-bob.docx"]
+        assert len(out["comments"]) == 3
+
+        shared = [c for c in out["comments"] if c["comment_text"] == "Which admin?"][0]
+        assert shared["sources"] == ["review-alice.docx", "review-bob.docx"]
+        assert [r["text"] for r in shared["replies"]] == ["Yes", "No"]
+
+        unique = {c["comment_text"]: c["sources"] for c in out["comments"]}
+        assert unique["Typo"] == ["review-alice.docx"]
+        assert unique["Rename"] == ["review-bob.docx"]
+
+    def test_missing_document_raises(self, tmp_path, reviewer_copies):
+        """Missing inputs are reported before any work starts"""
+        with pytest.raises(FileNotFoundError):
+            extract_comments_from_many_to_yaml(
+                reviewer_copies + [tmp_path / "missing.docx"], tmp_path / "out.yaml"
+            )
+
+
+class TestIncrementalExtraction:
+    """Test extraction against a previous extraction state"""
+
+    BODY = "".join([
+        heading("Account Enrollment"),
+        para(bookmark("dst_account_enrollment", 1)),
+        para(start(1), run("client admin"), end(1), run(" and "), start(2), run("accounts"), end(2)),
+    ])
+
+    @pytest.fixture
+    def previous(self, tmp_path):
+        """Day one extraction with a single comment"""
+        docx = write_docx(tmp_path / "day1.docx", self.BODY, comment(1, "Which admin?"))
+        path = tmp_path / "day1.yaml"
+        extract_comments_to_yaml(docx, path)
+        return path
+
+    def test_only_new_and_changed_comments_written(self, tmp_path, previous):
+        """Unchanged comments are skipped, new replies mark the thread changed"""
+        docx = write_docx(tmp_path / "day2.docx", self.BODY,
+                          comment(1, "Which admin?") + comment(2, "Typo")
+                          + comment(3, "The client one", author="Bob", parent=1))
+        out = extract(tmp_path, docx, since_path=previous)
+
+        changes = {c["comment_id"]: c["change"] for c in out["comments"]}
+        assert changes == {1: "changed", 2: "new"}
+        by_id = {c["comment_id"]: c for c in out["comments"]}
+        assert by_id[2]["selection_text"] == "accounts"
+        assert by_id[2]["story_id"] == "dst_account_enrollment"
+
+    def test_full_output_marks_unchanged(self, tmp_path, previous):
+        """Full mode keeps unchanged comments from the previous state"""
+        docx = write_docx(tmp_path / "day2.docx", self.BODY,
+                          comment(1, "Which admin?") + comment(2, "Typo"))
+        out = extract(tmp_path, docx, since_path=previous, full=True)
+
+        by_id = {c["comment_id"]: c for c in out["comments"]}
+        assert by_id[1]["change"] == "unchanged"
+        assert by_id[1]["selection_text"] == "client admin"
+        assert by_id[2]["change"] == "new"
+
+    def test_no_changes_skips_document_body(self, tmp_path, previous):
+        """Document body is never read when every comment is already known"""
+        docx = tmp_path / "day2.docx"
+        with zipfile.ZipFile(docx, "w") as zf:
+            zf.writestr("word/document.xml", "not xml")
+            zf.writestr("word/comments.xml",
+                        f'<w:comments xmlns:w="{W}">{comment(1, "Which admin?")}</w:comments>')
+        out = extract(tmp_path, docx, since_path=previous)
+
+        assert out["comments"] == []
+
+    def test_removed_comments_reported(self, tmp_path, previous):
+        """Comments deleted since the previous extraction are listed"""
+        docx = write_docx(tmp_path / "day2.docx", self.BODY, comment(2, "Typo"))
+        out = extract(tmp_path, docx, since_path=previous)
+
+        assert out["removed_comment_ids"] == [1]
+
+    def test_delta_output_cannot_be_chained(self, tmp_path, previous):
+        """A delta output is marked and rejected as the next --since input"""
+        docx = write_docx(tmp_path / "day2.docx", self.BODY,
+                          comment(1, "Which admin?") + comment(2, "Typo"))
+        delta = tmp_path / "day2.yaml"
+        extract_comments_to_yaml(docx, delta, since_path=previous)
+
+        with open(delta) as f:
+            assert yaml.safe_load(f)["delta"] is True
+        with pytest.raises(ValueError):
+            extract_comments_to_yaml(docx, tmp_path / "day3.yaml", since_path=delta)
+
+    def test_full_output_can_be_chained(self, tmp_path, previous):
+        """Full output is a complete state for the next run"""
+        docx = write_docx(tmp_path / "day2.docx", self.BODY,
+                          comment(1, "Which admin?") + comment(2, "Typo"))
+        state = tmp_path / "day2.yaml"
+        extract_comments_to_yaml(docx, state, since_path=previous, full=True)
+
+        out = extract(tmp_path, docx, since_path=state)
+
+        assert "delta" not in yaml.safe_load(state.read_text())
+        assert out["comments"] == []
+        assert "removed_comment_ids" not in out
+
+    def test_full_requires_since(self, tmp_path):
+        """--full without --since is a usage error"""
+        docx = write_docx(tmp_path / "day1.docx", self.BODY, comment(1, "Which admin?"))
+        argv = ['dst', 'extract-comments', str(docx), str(tmp_path / "out.yaml"), '--full']
+
+        with patch('sys.argv', argv), pytest.raises(SystemExit) as exc_info:
+            dst_main()
+
+        assert exc_info.value.code == 2
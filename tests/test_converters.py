@@ -4,11 +4,16 @@ import pytest
 import yaml
 import tempfile
 import os
+import pickle
+import re
 from pathlib import Path
+from unittest.mock import patch
 
 from s2doc.converters.domain_stories import DomainStoryConverter
 from s2doc.converters.strategic import StrategicDDDConverter
-from s2doc.converters.tactical import TacticalDDDConverter
+from s2doc.converters.tactical import TacticalDDDConverter, convert_bounded_contexts
+from s2doc.converters.tactical.diagram_generator import AggregateUMLGenerator
+from s2doc.utils.cache import BuildCache
 
 
 class TestDomainStoriesConverter:
@@ -123,6 +128,158 @@ class TestStrategicDDDConverter:
         # Check for context mapping section
         assert "Context Mapping" in markdown or "Relationship" in markdown
 
+    def test_resolver_grouped_indexes(self, example_data):
+        """Test resolver groups interfaces, mappings and contexts once"""
+        resolver = StrategicDDDConverter(example_data).resolver
+        system = example_data['system']
+
+        for bff in system.get('bff_scopes', []):
+            expected = [i for i in system.get('bff_interfaces', []) if i.get('bff_scope_ref') == bff['id']]
+            assert resolver.get_interfaces_for_bff_scope(bff['id']) == expected
+
+        for bc in system.get('bounded_contexts', []):
+            mappings = system.get('context_mappings', [])
+            assert resolver.get_upstream_mappings(bc['id']) == [
+                m for m in mappings if m.get('upstream_context') == bc['id']]
+            assert resolver.get_downstream_mappings(bc['id']) == [
+                m for m in mappings if m.get('downstream_context') == bc['id']]
+
+        for domain in system['domains']:
+            expected = [m for m in system.get('context_mappings', [])
+                        if (resolver.get_context(m.get('upstream_context')) or {}).get('domain_ref') == domain['id']]
+            assert resolver.get_mappings_for_domain(domain['id']) == expected
+
+            contexts = set(domain.get('bounded_contexts', []))
+            assert resolver.get_mappings_touching(contexts) == [
+                m for m in system.get('context_mappings', [])
+                if m.get('upstream_context') in contexts or m.get('downstream_context') in contexts]
+
+    def test_mappings_touching_after_pickling(self, example_data):
+        """Test the resolver still finds mappings when shipped to a worker process"""
+        resolver = StrategicDDDConverter(example_data).resolver
+        copy = pickle.loads(pickle.dumps(resolver))
+
+        for domain in example_data['system']['domains']:
+            contexts = domain.get('bounded_contexts', [])
+            assert copy.get_mappings_touching(contexts) == resolver.get_mappings_touching(contexts)
+
+    def test_context_relationships_listed(self, example_data):
+        """Test bounded contexts list their upstream and downstream mappings"""
+        markdown = StrategicDDDConverter(example_data).convert_to_markdown()
+
+        assert "#### Context Relationships" in markdown
+        assert "- Upstream of [Payment Execution Context](#bc_payment_execution)" in markdown
+
+    def test_architecture_diagram_within_budget(self, example_data):
+        """Test a model within the node budget gets one architecture diagram"""
+        converter = StrategicDDDConverter(example_data)
+        diagram = converter._generate_architecture_diagram()
+
+        assert not converter.is_architecture_paginated()
+        assert diagram.count("```mermaid") == 1
+        assert "«Bounded Context»" in diagram
+
+    def test_architecture_diagram_paginated_over_budget(self, example_data):
+        """Test a model over the node budget gets a domain overview plus drill-downs"""
+        converter = StrategicDDDConverter(example_data, diagram_node_budget=5)
+        diagram = converter._generate_architecture_diagram()
+        domains = example_data['system']['domains']
+
+        assert converter.is_architecture_paginated()
+        assert diagram.count("```mermaid") == 1 + len(domains)
+
+        overview = diagram.split("```")[1]
+        assert "«Bounded Context»" not in overview
+        assert '-.->|"2 mappings"|' in overview
+
+        # Cross-domain mappings are collapsed onto a node for the other domain
+        assert '«Domain»<br/>Notification Services"]' in diagram
+
+    def test_split_output_drilldown_on_domain_page(self, example_data):
+        """Test paginated split output puts each drill-down on its domain page"""
+        converter = StrategicDDDConverter(example_data, diagram_node_budget=5)
+
+        overview = converter.generate_overview()
+        page = converter.generate_domain_page("dom_payment_scheduling", "system.md")
+
+        assert overview.count("```mermaid") == 1
+        assert "### Architecture" in page
+        assert "«Bounded Context»<br/>Payment Execution Context" in page
+
+    def test_split_output_files(self, example_data):
+        """Test split output writes an overview and one file per domain with cross-file links"""
+        converter = StrategicDDDConverter(example_data)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            written = converter.convert_to_files(tmpdir, "system.md", workers=1)
+
+            names = {path.name for path in written}
+            assert "system.md" in names
+            for domain in example_data['system']['domains']:
+                assert f"{domain['id']}.md" in names
+
+            overview = (Path(tmpdir) / "system.md").read_text(encoding='utf-8')
+            assert "(dom_payment_scheduling.md#dom_payment_scheduling)" in overview
+            assert '<a id="bc_payment_execution"></a>' not in overview
+
+            domain_page = (Path(tmpdir) / "dom_payment_scheduling.md").read_text(encoding='utf-8')
+            assert domain_page.startswith("[← ")
+            assert '<a id="bc_payment_execution"></a>' in domain_page
+            # Anchors defined in the same file stay local
+            assert "](#bc_payment_execution)" in domain_page
+
+    def test_split_output_skips_unchanged_domains(self, example_data):
+        """Test a second split run only rewrites domains whose subtree changed"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = BuildCache.for_output_dir(tmpdir)
+            StrategicDDDConverter(example_data).convert_to_files(tmpdir, "system.md", workers=1, cache=cache)
+            cache.save()
+
+            changed = yaml.safe_load(yaml.dump(example_data))
+            changed['system']['domains'][0]['description'] = "Changed description"
+
+            cache = BuildCache.for_output_dir(tmpdir)
+            written = StrategicDDDConverter(changed).convert_to_files(tmpdir, "system.md", workers=1, cache=cache)
+
+            assert {path.name for path in written} == {"system.md", f"{changed['system']['domains'][0]['id']}.md"}
+
+    def test_split_output_ignores_unrelated_anchor_changes(self, example_data):
+        """Test a new anchor no domain page links to only rewrites the overview"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = BuildCache.for_output_dir(tmpdir)
+            StrategicDDDConverter(example_data).convert_to_files(tmpdir, "system.md", workers=1, cache=cache)
+            cache.save()
+
+            changed = yaml.safe_load(yaml.dump(example_data))
+            changed['system'].setdefault('bff_scopes', []).append({'id': 'bff_new_channel', 'name': 'New Channel'})
+
+            cache = BuildCache.for_output_dir(tmpdir)
+            written = StrategicDDDConverter(changed).convert_to_files(tmpdir, "system.md", workers=1, cache=cache)
+
+            assert {path.name for path in written} == {"system.md"}
+
+    def test_split_output_builds_anchor_map_once(self, example_data):
+        """Test domain pages share one anchor map instead of rebuilding it per page"""
+        converter = StrategicDDDConverter(example_data)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(StrategicDDDConverter, 'build_anchor_map',
+                              wraps=converter.build_anchor_map) as build:
+                converter.convert_to_files(tmpdir, "system.md", workers=1)
+
+        assert build.call_count == 1
+
+    def test_linked_anchors_cover_domain_page_links(self, example_data):
+        """Test every cross-file link on a domain page is part of its cache hash"""
+        converter = StrategicDDDConverter(example_data)
+        anchor_map = converter.build_anchor_map("system.md")
+
+        for domain in example_data['system']['domains']:
+            page = converter.generate_domain_page(domain['id'], "system.md", anchor_map)
+            linked = converter._linked_anchors(converter._domain_subtree(domain['id']), anchor_map)
+            targets = set(re.findall(r'\]\([^)#]*#([^)\s]+)\)', page))
+            assert {t for t in targets if t in anchor_map} <= set(linked)
+
 
 class TestTacticalDDDConverter:
     """Test tactical DDD converter with real example"""
@@ -217,3 +374,117 @@ class TestTacticalDDDConverter:
         assert "## Domain Services" in markdown
         assert "## Aggregates" in markdown
         assert "## Repositories" in markdown
+
+    def test_multiple_bounded_contexts(self, example_data):
+        """Test a bounded_contexts list converts each context separately"""
+        second = dict(example_data['bounded_context'], id='bc_copy', name='Copy Context')
+        data = {'bounded_contexts': [example_data['bounded_context'], second]}
+
+        results = convert_bounded_contexts(data, workers=2)
+
+        assert [bc_id for bc_id, _ in results] == ['bc_payment_scheduling', 'bc_copy']
+        assert results[0][1] == TacticalDDDConverter(example_data).convert_to_markdown()
+        assert results[1][1].startswith("# Copy Context")
+
+    def test_duplicate_bounded_context_ids_rejected(self, example_data):
+        """Test two contexts with the same ID are an error"""
+        bc = example_data['bounded_context']
+
+        with pytest.raises(ValueError, match="more than once"):
+            convert_bounded_contexts({'bounded_contexts': [bc, bc]}, workers=1)
+
+    def test_resolver_reverse_indexes(self, example_data):
+        """Test resolver indexes who uses value objects, aggregates and events"""
+        resolver = TacticalDDDConverter(example_data).resolver
+
+        vo_owners = {u.owner_id for u in resolver.get_value_object_usages('vo_user_id')}
+        assert {'agg_payment_template', 'ent_payment_template'} <= vo_owners
+
+        usages = resolver.get_aggregate_usages('agg_payment_template')
+        assert ('svc_app_payment_template', 'submit_for_approval', 'loads') in usages
+        assert ('svc_app_payment_template', 'submit_for_approval', 'modifies') in usages
+
+        publishers = resolver.get_event_publishers('evt_payment_template_created')
+        assert ('svc_app_payment_template', 'create_template', 'publishes') in publishers
+        assert resolver.get_aggregates_for_entity('ent_payment_template') == ['agg_payment_template']
+
+    def test_used_by_sections(self, example_data):
+        """Test aggregates, value objects and events render backlinks"""
+        markdown = TacticalDDDConverter(example_data).convert_to_markdown()
+
+        assert ("- [Payment Template Application Service](#svc_app_payment_template)"
+                " · `submit_for_approval` (loads, modifies)") in markdown
+        assert "- Payment Template entity · `created_by` (attribute)" in markdown
+        assert "#### Published By" in markdown
+
+    def test_uml_class_blocks_memoized(self, example_data):
+        """Test shared entity and value object classes are rendered once per run"""
+        generator = TacticalDDDConverter(example_data).diagram_generator
+        aggregate = example_data['bounded_context']['aggregates'][0]
+
+        first = generator.generate_diagram(aggregate)
+        blocks = dict(generator._class_blocks)
+        assert ('root', aggregate['root_ref']) in blocks
+
+        generator.used_diagrams.clear()
+        assert generator._render_diagram(aggregate) == first
+        assert generator._class_blocks == blocks
+
+    def test_uml_diagrams_reused_across_runs(self, example_data, monkeypatch, tmp_path):
+        """Test unchanged aggregates come from the build cache on the next run"""
+        cache = BuildCache.for_output_dir(tmp_path)
+        first = convert_bounded_contexts(example_data, workers=1, cache=cache)
+        cache.save()
+
+        def fail(self, aggregate):
+            raise AssertionError(f"{aggregate['id']} re-rendered")
+
+        monkeypatch.setattr(AggregateUMLGenerator, '_render_diagram', fail)
+        cache = BuildCache.for_output_dir(tmp_path)
+        assert convert_bounded_contexts(example_data, workers=1, cache=cache) == first
+
+        # A changed value object invalidates the aggregates that use it
+        example_data['bounded_context']['value_objects'][0]['description'] = "Changed"
+        with pytest.raises(AssertionError, match="re-rendered"):
+            convert_bounded_contexts(example_data, workers=1, cache=BuildCache.for_output_dir(tmp_path))
+
+    def test_uml_diagram_key_includes_render_format(self, example_data, monkeypatch):
+        """Test bumping the render format invalidates cached diagrams"""
+        from s2doc.converters.tactical import diagram_generator
+
+        generator = TacticalDDDConverter(example_data).diagram_generator
+        aggregate = example_data['bounded_context']['aggregates'][0]
+        key = generator.diagram_key(aggregate)
+
+        monkeypatch.setattr(diagram_generator, 'DIAGRAM_FORMAT', diagram_generator.DIAGRAM_FORMAT + 1)
+        assert generator.diagram_key(aggregate) != key
+
+    def test_large_aggregate_diagram_split(self):
+        """Test aggregates over the UML budget get an overview plus detail diagrams"""
+        value_objects = [
+            {'id': f'vo_part_{i}', 'name': f'Part{i}',
+             'attributes': [{'name': 'a', 'type': 'String'}, {'name': 'b', 'type': 'String'}]}
+            for i in range(5)
+        ]
+        root = {'id': 'ent_root', 'name': 'Root',
+                'attributes': [{'name': f'part_{i}', 'type': 'String', 'value_object_ref': f'vo_part_{i}'}
+                               for i in range(5)]}
+        aggregate = {'id': 'agg_root', 'name': 'Root', 'root_ref': 'ent_root', 'entities': ['ent_root'],
+                     'value_objects': [vo['id'] for vo in value_objects]}
+        data = {'bounded_context': {'id': 'bc_x', 'name': 'X', 'entities': [root],
+                                    'value_objects': value_objects, 'aggregates': [aggregate]}}
+        resolver = TacticalDDDConverter(data).resolver
+
+        single = AggregateUMLGenerator(resolver).generate_diagram(aggregate)
+        assert single.count("```mermaid") == 1
+
+        split = AggregateUMLGenerator(resolver, node_budget=3, member_budget=100).generate_diagram(aggregate)
+        assert "#### Overview" in split
+        assert "#### Value Objects (1/3)" in split
+        overview = split.split("```")[1]
+        assert "+String a" not in overview
+        assert "Root --> Part4" in overview
+
+        # Each detail diagram stays within the node budget
+        for block in split.split("```mermaid")[3:]:
+            assert block.count("    class ") <= 3
@@ -365,3 +365,243 @@ class TestDiagramGenerator:
         assert "```mermaid" in diagram
         assert "graph LR" in diagram
         assert "```" in diagram
+
+
+class TestPipelineFlowCache:
+    """Test cached, class-styled pipeline flow diagrams"""
+
+    def test_flow_uses_class_defs(self, data_eng_data):
+        """Test stage and dataset nodes are styled through classDef instead of per-node styles"""
+        from s2doc.converters.data_eng.diagram_generator import DiagramGenerator
+
+        converter = DataEngConverter(data_eng_data)
+        diagram = DiagramGenerator().generate_pipeline_flow(converter.pipelines['pip-ingest-user-events'],
+                                                            converter.datasets)
+
+        assert "classDef stageStyle fill:#80ccff" in diagram
+        assert "class stg_consume_events,stg_parse_events stageStyle" in diagram
+        assert "class ds_user_events_raw,ds_user_events_parsed datasetStyle" in diagram
+        assert "    style " not in diagram
+
+    def test_cached_flow_reused(self, data_eng_data, tmp_path):
+        """Test an unchanged pipeline is served from the cache, and renaming a dataset invalidates it"""
+        from s2doc.converters.data_eng.diagram_generator import PIPELINE_FLOW_NAMESPACE, DiagramGenerator
+        from s2doc.utils.cache import BuildCache
+
+        converter = DataEngConverter(data_eng_data)
+        pipeline = converter.pipelines['pip-ingest-user-events']
+        cache = BuildCache(tmp_path / "cache.json")
+        diagram_gen = DiagramGenerator(cache)
+        key = diagram_gen.pipeline_flow_key(pipeline, converter.datasets)
+        cache.put(PIPELINE_FLOW_NAMESPACE, key, "cached")
+
+        assert diagram_gen.generate_pipeline_flow(pipeline, converter.datasets) == "cached"
+
+        renamed = dict(converter.datasets)
+        renamed['ds-user-events-raw'] = dict(renamed['ds-user-events-raw'], name="Raw Events")
+        assert diagram_gen.pipeline_flow_key(pipeline, renamed) != key
+
+    def test_flow_key_includes_render_format(self, data_eng_data, monkeypatch):
+        """Test bumping the render format invalidates cached flows"""
+        from s2doc.converters.data_eng import diagram_generator
+
+        converter = DataEngConverter(data_eng_data)
+        pipeline = converter.pipelines['pip-ingest-user-events']
+        key = diagram_generator.DiagramGenerator().pipeline_flow_key(pipeline, converter.datasets)
+
+        monkeypatch.setattr(diagram_generator, 'PIPELINE_FLOW_FORMAT', diagram_generator.PIPELINE_FLOW_FORMAT + 1)
+        assert diagram_generator.DiagramGenerator().pipeline_flow_key(pipeline, converter.datasets) != key
+
+    def test_cli_second_run_uses_cache(self, data_eng_example, tmp_path):
+        """Test a second run over unchanged input renders the same output without touching the cache"""
+        from s2doc.cli import main
+        from unittest.mock import patch
+
+        with patch('sys.argv', ['s2doc', str(data_eng_example), '-o', str(tmp_path), '--cache']):
+            main()
+        cache_file = tmp_path / ".s2doc-cache.json"
+        first_cache = cache_file.read_text()
+        first_output = (tmp_path / "data-eng.md").read_text()
+        assert "data_eng_pipeline_flow" in first_cache
+
+        with patch('sys.argv', ['s2doc', str(data_eng_example), '-o', str(tmp_path), '--cache']):
+            main()
+
+        assert cache_file.read_text() == first_cache
+        assert "classDef stageStyle" in (tmp_path / "data-eng.md").read_text()
+        assert first_output.count("```mermaid") == (tmp_path / "data-eng.md").read_text().count("```mermaid")
+
+
+class TestDatasetIndex:
+    """Test the dataset producer/consumer index"""
+
+    def test_index_producers_consumers_and_domains(self):
+        """Test one pass over stages indexes every reading and writing stage"""
+        from s2doc.converters.data_eng.models import DatasetIndex, StageRef
+
+        pipelines = {
+            'pip-a': {'id': 'pip-a', 'stages': [
+                {'id': 'stg-1', 'inputs': ['ds-raw'], 'outputs': ['ds-clean']},
+                {'id': 'stg-2', 'inputs': ['ds-clean', 'ds-raw'], 'outputs': ['ds-agg']},
+            ]},
+            'pip-b': {'id': 'pip-b', 'stages': [{'id': 'stg-3', 'inputs': ['ds-clean']}]},
+        }
+        domains = {'dom-x': {'id': 'dom-x', 'pipelines': ['pip-a']},
+                   'dom-y': {'id': 'dom-y', 'pipelines': ['pip-b']}}
+
+        index = DatasetIndex(domains, pipelines)
+
+        assert index.get_producers('ds-clean') == [StageRef('pip-a', 'stg-1')]
+        assert index.get_consumers('ds-clean') == [StageRef('pip-a', 'stg-2'), StageRef('pip-b', 'stg-3')]
+        assert index.get_producers('ds-raw') == []
+        assert index.get_domains('ds-clean') == ['dom-x', 'dom-y']
+        assert index.get_domain_datasets('dom-y') == ['ds-clean']
+        assert index.pipeline_inputs['pip-a'] == ['ds-raw', 'ds-clean']
+        assert index.most_referenced(2) == ['ds-clean', 'ds-raw']
+
+    def test_dataset_detail_lists_producers_and_consumers(self, data_eng_data):
+        """Test dataset sections link the stages producing and consuming them"""
+        converter = DataEngConverter(data_eng_data)
+        dataset = converter.datasets['ds-user-events-parsed']
+
+        detail = converter._generate_dataset_detail(dataset)
+
+        assert "#### Produced By" in detail
+        assert "- [Parse and Validate Events](#stg-parse-events) in [Ingest User Events Pipeline]" in detail
+        assert "#### Consumed By" in detail
+        assert "(#stg-recompute-features) in [Backfill Features Pipeline](#pip-backfill-features)" in detail
+        assert "**Domains**: [Feature Ingestion Domain](#dom-feature-ingestion)" in detail
+
+
+class TestOperationsIndex:
+    """Test the dataset-keyed index of operational metadata"""
+
+    def test_index_groups_by_dataset(self):
+        """Test every list is indexed by dataset, with SLOs attached via their linked check"""
+        from s2doc.converters.data_eng.models import OperationsIndex
+
+        index = OperationsIndex(
+            contracts=[{'id': 'ctr-a', 'dataset': 'ds-a'}],
+            checks=[{'id': 'chk-a', 'dataset': 'ds-a'}, {'id': 'chk-b', 'dataset': 'ds-b'}],
+            governance={'retention': [{'dataset': 'ds-b', 'policy': 'delete-after-days', 'days': 7}],
+                        'access': [{'dataset': 'ds-a', 'tier': 'general'}]},
+            observability={'metrics': [{'name': 'rows', 'dataset': 'ds-a'}, {'name': 'global'}],
+                           'slos': [{'name': 'fresh', 'linked_check': 'chk-b'}, {'name': 'orphan'}]}
+        )
+
+        ops_a = index.get('ds-a')
+        assert [c['id'] for c in ops_a.contracts] == ['ctr-a']
+        assert [c['id'] for c in ops_a.checks] == ['chk-a']
+        assert [m['name'] for m in ops_a.metrics] == ['rows']
+        assert index.get('ds-b').retention[0]['days'] == 7
+        assert [s['name'] for s in index.get('ds-b').slos] == ['fresh']
+        assert not index.get('ds-unknown')
+
+    def test_dataset_operational_profile(self, data_eng_data):
+        """Test dataset sections render their contracts, checks, SLOs and policies"""
+        converter = DataEngConverter(data_eng_data)
+
+        detail = converter._generate_dataset_detail(converter.datasets['ds-user-features-offline'])
+
+        assert "#### Operational Profile" in detail
+        assert "- **Contract**: [User Features Contract](#ctr-user-features-v1) v1.0.0" in detail
+        assert "- **Quality Check**: [Freshness Check - User Features](#chk-freshness-user-features)" in detail
+        assert "- **SLO**: feature-freshness-slo - 99.0 percent over 30d" in detail
+        assert "- **Retention**: archive-after-years (5 years)" in detail
+        assert "- **PII Masking**: `user_id` via pseudonymize" in detail
+
+
+class TestDataEngSplit:
+    """Test split output with one file per domain"""
+
+    def test_convert_to_files(self, data_eng_data, tmp_path):
+        """Test overview plus domain pages with owned datasets and cross-file links"""
+        converter = DataEngConverter(data_eng_data)
+
+        written = converter.convert_to_files(str(tmp_path), "platform.md", workers=1)
+
+        assert [p.name for p in written] == [
+            "platform.md", "dom-feature-ingestion.md",
+            "dom-feature-materialization.md", "dom-feature-serving.md"
+        ]
+        overview = (tmp_path / "platform.md").read_text()
+        ingestion = (tmp_path / "dom-feature-ingestion.md").read_text()
+
+        assert ingestion.startswith("[← ML Feature Store Platform](platform.md)")
+        assert '<a id="pip-ingest-user-events"></a>' in ingestion
+        assert '<a id="ds-user-events-raw"></a>' in ingestion
+        # Dataset details live with their owning domain only
+        assert '<a id="ds-user-events-raw"></a>' not in overview
+        assert "(dom-feature-ingestion.md#ds-user-events-raw)" in overview
+        # Links to datasets owned elsewhere point at the other domain page
+        assert "](dom-feature-materialization.md#" in ingestion
+
+    def test_owned_datasets_partition_all_datasets(self, data_eng_data):
+        """Test every dataset is owned by exactly one domain or by none"""
+        converter = DataEngConverter(data_eng_data)
+
+        owned = [ds_id for owner in [None, *converter.domains]
+                 for ds_id in converter.owned_datasets(owner)]
+
+        assert sorted(owned) == sorted(converter.datasets)
+
+    def test_cli_split(self, data_eng_example, tmp_path):
+        """Test --split writes one file per domain for data engineering models"""
+        from unittest.mock import patch
+        from s2doc.cli import main
+
+        with patch('sys.argv', ['s2doc', str(data_eng_example), '-o', str(tmp_path), '--split', '-j', '2']):
+            main()
+
+        assert (tmp_path / "data-eng.md").exists()
+        assert (tmp_path / "dom-feature-serving.md").exists()
+
+
+def wide_dataset_model(field_count):
+    fields = [{'name': f'col_{i}', 'type': 'string' if i % 2 else 'bigint'} for i in range(field_count)]
+    fields[7]['pii'] = True
+    return {
+        'system': {'id': 'sys', 'name': 'Events'},
+        'datasets': [{'id': 'ds-wide', 'name': 'Wide Events', 'schema': {'fields': fields}}]
+    }
+
+
+class TestWideSchemas:
+    """Test summarized rendering of schemas above the field budget"""
+
+    def test_narrow_schema_unchanged(self):
+        """Test schemas within the budget keep the plain table"""
+        converter = DataEngConverter(wide_dataset_model(10), schema_field_budget=10)
+
+        detail = converter._generate_dataset_detail(converter.datasets['ds-wide'])
+
+        assert "<details>" not in detail
+        assert detail.count("| `col_") == 10
+
+    def test_wide_schema_summary_and_pages(self):
+        """Test wide schemas get counts by type, PII fields first and collapsible pages"""
+        converter = DataEngConverter(wide_dataset_model(450), schema_field_budget=50)
+
+        detail = converter._generate_dataset_detail(converter.datasets['ds-wide'])
+
+        assert "**Fields**: 450 (1 PII)" in detail
+        assert "**Types**: bigint 225, string 225" in detail
+        assert detail.index("**PII Fields**") < detail.index("<details>")
+        assert detail.count("<details>") == 3
+        assert "<summary>Fields 401–450 of 450</summary>" in detail
+        # Every field once in the pages, plus the PII field in the summary
+        assert detail.count("| `col_") == 451
+
+    def test_schema_files(self, tmp_path):
+        """Test schema-file mode links to a separate per-dataset schema page"""
+        converter = DataEngConverter(wide_dataset_model(60), schema_field_budget=50, schema_files=True)
+
+        written = converter.convert_to_markdown(str(tmp_path / "events.md"))
+
+        assert written == [tmp_path / "events.md", tmp_path / "schemas" / "ds-wide.md"]
+        page = (tmp_path / "events.md").read_text()
+        schema_page = (tmp_path / "schemas" / "ds-wide.md").read_text()
+        assert "**Full Schema**: [60 fields](schemas/ds-wide.md)" in page
+        assert "<details>" not in page
+        assert schema_page.startswith("[← Wide Events](../events.md#ds-wide)")
+        assert schema_page.count("| `col_") == 60
@@ -53,6 +53,14 @@ class TestSchemaDetection:
         assert "bounded_context" in tactical_data
         assert "aggregates" in tactical_data["bounded_context"]
 
+    def test_detect_tactical_ddd_context_list(self, tactical_data):
+        """Test detection of a tactical model with a bounded_contexts list"""
+        data = {"bounded_contexts": [tactical_data["bounded_context"], {"id": "bc_x", "entities": []}]}
+        assert detect_schema_type(data) == SchemaType.TACTICAL_DDD
+
+        # Without tactical building blocks the list is not recognised
+        assert detect_schema_type({"bounded_contexts": [{"id": "bc_x"}]}) == SchemaType.UNKNOWN
+
     def test_schema_descriptions(self):
         """Test human-readable schema descriptions"""
         assert "Domain Stories" in get_schema_description(SchemaType.DOMAIN_STORIES)
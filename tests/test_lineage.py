@@ -0,0 +1,226 @@
+"""Tests for the dataset lineage graph"""
+
+from unittest.mock import patch
+
+import pytest
+
+from s2doc.cli import main
+from s2doc.converters.data_eng import DataEngConverter
+from s2doc.converters.data_eng.lineage import FieldLineage, FieldRef, LineageGraph, partition_lineage
+from s2doc.workspace import load_yaml_document
+
+
+@pytest.fixture
+def diamond():
+    """raw -> (clean, sample) -> features -> serving"""
+    return LineageGraph([
+        ('ds-raw', 'ds-clean'),
+        ('ds-raw', 'ds-sample'),
+        ('ds-clean', 'ds-features'),
+        ('ds-sample', 'ds-features'),
+        ('ds-features', 'ds-serving'),
+    ])
+
+
+class TestLineageGraph:
+    """Test closure, level and cycle queries"""
+
+    def test_transitive_closure(self, diamond):
+        """Test upstream and downstream queries are transitive and ordered by level"""
+        assert diamond.downstream_of('ds-raw') == ['ds-clean', 'ds-sample', 'ds-features', 'ds-serving']
+        assert diamond.upstream_of('ds-serving') == ['ds-raw', 'ds-clean', 'ds-sample', 'ds-features']
+        assert diamond.downstream_of('ds-serving') == []
+
+    def test_closure_is_memoized(self, diamond):
+        """Test repeated queries return the cached answer"""
+        assert diamond.downstream_of('ds-clean') is diamond.downstream_of('ds-clean')
+
+    def test_topological_levels(self, diamond):
+        """Test levels are longest paths from sources"""
+        assert diamond.topological_levels() == [
+            ['ds-raw'], ['ds-clean', 'ds-sample'], ['ds-features'], ['ds-serving']
+        ]
+        assert diamond.cycles() == []
+
+    def test_cycles(self):
+        """Test strongly connected components are reported as cycles and share a level"""
+        graph = LineageGraph([('a', 'b'), ('b', 'c'), ('c', 'b'), ('c', 'd'), ('e', 'e')])
+
+        assert sorted(sorted(cycle) for cycle in graph.cycles()) == [['b', 'c'], ['e']]
+        assert graph.level('b') == graph.level('c') == 1
+        assert graph.level('d') == 2
+        assert graph.downstream_of('b') == ['b', 'c', 'd']
+        assert graph.upstream_of('d') == ['a', 'b', 'c']
+
+    def test_long_chain(self):
+        """Test deep graphs are handled without recursion"""
+        graph = LineageGraph((f"ds-{i}", f"ds-{i + 1}") for i in range(5000))
+
+        assert len(graph.downstream_of('ds-0')) == 5000
+        assert graph.level('ds-5000') == 5000
+
+    def test_origins(self, diamond):
+        """Test origins are the source datasets feeding a dataset"""
+        graph = LineageGraph([('a', 'c'), ('b', 'c'), ('c', 'd'), ('e', 'e'), ('e', 'd')])
+
+        assert graph.origins_of('d') == ['a', 'b']
+        assert graph.origins_of('a') == []
+        assert diamond.origins_of('ds-serving') == ['ds-raw']
+
+
+def field_edge(up: str, down: str, transform: str = None) -> dict:
+    up_ds, up_field = up.split('.')
+    down_ds, down_field = down.split('.')
+    entry = {'upstream': {'dataset': up_ds, 'field': up_field},
+             'downstream': {'dataset': down_ds, 'field': down_field}}
+    if transform:
+        entry['transform'] = transform
+    return entry
+
+
+class TestFieldLineage:
+    """Test the field graph index"""
+
+    @pytest.fixture
+    def fields(self):
+        return FieldLineage([
+            field_edge('ds-raw.amount', 'ds-clean.amount', 'trf-cast'),
+            field_edge('ds-raw.currency', 'ds-clean.amount_eur', 'trf-convert'),
+            field_edge('ds-clean.amount', 'ds-clean.amount_eur', 'trf-convert'),
+            field_edge('ds-clean.amount_eur', 'ds-report.revenue'),
+        ])
+
+    def test_direct_sources(self, fields):
+        """Test each field's direct sources carry the transform of the edge"""
+        assert fields.sources(FieldRef('ds-clean', 'amount_eur')) == [
+            (FieldRef('ds-raw', 'currency'), 'trf-convert'),
+            (FieldRef('ds-clean', 'amount'), 'trf-convert'),
+        ]
+        assert fields.sources(FieldRef('ds-raw', 'amount')) == []
+        assert fields.derived_datasets == {'ds-clean', 'ds-report'}
+
+    def test_transitive_provenance(self, fields):
+        """Test provenance, origins and impact queries are transitive"""
+        revenue = FieldRef('ds-report', 'revenue')
+
+        assert [str(f) for f in fields.provenance(revenue)] == [
+            'ds-raw.amount', 'ds-raw.currency', 'ds-clean.amount', 'ds-clean.amount_eur'
+        ]
+        assert fields.origins(revenue) == [FieldRef('ds-raw', 'amount'), FieldRef('ds-raw', 'currency')]
+        assert fields.impact(FieldRef('ds-raw', 'currency')) == [FieldRef('ds-clean', 'amount_eur'), revenue]
+        assert fields.provenance(FieldRef('ds-x', 'missing')) == []
+
+    def test_incomplete_entries_ignored(self):
+        """Test entries without a dataset or field on both ends are skipped"""
+        fields = FieldLineage([{'upstream': {'dataset': 'ds-a'}, 'downstream': {'dataset': 'ds-b', 'field': 'x'}}])
+
+        assert not fields
+
+
+class TestLineagePartitions:
+    """Test splitting lineage into bounded-size diagrams"""
+
+    def test_small_components_are_packed(self):
+        """Test connected groups that fit the budget share a diagram"""
+        graph = LineageGraph([('a', 'b'), ('c', 'd'), ('e', 'f')])
+
+        partitions = partition_lineage(graph, lambda ds_id: None, budget=4)
+
+        assert [p.nodes for p in partitions] == [['a', 'b', 'c', 'd'], ['e', 'f']]
+
+    def test_large_component_split_by_domain(self):
+        """Test oversized groups are split by owning domain, then into chunks"""
+        graph = LineageGraph([('raw', 'clean'), ('clean', 'f1'), ('clean', 'f2'), ('clean', 'f3')])
+        owners = {'raw': 'dom-ingest', 'clean': 'dom-ingest'}
+
+        partitions = partition_lineage(graph, lambda ds_id: owners.get(ds_id, 'dom-features'), budget=2)
+
+        assert [(p.nodes, p.domains, p.part, p.parts) for p in partitions] == [
+            (['raw', 'clean'], ['dom-ingest'], 1, 1),
+            (['f1', 'f2'], ['dom-features'], 1, 2),
+            (['f3'], ['dom-features'], 2, 2),
+        ]
+
+    def test_partitioned_lineage_section(self, examples_dir):
+        """Test lineage above the node budget becomes several diagrams with stub nodes"""
+        data = load_yaml_document(examples_dir / "data-eng.yaml")
+        within = DataEngConverter(data)._generate_lineage_section()
+        split = DataEngConverter(data, diagram_node_budget=3)._generate_lineage_section()
+
+        assert within.count("```mermaid") == 1
+        assert "### Lineage 1:" not in within
+        assert split.count("```mermaid") > 1
+        assert "### Lineage 1: Feature Ingestion Domain" in split
+        assert '["↗ User Event Features Raw"]' in split
+        assert "stubStyle" in split
+        assert "### Lineage Edges" in split
+
+
+class TestLineageOutput:
+    """Test lineage in generated docs and the lineage command"""
+
+    def test_dataset_impact_section(self, examples_dir):
+        """Test dataset sections list transitive upstream and downstream datasets"""
+        converter = DataEngConverter(load_yaml_document(examples_dir / "data-eng.yaml"))
+
+        detail = converter._generate_dataset_detail(converter.datasets['ds-user-events-parsed'])
+
+        assert "#### Lineage Impact" in detail
+        assert "- **Upstream** (1): [User Events Raw](#ds-user-events-raw)" in detail
+        assert "- **Downstream** (4): " in detail
+
+    def test_lineage_command(self, examples_dir, capsys):
+        """Test s2doc lineage prints the transitive closure"""
+        with patch('sys.argv', ['s2doc', 'lineage', str(examples_dir / "data-eng.yaml"),
+                                'ds-user-events-raw', '--downstream']):
+            main()
+
+        downstream = capsys.readouterr().out.split()
+        assert downstream[0] == 'ds-user-events-parsed'
+        assert 'ds-user-features-online' in downstream
+
+    def test_field_provenance_in_schema_table(self, examples_dir):
+        """Test schema tables of derived datasets show direct sources and origins"""
+        converter = DataEngConverter(load_yaml_document(examples_dir / "data-eng.yaml"))
+
+        parsed = converter._generate_dataset_detail(converter.datasets['ds-user-events-parsed'])
+        online = converter._generate_dataset_detail(converter.datasets['ds-user-features-online'])
+
+        assert "| Description | Derived From |" in parsed
+        assert "| `user_id` | string | No | Yes | - | [User Events Raw](#ds-user-events-raw).`user_id` " \
+               "via `trf-parse-json` |" in parsed
+        assert "| `event_type` | string | No | No | - | - |" in parsed
+        assert "Origins: [User Events Raw](#ds-user-events-raw).`duration`" in online
+
+    def test_schema_file_provenance_links(self, tmp_path):
+        """Test provenance links in separate schema files point back at the documentation page"""
+        fields = [{'name': f'f{i}', 'type': 'string'} for i in range(3)]
+        converter = DataEngConverter({
+            'datasets': [{'id': 'ds-src', 'name': 'Source'}, {'id': 'ds-wide', 'schema': {'fields': fields}}],
+            'field_lineage': [field_edge('ds-src.f0', 'ds-wide.f0')],
+        }, schema_field_budget=2, schema_files=True)
+
+        converter.convert_to_markdown(str(tmp_path / "docs.md"))
+
+        schema_page = (tmp_path / "schemas" / "ds-wide.md").read_text()
+        assert "[Source](../docs.md#ds-src).`f0`" in schema_page
+
+    def test_field_lineage_command(self, examples_dir, capsys):
+        """Test s2doc lineage --field follows field lineage"""
+        with patch('sys.argv', ['s2doc', 'lineage', str(examples_dir / "data-eng.yaml"),
+                                'ds-user-features-online', '--field', 'session_duration_1h', '--upstream']):
+            main()
+
+        assert capsys.readouterr().out.split() == [
+            'ds-user-events-raw.duration',
+            'ds-user-events-parsed.duration',
+            'ds-user-event-features-raw.session_duration_1h',
+        ]
+
+    def test_lineage_command_unknown_dataset(self, examples_dir):
+        """Test unknown datasets are an error"""
+        with patch('sys.argv', ['s2doc', 'lineage', str(examples_dir / "data-eng.yaml"), 'ds-missing']):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 1
@@ -0,0 +1,139 @@
+"""Tests for referential integrity checks"""
+
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from s2doc.cli import main
+from s2doc.detector import SchemaType
+from s2doc.references import check_references, iter_path
+from s2doc.workspace import load_yaml_document
+
+
+def tactical_model():
+    return {
+        'bounded_context': {
+            'id': 'bc_test',
+            'name': 'Test',
+            'aggregates': [{'id': 'agg_order', 'root_ref': 'ent_order', 'value_objects': ['vo_money', 'vo_gone']}],
+            'entities': [{'id': 'ent_order', 'aggregate_ref': 'agg_order',
+                          'attributes': [{'name': 'total', 'value_object_ref': 'vo_money'}]}],
+            'value_objects': [{'id': 'vo_money'}],
+            'repositories': [{'id': 'repo_order', 'aggregate_ref': 'agg_missing'}],
+        }
+    }
+
+
+class TestReferenceChecker:
+    """Test the ID index and reference resolution"""
+
+    def test_iter_path_locations(self):
+        """Test wildcard patterns yield values in document order with their location"""
+        data = {'a': [{'b': ['x', 'y']}, {'c': 1}, {'b': ['z']}]}
+
+        assert list(iter_path(data, 'a.*.b.*')) == [
+            ('$.a[0].b[0]', 'x'), ('$.a[0].b[1]', 'y'), ('$.a[2].b[0]', 'z')
+        ]
+
+    def test_examples_are_consistent(self, examples_dir):
+        """Test the strategic, tactical and data engineering examples have no broken references"""
+        for name, schema_type in [("payments-strategic.yaml", SchemaType.STRATEGIC_DDD),
+                                  ("payments-tactical.yaml", SchemaType.TACTICAL_DDD),
+                                  ("data-eng.yaml", SchemaType.DATA_ENGINEERING)]:
+            data = load_yaml_document(examples_dir / name)
+            assert check_references(data, schema_type) == [], name
+
+    def test_broken_tactical_references(self):
+        """Test every broken reference is reported with its location"""
+        errors = [str(e) for e in check_references(tactical_model(), SchemaType.TACTICAL_DDD)]
+
+        assert errors == [
+            "$.bounded_context.aggregates[0].value_objects[1]: unknown value object 'vo_gone'",
+            "$.bounded_context.repositories[0].aggregate_ref: unknown aggregate 'agg_missing'",
+        ]
+
+    def test_multi_context_tactical(self):
+        """Test each context of a bounded_contexts list is indexed on its own"""
+        first = tactical_model()['bounded_context']
+        second = {'id': 'bc_other', 'aggregates': [{'id': 'agg_x', 'root_ref': 'ent_order'}]}
+
+        errors = [str(e) for e in check_references({'bounded_contexts': [first, second]},
+                                                   SchemaType.TACTICAL_DDD)]
+
+        assert "$.bounded_contexts[0].repositories[0].aggregate_ref: unknown aggregate 'agg_missing'" in errors
+        assert "$.bounded_contexts[1].aggregates[0].root_ref: unknown entity 'ent_order'" in errors
+
+    def test_external_counterparts_allowed(self):
+        """Test context mapping counterparts outside the bc_ namespace are not reported"""
+        data = {'system': {
+            'bounded_contexts': [{'id': 'bc_a'}],
+            'context_mappings': [
+                {'id': 'cm_1', 'upstream_context': 'bc_a', 'downstream_context': 'external_bank'},
+                {'id': 'cm_2', 'upstream_context': 'bc_a', 'downstream_context': 'bc_b'},
+            ]
+        }}
+
+        errors = [str(e) for e in check_references(data, SchemaType.STRATEGIC_DDD)]
+
+        assert errors == ["$.system.context_mappings[1].downstream_context: unknown bounded context 'bc_b'"]
+
+    def test_field_lineage_fields_exist(self):
+        """Test field lineage names fields declared in the dataset schema"""
+        data = {
+            'datasets': [
+                {'id': 'ds-raw', 'schema': {'fields': [{'name': 'user_id'}, {'name': 'ts'}]}},
+                {'id': 'ds-external', 'schema': {'$ref': 'schemas/external.avsc'}},
+            ],
+            'field_lineage': [
+                {'id': 'fln-ok', 'upstream': {'dataset': 'ds-raw', 'field': 'user_id'},
+                 'downstream': {'dataset': 'ds-external', 'field': 'anything'}},
+                {'id': 'fln-typo', 'upstream': {'dataset': 'ds-raw', 'field': 'userid'},
+                 'downstream': {'dataset': 'ds-gone', 'field': 'user_id'}},
+            ]
+        }
+
+        errors = [str(e) for e in check_references(data, SchemaType.DATA_ENGINEERING)]
+
+        assert errors == [
+            "$.field_lineage[1].downstream.dataset: unknown dataset 'ds-gone'",
+            "$.field_lineage[1].upstream.field: unknown dataset field 'ds-raw.userid'",
+        ]
+
+    def test_domain_story_ids_shared_across_stories(self):
+        """Test domain story references resolve against every story in the file"""
+        data = {'domain_stories': [
+            {'actors': [{'actor_id': 'act_admin'}]},
+            {'commands': [{'command_id': 'cmd_a', 'actor_ids': ['act_admin', 'act_ghost']}]},
+        ]}
+
+        errors = [str(e) for e in check_references(data, SchemaType.DOMAIN_STORIES)]
+
+        assert errors == ["$.domain_stories[1].commands[0].actor_ids[1]: unknown actor 'act_ghost'"]
+
+
+class TestStrictMode:
+    """Test the --strict pre-pass"""
+
+    def test_strict_blocks_conversion(self, tmp_path, capsys):
+        """Test --strict exits before writing anything when references are broken"""
+        input_file = tmp_path / "broken.yaml"
+        input_file.write_text(yaml.safe_dump(tactical_model()))
+        output_dir = tmp_path / "out"
+
+        with patch('sys.argv', ['s2doc', str(input_file), '-o', str(output_dir), '--strict']):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 1
+        err = capsys.readouterr().err
+        assert "2 broken reference(s)" in err
+        assert "$.bounded_context.repositories[0].aggregate_ref" in err
+        assert not list(output_dir.glob("*.md"))
+
+    def test_strict_passes_consistent_model(self, tactical_example, tmp_path):
+        """Test --strict converts a consistent model as usual"""
+        with patch('sys.argv', ['s2doc', str(tactical_example), '-o', str(tmp_path), '--strict']):
+            main()
+
+        assert (tmp_path / "bc_payment_scheduling.md").exists()
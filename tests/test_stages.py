@@ -0,0 +1,105 @@
+"""Tests for the compiled pipeline stage graph"""
+
+import pytest
+
+from s2doc.converters.data_eng import DataEngConverter
+from s2doc.converters.data_eng.stages import StageGraph
+from s2doc.workspace import load_yaml_document
+
+
+@pytest.fixture
+def fan_out():
+    """extract -> (clean, enrich) -> publish, declared out of order"""
+    return StageGraph([
+        {'id': 'stg-publish', 'depends_on': ['stg-clean', 'stg-enrich'], 'duration_minutes': 2},
+        {'id': 'stg-enrich', 'depends_on': ['stg-extract'], 'duration_minutes': 30},
+        {'id': 'stg-extract', 'duration_minutes': 10},
+        {'id': 'stg-clean', 'depends_on': ['stg-extract'], 'duration_minutes': 5},
+    ])
+
+
+class TestStageGraph:
+    """Test ordering, parallelism, critical path and cycle detection"""
+
+    def test_topological_order(self, fan_out):
+        """Test stages are ordered by level, then by YAML position"""
+        assert fan_out.order == ['stg-extract', 'stg-enrich', 'stg-clean', 'stg-publish']
+        assert fan_out.levels == [['stg-extract'], ['stg-enrich', 'stg-clean'], ['stg-publish']]
+
+    def test_parallelism(self, fan_out):
+        """Test the width of each level"""
+        assert fan_out.widths == [1, 2, 1]
+        assert fan_out.max_parallelism == 2
+
+    def test_critical_path(self, fan_out):
+        """Test the longest chain by declared duration"""
+        assert fan_out.critical_path() == ['stg-extract', 'stg-enrich', 'stg-publish']
+        assert fan_out.critical_path_minutes() == 42
+
+    def test_no_durations(self):
+        """Test the critical path is empty without declared durations"""
+        graph = StageGraph([{'id': 'stg-a'}, {'id': 'stg-b', 'depends_on': ['stg-a']}])
+
+        assert graph.critical_path() == []
+
+    def test_cycles_and_unreachable_stages(self):
+        """Test cycles are reported and stages waiting on them are unreachable"""
+        graph = StageGraph([
+            {'id': 'stg-a'},
+            {'id': 'stg-b', 'depends_on': ['stg-c']},
+            {'id': 'stg-c', 'depends_on': ['stg-b']},
+            {'id': 'stg-d', 'depends_on': ['stg-c'], 'duration_minutes': 5},
+        ])
+
+        assert graph.cycles == [['stg-b', 'stg-c']]
+        assert graph.unreachable == ['stg-b', 'stg-c', 'stg-d']
+        assert graph.critical_path() == []
+
+    def test_unknown_dependencies(self):
+        """Test dependencies on stages outside the pipeline are kept apart"""
+        graph = StageGraph([{'id': 'stg-a', 'depends_on': ['stg-gone']}])
+
+        assert graph.dependencies == {'stg-a': []}
+        assert graph.unknown_dependencies == {'stg-a': ['stg-gone']}
+        assert graph.levels == [['stg-a']]
+
+
+class TestExecutionPlan:
+    """Test pipeline sections render from the compiled graph"""
+
+    def test_example_pipeline_plan(self, examples_dir):
+        """Test the execution plan lists levels with their width"""
+        converter = DataEngConverter(load_yaml_document(examples_dir / "data-eng.yaml"))
+        pipeline = converter.pipelines['pip-ingest-user-events']
+
+        section = converter._generate_pipeline_section(pipeline, 'dom-feature-ingestion')
+
+        assert "##### Execution Plan" in section
+        assert "- **Max Parallelism**: 1" in section
+        assert "| 1 | 1 | [Parse and Validate Events](#stg-parse-events) |" in section
+        assert "**Level**: 1" in section
+
+    def test_stages_render_in_execution_order(self):
+        """Test stage sections and the flow diagram follow dependencies, not YAML order"""
+        converter = DataEngConverter({'pipelines': [{'id': 'pip-x', 'stages': [
+            {'id': 'stg-load', 'name': 'Load', 'depends_on': ['stg-extract'], 'duration_minutes': 3},
+            {'id': 'stg-extract', 'name': 'Extract', 'duration_minutes': 7},
+        ]}]})
+
+        section = converter._generate_pipeline_section(converter.pipelines['pip-x'], 'dom-x')
+
+        assert section.index("Stage: Extract") < section.index("Stage: Load")
+        assert section.index('stg_extract["Extract"]') < section.index('stg_load["Load"]')
+        assert "- **Critical Path**: 10 minutes ([Extract](#stg-extract) → [Load](#stg-load))" in section
+
+    def test_cycle_warning(self):
+        """Test cyclic dependencies are flagged and drawn as blocked"""
+        converter = DataEngConverter({'pipelines': [{'id': 'pip-x', 'stages': [
+            {'id': 'stg-a', 'name': 'A', 'depends_on': ['stg-b']},
+            {'id': 'stg-b', 'name': 'B', 'depends_on': ['stg-a']},
+        ]}]})
+
+        section = converter._generate_pipeline_section(converter.pipelines['pip-x'], 'dom-x')
+
+        assert "> **Warning**: Stage dependency cycle between [A](#stg-a), [B](#stg-b)" in section
+        assert "class stg_a,stg_b blockedStyle" in section
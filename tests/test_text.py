@@ -0,0 +1,74 @@
+"""Tests for the shared text utilities"""
+
+from s2doc.utils.text import (
+    escape_markdown,
+    humanize_identifier,
+    humanize_name,
+    humanize_snake_case,
+    wrap_lines,
+)
+
+
+class TestHumanize:
+    """Test name normalization"""
+
+    def test_humanize_name(self):
+        """Test case boundaries, acronyms and names that are already readable"""
+        assert humanize_name("WorkingDayCalculationService") == "Working Day Calculation Service"
+        assert humanize_name("XMLParser") == "XML Parser"
+        assert humanize_name("paymentTemplateId") == "payment Template Id"
+        assert humanize_name("Payment Template") == "Payment Template"
+        assert humanize_name("") == ""
+
+    def test_humanize_name_non_ascii(self):
+        """Test case boundaries between non-ASCII letters"""
+        assert humanize_name("CaféÉcole") == "Café École"
+        assert humanize_name("ÜberMaßstab") == "Über Maßstab"
+
+    def test_humanize_identifier(self):
+        """Test kebab-case is split and capitalized before case boundaries are"""
+        assert humanize_identifier("ml-feature-store") == "Ml Feature Store"
+        assert humanize_identifier("MLFeatureStore") == "ML Feature Store"
+
+    def test_humanize_snake_case(self):
+        """Test acronyms stay in capitals"""
+        assert humanize_snake_case("anti_corruption_layer") == "Anti Corruption Layer"
+        assert humanize_snake_case("acl") == "ACL"
+        assert humanize_snake_case("open_host_API") == "Open Host API"
+
+    def test_results_are_memoized(self):
+        """Test repeated names are served from the cache"""
+        humanize_identifier.cache_clear()
+        humanize_identifier("user-events")
+        humanize_identifier("user-events")
+
+        assert humanize_identifier.cache_info().hits == 1
+
+
+class TestTextFormatting:
+    """Test escaping and wrapping"""
+
+    def test_escape_markdown(self):
+        """Test pipes are escaped for table cells"""
+        assert escape_markdown("a | b") == "a \\| b"
+        assert escape_markdown(None) == ""
+
+    def test_wrap_lines(self):
+        """Test greedy wrapping at word boundaries"""
+        assert wrap_lines("Submit Payment Request", 20) == ("Submit Payment", "Request")
+        assert wrap_lines("Short", 20) == ("Short",)
+        assert wrap_lines("a verylongwordthatdoesnotfit b", 10) == ("a", "verylongwordthatdoesnotfit", "b")
+
+
+class TestModelReExports:
+    """Test the helpers stay importable from the converter models"""
+
+    def test_re_exports(self):
+        """Test the model modules expose the shared helpers"""
+        from s2doc.converters.strategic import models as strategic_models
+        from s2doc.converters.tactical import models as tactical_models
+
+        assert tactical_models.humanize_name is humanize_name
+        assert tactical_models.escape_markdown is escape_markdown
+        assert strategic_models.escape_markdown is escape_markdown
+        assert strategic_models.humanize_relationship_type("open_host_api") == "Open Host API"
@@ -0,0 +1,150 @@
+"""Tests for compiled JSON Schema validation"""
+
+import os
+import shutil
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from s2doc.cli import main
+from s2doc.detector import SchemaType
+from s2doc.validator import SchemaCompiler, SchemaValidator, get_validator, load_schema
+
+
+@pytest.fixture(autouse=True)
+def schema_cache(tmp_path, monkeypatch):
+    """Keep parsed schemas out of the user's cache directory"""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_dir))
+    return cache_dir
+
+
+def validate(schema, value):
+    errors = []
+    SchemaCompiler(schema).compile(schema)(value, "$", errors)
+    return [str(e) for e in errors]
+
+
+class TestSchemaCompiler:
+    """Test the supported JSON Schema keywords"""
+
+    def test_types_required_and_additional_properties(self):
+        """Test object keywords report precise paths"""
+        schema = {
+            'type': 'object',
+            'required': ['id'],
+            'additionalProperties': False,
+            'properties': {
+                'id': {'type': 'string', 'pattern': '^bc_'},
+                'size': {'type': 'integer', 'minimum': 1},
+                'tags': {'type': 'array', 'items': {'enum': ['a', 'b']}},
+            }
+        }
+
+        assert validate(schema, {'id': 'bc_x', 'size': 2, 'tags': ['a']}) == []
+        assert validate(schema, {'size': True, 'tags': ['a', 'c'], 'extra': 1}) == [
+            "$: missing required property 'id'",
+            "$.size: expected integer, got boolean",
+            '$.tags[1]: "c" is not one of "a", "b"',
+            "$: unexpected property 'extra'",
+        ]
+
+    def test_recursive_ref_and_one_of(self):
+        """Test local references (including recursive ones) and oneOf"""
+        schema = {
+            '$defs': {'Node': {'type': 'object', 'properties': {
+                'children': {'type': 'array', 'items': {'$ref': '#/$defs/Node'}},
+                'value': {'oneOf': [{'type': 'string'}, {'type': 'integer'}]},
+            }}},
+            '$ref': '#/$defs/Node'
+        }
+
+        assert validate(schema, {'children': [{'value': 1}, {'children': [{'value': 'x'}]}]}) == []
+        errors = validate(schema, {'children': [{'children': [{'value': 1.5}]}]})
+        assert errors[0] == "$.children[0].children[0].value: does not match any of the allowed alternatives"
+
+    def test_yaml_dates_are_strings(self):
+        """Test unquoted YAML dates satisfy string types"""
+        assert validate({'type': 'string'}, yaml.safe_load("2025-10-04")) == []
+
+    def test_unsupported_keywords_rejected(self):
+        """Test schemas the compiler cannot fully enforce fail to compile"""
+        with pytest.raises(ValueError, match="uniqueItems"):
+            validate({'type': 'array', 'items': {'uniqueItems': True}}, [])
+        with pytest.raises(ValueError, match="not"):
+            validate({'not': {'type': 'string'}}, 1)
+        with pytest.raises(ValueError, match="list of schemas"):
+            validate({'items': [{'type': 'string'}]}, ['a'])
+        with pytest.raises(ValueError, match="strnig"):
+            validate({'type': 'strnig'}, 'a')
+
+    def test_false_items(self):
+        """Test a false subschema accepts nothing"""
+        assert validate({'items': False}, [1]) == ["$[0]: no value is allowed here"]
+
+
+class TestSchemaValidation:
+    """Test validation of the example models"""
+
+    def test_valid_example(self, examples_dir):
+        """Test the data engineering example passes its schema"""
+        with open(examples_dir / "data-eng.yaml") as f:
+            document = list(yaml.safe_load_all(f))[-1]
+
+        assert get_validator(SchemaType.DATA_ENGINEERING).validate(document) == []
+
+    def test_invalid_example_paths(self, strategic_example):
+        """Test violations name the exact location"""
+        with open(strategic_example) as f:
+            document = yaml.safe_load(f)
+
+        errors = get_validator(SchemaType.STRATEGIC_DDD).validate(document)
+        assert [e.path for e in errors] == [
+            "$.system.context_mappings[3].downstream_context",
+            "$.system.context_mappings[4].downstream_context",
+        ]
+
+    def test_bundled_schemas_outside_checkout(self, project_root, tmp_path):
+        """Test the schemas resolve from the package alone, as after pip install"""
+        installed = tmp_path / "site-packages"
+        shutil.copytree(project_root / "s2doc", installed / "s2doc",
+                        ignore=shutil.ignore_patterns("__pycache__"))
+        script = (
+            "from s2doc.validator import SCHEMA_FILES, get_validator\n"
+            "for schema_type in SCHEMA_FILES:\n"
+            "    get_validator(schema_type)\n"
+            "import s2doc; print(s2doc.__file__)\n"
+        )
+
+        result = subprocess.run([sys.executable, "-c", script], cwd=tmp_path, capture_output=True, text=True,
+                                env={**os.environ, "PYTHONPATH": str(installed)})
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == str(installed / "s2doc" / "__init__.py")
+
+    def test_parsed_schema_cached_by_hash(self, schemas_dir, schema_cache):
+        """Test the parsed schema is stored on disk and reused"""
+        schema_path = schemas_dir / "tactical-ddd.schema.yaml"
+        schema = load_schema(schema_path)
+
+        cached = list((schema_cache / "s2doc" / "schemas").glob("*.json"))
+        assert len(cached) == 1
+
+        with patch("s2doc.validator.yaml.safe_load", side_effect=AssertionError("schema re-parsed")):
+            assert SchemaValidator(schema_path).schema == schema
+
+    def test_cli_validate(self, examples_dir, strategic_example, capsys):
+        """Test s2doc validate exit codes and messages"""
+        with patch('sys.argv', ['s2doc', 'validate', str(examples_dir / "data-eng.yaml")]):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+        assert exc_info.value.code == 0
+
+        with patch('sys.argv', ['s2doc', 'validate', str(strategic_example)]):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+        assert exc_info.value.code == 1
+        assert "$.system.context_mappings[3].downstream_context" in capsys.readouterr().err
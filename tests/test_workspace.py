@@ -0,0 +1,79 @@
+"""Tests for workspace mode (strategic model plus tactical files)"""
+
+import shutil
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from s2doc.cli import main
+from s2doc.workspace import Workspace
+
+
+@pytest.fixture
+def tactical_dir(tmp_path, tactical_example):
+    """Directory with the tactical example and a second, undeclared context"""
+    directory = tmp_path / "tactical"
+    directory.mkdir()
+    shutil.copy(tactical_example, directory / "payments-tactical.yaml")
+
+    extra = {'bounded_context': {'id': 'bc_unplanned', 'name': 'Unplanned Context',
+                                 'domain_ref': 'dom_payment_scheduling', 'description': 'Not in strategy',
+                                 'aggregates': []}}
+    (directory / "unplanned.yaml").write_text(yaml.dump(extra), encoding='utf-8')
+    (directory / "notes.yml").write_text("title: not a model\n", encoding='utf-8')
+    return directory
+
+
+class TestWorkspace:
+    """Test loading and converting a workspace"""
+
+    def test_symbol_table_joins_both_views(self, strategic_example, tactical_dir):
+        """Test contexts are keyed by ID with strategic and tactical data joined"""
+        workspace = Workspace.load(strategic_example, tactical_dir, workers=1)
+
+        symbol = workspace.contexts['bc_payment_scheduling']
+        assert symbol.strategic
+        assert symbol.tactical_file == "bc_payment_scheduling.md"
+        assert symbol.domain_name == "Payment Scheduling"
+
+        assert workspace.unplaced_contexts == ['bc_unplanned']
+        assert 'bc_payment_execution' in workspace.undesigned_contexts
+        assert workspace.skipped == [str(tactical_dir / "notes.yml")]
+
+    def test_cross_document_links(self, strategic_example, tactical_dir, tmp_path):
+        """Test strategic and tactical documents link to each other"""
+        workspace = Workspace.load(strategic_example, tactical_dir, workers=1)
+        output = tmp_path / "docs"
+        output.mkdir()
+
+        written = workspace.convert(output, workers=1)
+        assert [p.name for p in written] == [
+            "payments-strategic.md", "bc_payment_scheduling.md", "bc_unplanned.md"]
+
+        strategic = (output / "payments-strategic.md").read_text(encoding='utf-8')
+        assert "**Tactical Design**: [Payment Scheduling Context](bc_payment_scheduling.md)" in strategic
+
+        tactical = (output / "bc_payment_scheduling.md").read_text(encoding='utf-8')
+        assert "[Payment Scheduling](payments-strategic.md#dom_payment_scheduling)" in tactical
+        assert "(payments-strategic.md#bc_payment_scheduling)" in tactical
+        # Links to the document's own entities stay local
+        assert "](#agg_payment_template)" in tactical
+
+    def test_duplicate_context_rejected(self, strategic_example, tactical_dir, tactical_example):
+        """Test two tactical files for one context are an error"""
+        shutil.copy(tactical_example, tactical_dir / "copy.yaml")
+
+        with pytest.raises(ValueError, match="bc_payment_scheduling"):
+            Workspace.load(strategic_example, tactical_dir, workers=1)
+
+    def test_cli_workspace_command(self, strategic_example, tactical_dir, tmp_path):
+        """Test s2doc workspace writes all documents"""
+        output = tmp_path / "out"
+        argv = ['s2doc', 'workspace', str(strategic_example), str(tactical_dir), '-o', str(output), '-j', '1']
+
+        with patch('sys.argv', argv):
+            main()
+
+        assert (output / "payments-strategic.md").exists()
+        assert (output / "bc_payment_scheduling.md").exists()